@@ -1,24 +1,35 @@
 import pprint
+import reprlib
 import queue
+import collections
 import sys
 import os
-import inspect
 import re
 import traceback
 import logging
 import threading
-from datetime import datetime
+from datetime import datetime, timedelta
 import typing
+import types
 import zipfile
 import time
-import atexit
+import math
 import psutil
 import multiprocessing
 from DToolslib import EventSignal
 from DToolslib.Color_Text import *
-from ._LogEnum import LogLevel, LogHighlightType, _ColorMap, _Log_Default, _LogMessageItem
+from ._LogEnum import LogLevel, LogHighlightType, LogRenderType, _ColorMap, _Log_Default, _LogMessageItem
+from ._Log_Sink import (_ChunkedText, _RENDER_BITS, _RENDER_ALL, JFLogSink, ConsoleSink, SignalSink, BatchedSignalSink,
+                        _CallbackSink)
 from ._Logging_Listener import _LoggingListener
 from ._Compressed_Thread import _CompressThread
+from ._Process_Manager import _ProcessManager
+from ._Log_Registry import _LoggerRegistry
+from ._Log_Profiler import JFLogProfiler
+from ._Log_Redactor import JFLogRedactor
+from ._Log_Columnar import JFLogColumnarArchive
+from ._Log_Backlog import compress_backlog
+from ._Log_Search import search_logs
 
 try:
     from PyQt5.QtCore import QThread
@@ -38,20 +49,150 @@ if QThread is None:
         QThread = None
 
 
+_SELF_PACKAGE_NAME = __name__.rpartition('.')[0]
+_LEVEL_METHODS = (
+    ('trace', LogLevel.TRACE),
+    ('debug', LogLevel.DEBUG),
+    ('info', LogLevel.INFO),
+    ('warning', LogLevel.WARNING),
+    ('error', LogLevel.ERROR),
+    ('critical', LogLevel.CRITICAL),
+)
+_LIMITED_SUFFIXES = ('', '_once', '_every', '_every_seconds')
+_process_name_cache: dict = {}
+_FORMAT_FIELD_PATTERN = re.compile(r'%\((.*?)\)(\.\d+)?([sdfxXobeEgGc%])')
+_scratch_local = threading.local()
+
+
 def _get_current_process_name() -> str:
     """
     This function returns the name of the current process.
+
+    The name is cached per process id, so that `psutil` is only queried once per process.
+    """
+    pid_int = os.getpid()
+    process_name = _process_name_cache.get(pid_int, None)
+    if process_name is not None:
+        return process_name
+    process_name = _format_process_name(pid_int, multiprocessing.current_process().name)
+    _process_name_cache.clear()
+    _process_name_cache[pid_int] = process_name
+    return process_name
+
+
+def _format_process_name(pid_int: typing.Optional[int], python_process_name: str) -> str:
+    """
+    This function returns the process name in the form `<executable>(<python process name>)`.
+
+    If the executable cannot be queried, e.g. the process has exited, only the python process name is returned.
     """
-    python_process_name = multiprocessing.current_process().name
+    if pid_int is None:
+        return python_process_name
     try:
-        pid_int = os.getpid()
-        process_obj = psutil.Process(pid_int)
-        exe_name = process_obj.name()
-        return f'{exe_name}({python_process_name})'
+        return f'{psutil.Process(pid_int).name()}({python_process_name})'
     except:
         return python_process_name
 
 
+def _caller_info_from_frame(frame) -> dict:
+    """
+    This function builds the caller information of a frame without walking the stack.
+
+    The class name is taken from the qualified name of the code, so the frame locals are not read.
+    """
+    code = frame.f_code
+    script_path = code.co_filename
+    script_name = os.path.basename(script_path)
+    class_name = code.co_qualname.rpartition('.')[0]
+    return {
+        'caller_name': code.co_name,
+        'class_name' : class_name if class_name and '<locals>' not in class_name else '<module>',
+        'line_num'   : frame.f_lineno,
+        'module_name': os.path.splitext(script_name)[0],
+        'script_name': script_name,
+        'script_path': script_path,
+    }
+
+
+def _code_has_owner(code) -> bool:
+    """ This function checks whether the code object has a `self` or `cls` variable, without reading the frame locals. """
+    for names in (code.co_varnames, code.co_cellvars, code.co_freevars):
+        if 'self' in names or 'cls' in names:
+            return True
+    return False
+
+
+def _parse_format_fields(message_format: str) -> tuple:
+    """ This function returns the field names used in the message format, in order and without duplicates. """
+    return tuple(dict.fromkeys(match[0] for match in _FORMAT_FIELD_PATTERN.findall(message_format)))
+
+
+def _acquire_scratch() -> tuple:
+    """
+    This function returns the field dicts (plain, console, color) to render a record on the current thread.
+
+    The dicts are taken from a free list of the thread, so a nested record, e.g. logged by `__str__`
+    of a message parameter, gets its own dicts.
+    """
+    free_list = getattr(_scratch_local, 'free_list', None)
+    if free_list:
+        return free_list.pop()
+    return {}, {}, {}
+
+
+def _release_scratch(scratch: tuple) -> None:
+    for field_dict in scratch:
+        field_dict.clear()
+    free_list = getattr(_scratch_local, 'free_list', None)
+    if free_list is None:
+        free_list = _scratch_local.free_list = []
+    free_list.append(scratch)
+
+
+def _noop_log(*args, **kwargs) -> None:
+    """ This function replaces the log methods of the disabled levels. """
+    return None
+
+
+def _resolve_lazy_args(args: tuple) -> tuple:
+    """
+    This function renders lazy message parameters, it is only called after the record passed the level filter.
+
+    Function and lambda parameters are called without arguments, other callables, e.g. classes and bound methods,
+    are kept as data.
+    If the first parameter is a str template with `%` and there are more parameters, they are applied to the template.
+    If the template does not fit the parameters, the parameters are joined as without `lazy`, so logging never raises.
+    """
+    args = tuple(arg() if isinstance(arg, types.FunctionType) else arg for arg in args)
+    if len(args) > 1 and isinstance(args[0], str) and '%' in args[0]:
+        try:
+            return (args[0] % args[1:],)
+        except (TypeError, ValueError, KeyError):
+            return args
+    return args
+
+
+def _next_rollover_deadline(now: float, enableDailySplit: bool, interval_seconds: int = 0) -> float:
+    """
+    This function returns the epoch time of the next rollover after `now`.
+
+    The daily split rolls over at the next local midnight, the time interval is aligned to the local midnight.
+    If no rollover is enabled, `math.inf` is returned.
+    """
+    deadline = math.inf
+    if not enableDailySplit and interval_seconds <= 0:
+        return deadline
+    midnight = datetime.fromtimestamp(now).replace(hour=0, minute=0, second=0, microsecond=0)
+    next_midnight = (midnight + timedelta(days=1)).timestamp()
+    if enableDailySplit:
+        deadline = next_midnight
+    if interval_seconds > 0:
+        midnight_ts = midnight.timestamp()
+        interval_deadline = midnight_ts + ((now - midnight_ts) // interval_seconds + 1) * interval_seconds
+        deadline = min(deadline, interval_deadline, next_midnight)
+    return deadline
+
+
 class JFLogger(object):
     """
     The main class of the logger.
@@ -76,16 +217,24 @@ class JFLogger(object):
             - level_str(str): `LogLevel.TRACE`, `LogLevel.DEBUG`, `LogLevel.INFO`, `LogLevel.WARNING`, `LogLevel.ERROR`, `LogLevel.CRITICAL`
             - message(str)
 
+        - signal_format_batch, signal_colorized_batch, signal_message_batch: The same records in batches,
+            emitted by a thread of the logger at most 30 times per second by default, see `set_signal_batching`.
+            Use them for GUI widgets, the logging thread never waits for the slots.
+
+        parameter of slot function:
+            - records(list): [(level, message), ...]
+
     - Attributes:
         - name: The name of the log
         - root_dir: The root directory of the log file
         - log_dir: The directory of the log file
         - current_log_file_path: The current log file path
-        - zip_file_path: The zip file path
+        - zip_file_path: The zip file path, the backlog compression writes `<name>--Compressed-<n>.zip` beside it
         - enableConsoleOutput: Whether to enable console output
         - enableFileOutput: Whether to enable file output
         - enableDailySplit: Whether to enable daily split
         - enableRuntimeZip: Whether to enable runtime zip
+        - enableColumnarArchive: Whether to convert the rotated log files into columnar archives
         - isStrictLimit: Whether to enable strict limit. If True, the log file will be deleted when the limit is reached, If false, the log file will be deleted by the startup time
         - enableQThreadtracking: Whether to enable QThread tracking
         - log_level: The log level
@@ -97,6 +246,12 @@ class JFLogger(object):
         - exclude_functions: The functions to exclude from logging
         - exclude_classes: The classes to exclude from logging
         - exclude_modules: The modules to exclude from logging
+        - profiler: The `JFLogProfiler` collecting the stage timings, None if it is disabled
+        - stacklevel: The default stacklevel of the log calls, None if the caller is found by the stack walk
+        - redactor: The `JFLogRedactor` applied to the messages, None if the redaction is disabled
+        - sinks: The sinks receiving the records, including the file output, console output and signals
+        - file_sink: The sink of the file output
+        - console_sink: The sink of the console output
 
     - methods:
         - trace(*message): Output trace information, support multiple parameters
@@ -106,6 +261,15 @@ class JFLogger(object):
         - error(*message): Output error information, support multiple parameters
         - critical(*message): Output critical information, support multiple parameters
         - exception(*message, level=LogLevel.ERROR): Output exception information, support multiple parameters
+        - <level>_once(*message): Output the record only at the first call from the call site, e.g. `info_once`
+        - <level>_every(n, *message): Output the record at the 1st, (n+1)-th, ... call from the call site
+        - <level>_every_seconds(seconds, *message): Output the record at most once in the seconds from the call site
+        - bind(**context): Return a `JFLoggerAdapter` view holding the given context fields
+        - get(name): Class method, return the living logger with the name, or a child logger of its dotted prefix
+        - get_child(suffix): Return the child logger `<name>.<suffix>`, which writes through the sinks of this logger
+        - add_sink(sink): Add a sink, e.g. `FileSink`, `ConsoleSink` or a subclass of `JFLogSink`
+        - remove_sink(sink): Remove a sink
+        - search(pattern, since, until, levels): Search the records of the log files and the archives of this logger
         - set_listen_logging(logger_name, level): Set the level of the logger to be monitored
         - remove_listen_logging(): Remove the monitored logger
         - set_exclude_funcs(funcs_list): Set the functions to be excluded
@@ -121,17 +285,31 @@ class JFLogger(object):
         - set_root_folder_name(root_folder_name): Set the root folder name
         - set_log_folder_name(log_folder_name): Set the log folder name
         - set_level(log_level): Set the log level
+        - set_level_for(name, log_level): Set the log level for a module, class or function
+        - isEnabledFor(level): Check whether a record of the level would be output
+        - remove_level_for(name): Remove the log level override
         - set_enable_daily_split(enable): Set whether to enable daily splitting
+        - set_rotation_interval_minutes(minutes): Set the time interval to split log files
+        - set_file_record_limit(record_limit): Set the record count limit of a single log file
         - set_enable_console_output(enable): Set whether to enable console output
         - set_enable_file_output(enable): Set whether to enable file output
         - set_enable_runtime_zip(enable): Set whether to enable runtime compression
         - set_enable_startup_zip(enable): Set whether to enable startup compression
+        - set_enable_columnar_archive(enable): Set whether to convert the rotated log files into columnar archives
+        - set_backlog_compression(threshold, max_workers, niceness): Set the parallel compression of waiting rotated files
+        - set_signal_batching(max_rate, max_pending): Set the emit rate and buffer size of the batch signals
         - set_file_size_limit_kB(size_limit): Set the file size limit in KB
         - set_file_count_limit(count_limit): Set the file count limit
         - set_file_days_limit(days_limit): Set the file days limit
         - set_message_format(message_format): Set the message format
         - set_highlight_type(highlight_type): Set the highlight type
         - set_enable_QThread_tracking(enable): Set whether to enable QThread tracking
+        - set_enable_exception_dedup(enable, repeat_every): Set whether to deduplicate repeated exceptions
+        - set_message_truncation(max_chars, max_depth, max_items, marker): Set the size limits of the message parameters
+        - set_message_chunk_size(chunk_size): Set the chunk size to write huge messages
+        - set_profiler(enable, sample_rate, callback): Set whether to time the stages of sampled records
+        - set_stacklevel(stacklevel): Set the default stacklevel to take the caller frame directly
+        - set_redaction(keys, patterns, replacement): Set the secrets to be redacted from the messages
 
     Example:
     1. Usually call:
@@ -166,13 +344,38 @@ class JFLogger(object):
     logger.debug('debug message')
 
     You will get: `2025-01-01 06:30:00-INFO -debug message -True`
+
+    3. Per-call fields:
+
+    - All log methods accept `extra`, a mapping of fields for this record only.
+      The precedence is: `extra` > context of `bind()` > parameters of the initialization.
+      If `moduleName` and `functionName` are given in `extra`, the caller will not be searched in the stack.
+
+    logger.error('failed', extra={'moduleName': 'worker', 'functionName': 'run'})
+
+    4. Lazy messages:
+
+    - With `lazy=True`, function and lambda parameters and `%`-style templates are only rendered if the level is enabled.
+      Other callables, e.g. classes and bound methods, are logged as data. A template which does not fit
+      the parameters is not applied, the parameters are then joined as usual.
+      The methods of disabled levels are replaced with no-op, so a disabled call costs almost nothing.
+
+    logger.debug('state: %s', lambda: expensive_repr(obj), lazy=True)
+
+    5. Caller lookup:
+
+    - All log methods accept `stacklevel`, the caller frame is then taken directly by its depth,
+      1 is the caller of the log method. Without it, the stack is walked with the exclusion rules.
+
+    def log_state(state):
+        logger.info('state', state, stacklevel=2)
     """
     signal_format = EventSignal(int, str)
     signal_colorized = EventSignal(int, str)
     signal_message = EventSignal(int, str)
-    __instance_list__ = []
-    __logger_name_list__ = []
-    __log_folder_name_list__ = []
+    signal_format_batch = EventSignal(list)
+    signal_colorized_batch = EventSignal(list)
+    signal_message_batch = EventSignal(list)
 
     @property
     def name(self) -> str:
@@ -210,6 +413,10 @@ class JFLogger(object):
     def enableRuntimeZip(self) -> bool:
         return self.__enableRuntimeZip
 
+    @property
+    def enableColumnarArchive(self) -> bool:
+        return self.__enableColumnarArchive
+
     @property
     def enableTracebackException(self) -> bool:
         return self.__enableTracebackException
@@ -258,13 +465,35 @@ class JFLogger(object):
     def exclude_modules(self) -> list:
         return list(self.__exclude_modules)
 
+    @property
+    def profiler(self) -> typing.Optional[JFLogProfiler]:
+        return self.__profiler
+
+    @property
+    def stacklevel(self) -> typing.Optional[int]:
+        return self.__stacklevel
+
+    @property
+    def redactor(self) -> typing.Optional[JFLogRedactor]:
+        return self.__redactor
+
+    @property
+    def sinks(self) -> tuple:
+        return self.__sinks
+
+    @property
+    def file_sink(self) -> JFLogSink:
+        return self.__file_sink
+
+    @property
+    def console_sink(self) -> JFLogSink:
+        return self.__console_sink
+
     def __new__(cls, log_name, *args, **kwargs):
         instance = super().__new__(cls)
-        if log_name in cls.__logger_name_list__:
+        if not _LoggerRegistry.register_name(log_name, instance):
             error_text = ansi_color_text(f'JFLogger "{log_name}" already exists.', 33)
             raise ValueError(error_text)
-        cls.__logger_name_list__.append(log_name)
-        cls.__instance_list__.append(instance)
         return instance
 
     def __init__(
@@ -309,44 +538,47 @@ class JFLogger(object):
         self.__log_folder_name = log_folder_name if isinstance(log_folder_name,
                                                                str) and log_folder_name else self.__log_name
         self.__log_dir = os.path.join(self.__root_path, self.__log_folder_name)
-        if self.__log_folder_name in self.__class__.__log_folder_name_list__:
+        if not _LoggerRegistry.register_folder(self.__log_folder_name, self):
+            _LoggerRegistry.unregister_name(self.__log_name, self)
             error_text = ansi_color_text(f'<ERROR> Log folder name "{self.__log_folder_name}" is already in use.', 33)
             raise ValueError(error_text)
-        self.__class__.__log_folder_name_list__.append(self.__log_folder_name)
         self.__log_level: LogLevel = LogLevel._normalize_log_level(log_level)
+        self.__level_overrides: dict = {}
+        self.__level_cache: dict = {}
+        self.__min_enabled_level: int = self.__log_level
         self.__enableConsoleOutput: bool = enableConsoleOutput if isinstance(enableConsoleOutput, bool) else True
         self.__enableFileOutput: bool = enableFileOutput if isinstance(enableFileOutput, bool) else True
         self.__enableQThreadtracking: bool = False
         self.__enableContinueWithLastFile: bool = False
         self.__enableTracebackException: bool = False
+        self.__enableExceptionDedup: bool = False
+        self.__exception_repeat_every: int = 0
+        self.__exception_cache: dict = {}
+        self.__exception_cache_lock = threading.Lock()
+        self.__call_site_lock = threading.Lock()
+        self.__call_site_once: set = set()
+        self.__call_site_counts: dict = {}
+        self.__call_site_times: dict = {}
+        self.__truncate_max_chars: int = -1
+        self.__truncate_max_depth: int = -1
+        self.__truncate_max_items: int = -1
+        self.__truncation_marker: str = _Log_Default.TRUNCATION_MARKER
+        self.__message_chunk_size: int = _Log_Default.MESSAGE_CHUNK_SIZE
+        self.__repr_limiter: typing.Optional[reprlib.Repr] = None
+        self.__profiler: typing.Optional[JFLogProfiler] = None
+        self.__stacklevel: typing.Optional[int] = None
+        self.__redactor: typing.Optional[JFLogRedactor] = None
         self.__last_log_file_path = ''
         self.__kwargs: dict = kwargs
         self.__init_params()
+        self.__update_level_methods()
         self.__clear_files()
 
-    def __del__(self):
-        try:
-            JFLogger.__instance_list__.remove(self)
-        except:
-            pass
-
-        if hasattr(JFLogger, f'_{self.__class__.__name__}__log_folder_name'):
-            try:
-                JFLogger.__log_folder_name_list__.remove(self.__log_folder_name)
-            except:
-                pass
-
-        if hasattr(JFLogger, f'_{self.__class__.__name__}__log_name'):
-            try:
-                JFLogger.__logger_name_list__.remove(self.__log_name)
-            except:
-                pass
-
     def __repr__(self):
         return f'{self.__class__.__name__}<"{self.__log_name}"> with level <{self.__log_level}"{self.__level_color_dict[self.__log_level].text}"> at 0x{id(self):016x}'
 
     def __init_params(self) -> None:
-        atexit.register(self.__compress_current_old_log_end)
+        _ProcessManager.register(self)
         self.__thread_write_log_lock = threading.Lock()
         self.__thread_compress_lock = threading.Lock()
         self.__log_file_path_last_queue = queue.Queue()
@@ -357,9 +589,14 @@ class JFLogger(object):
         self.__message_format = _Log_Default.MESSAGE_FORMAT
         self.__highlight_type = LogHighlightType.NONE
         self.__dict__.update(self.__kwargs)
-        self.__message_queue = queue.Queue()
+        self.__format_fields: tuple = _parse_format_fields(self.__message_format)
+        self.__message_queue = collections.deque()
         self.__enableDailySplit = False
         self.__enableRuntimeZip = False
+        self.__enableColumnarArchive = False
+        self.__backlog_threshold: int = -1
+        self.__backlog_max_workers: int = 0
+        self.__backlog_niceness: int = _Log_Default.BACKLOG_NICENESS
         self.__enableStartupZip = False
         self.__isStrictLimit = False
         self.__hasWrittenFirstFile = False
@@ -401,6 +638,8 @@ class JFLogger(object):
         self.__exclude_funcs.difference_update(dir(object))
         self.__exclude_classes: set = {
             self.__class__.__name__,
+            'JFLoggerAdapter',
+            'JFChildLogger',
             '_LoggingListener',
             '_LogSignal',
             '_BoundSignal',
@@ -409,8 +648,29 @@ class JFLogger(object):
         self.__exclude_modules = set()
         # self.__exclude_modules.add(self.__self_module_name)
         self.__current_size = 0
-        self.__current_day = datetime.today().date()
+        self.__rotation_interval_seconds = 0
+        self.__rollover_deadline = math.inf
+        self.__limit_file_records = -1
+        self.__current_records = 0
         self.__isNewFile = True
+        self.__file_sink = _CallbackSink(self.__write, LogRenderType.PLAIN, name=f'{self.__log_name}.file')
+        self.__console_sink = ConsoleSink(name=f'{self.__log_name}.console')
+        self.__signal_sinks: tuple = (
+            SignalSink(self.signal_format, LogRenderType.PLAIN, name=f'{self.__log_name}.signal_format'),
+            SignalSink(self.signal_colorized, LogRenderType.COLOR, name=f'{self.__log_name}.signal_colorized'),
+            SignalSink(self.signal_message, LogRenderType.MESSAGE, name=f'{self.__log_name}.signal_message'),
+            BatchedSignalSink(self.signal_format_batch, LogRenderType.PLAIN,
+                              name=f'{self.__log_name}.signal_format_batch'),
+            BatchedSignalSink(self.signal_colorized_batch, LogRenderType.COLOR,
+                              name=f'{self.__log_name}.signal_colorized_batch'),
+            BatchedSignalSink(self.signal_message_batch, LogRenderType.MESSAGE,
+                              name=f'{self.__log_name}.signal_message_batch'),
+        )
+        self.__user_sinks: list = []
+        # The child loggers are kept alive with this logger, so their levels are not lost. The registry is weak
+        self.__children: dict = {}
+        self.__sinks: tuple = ()
+        self.__update_sinks()
         self.__level_color_dict: dict = {
             LogLevel.NOTSET  : _LogMessageItem('levelName', text='NOTSET', font_color=_ColorMap.LIGHTBLUE,
                                                highlight_type=self.__highlight_type),
@@ -493,40 +753,49 @@ class JFLogger(object):
         if not os.path.exists(self.__log_dir):
             return
         current_file_list = []
+        # The columnar archives are pruned by the same limits, counted apart from the log files they are converted from
+        columnar_file_list = []
         for file in os.listdir(self.__log_dir):
             fp = os.path.join(self.__log_dir, file)
             if file.endswith('.log') and os.path.isfile(fp):
                 current_file_list.append(fp)
-        length_file_list = len(current_file_list)
+            elif file.endswith('.jfcol') and os.path.isfile(fp):
+                columnar_file_list.append(fp)
+        self.__prune_files(current_file_list)
+        self.__prune_files(columnar_file_list)
+        self.__last_log_file_path = current_file_list[-1] if current_file_list else None
+
+    def __prune_files(self, file_list: list) -> None:
+        """ Remove the oldest files beyond the count limit, or the files older than the days limit """
+        length_file_list = len(file_list)
         # clear files by count
-        sorted_files = sorted(current_file_list, key=os.path.getctime)
         if (isinstance(self.__limit_files_count,
                        int) and self.__limit_files_count >= 0) and length_file_list > self.__limit_files_count:
-            sorted_files = sorted(current_file_list, key=os.path.getctime)
+            sorted_files = sorted(file_list, key=os.path.getctime)
             for file_path in sorted_files[:length_file_list - self.__limit_files_count]:
                 os.remove(file_path)
         # clear files by days
         elif isinstance(self.__limit_files_days, int) and self.__limit_files_days > 0:
-            for file_path in current_file_list:
+            for file_path in file_list:
                 if (datetime.today() - datetime.fromtimestamp(
                         os.path.getctime(file_path))).days > self.__limit_files_days:
                     os.remove(file_path)
-        self.__last_log_file_path = current_file_list[-1] if current_file_list else None
+
+    def __get_thread_name(self) -> str:
+        if self.__enableQThreadtracking and QThread is not None:
+            return QThread.currentThread().objectName() or str(QThread.currentThread())
+        return threading.current_thread().name
 
     def __find_caller(self) -> dict:
         """ Positioning the caller """
         # stack = inspect.stack()
-        stack = inspect.currentframe()
         # caller_name = ''
         # class_name = ''
         # linenum = -1
         module_name = ''
         script_name = ''
         script_path = ''
-        if self.__enableQThreadtracking and QThread is not None:
-            thread_name = QThread.currentThread().objectName() or str(QThread.currentThread())
-        else:
-            thread_name = threading.current_thread().name
+        thread_name = self.__get_thread_name()
         process_name = _get_current_process_name()
         # func = None
         # for idx, fn in enumerate(stack):
@@ -564,7 +833,8 @@ class JFLogger(object):
         #     'thread_name': thread_name,
         #     'process_name': process_name,
         # }
-        caller_frame = stack.f_back
+        # The own frame is not kept in a local variable, it would reference itself and leave a cycle for each record
+        caller_frame = sys._getframe(1)
         caller_info = None
 
         while caller_frame is not None:
@@ -577,12 +847,14 @@ class JFLogger(object):
                 continue
 
             # 提取类名
-            if caller_frame.f_locals.get('self', None) is not None:
-                temp_class_name = caller_frame.f_locals['self'].__class__.__name__
-            elif caller_frame.f_locals.get('cls', None) is not None:
-                temp_class_name = caller_frame.f_locals['cls'].__name__
-            else:
-                temp_class_name = ''
+            # f_locals builds a dict of the frame, so it is only read if the code has a `self` or `cls` variable
+            temp_class_name = ''
+            if _code_has_owner(code):
+                f_locals = caller_frame.f_locals
+                if f_locals.get('self', None) is not None:
+                    temp_class_name = f_locals['self'].__class__.__name__
+                elif f_locals.get('cls', None) is not None:
+                    temp_class_name = f_locals['cls'].__name__
 
             # 检查类级排除
             class_func_name = f"{temp_class_name}.{function_name}"
@@ -627,7 +899,7 @@ class JFLogger(object):
 
         # Fallback if no caller found
         if caller_info is None:
-            caller_frame = inspect.currentframe().f_back
+            caller_frame = sys._getframe(1)
             code = caller_frame.f_code
             filename = code.co_filename
             caller_info = {
@@ -648,74 +920,203 @@ class JFLogger(object):
 
         return caller_info
 
-    def __format(self, log_level: int, *args) -> tuple:
-        """ Format log message """
-        msg_list = []
-        for arg in args:
-            if isinstance(arg, (dict, list, tuple)):
-                msg_list.append(pprint.pformat(arg))
-            else:
-                msg_list.append(str(arg))
+    def __caller_info_from_extra(self, extra: typing.Mapping) -> dict:
+        """ Build the caller information from the caller fields given in extra, without walking the stack """
+        module_name = extra['moduleName']
+        script_path = extra.get('scriptPath', None)
+        if script_path is None:
+            script_path = getattr(sys.modules.get(module_name, None), '__file__', None) or ''
+        return {
+            'caller_name' : extra['functionName'],
+            'class_name'  : extra.get('className', '<module>'),
+            'line_num'    : extra.get('lineNum', -1),
+            'module_name' : module_name,
+            'script_name' : extra.get('scriptName', os.path.basename(script_path)),
+            'script_path' : script_path,
+            'thread_name' : self.__get_thread_name(),
+            'process_name': _get_current_process_name(),
+        }
+
+    def __format(self, log_level: int, *args, caller_info: typing.Optional[dict] = None,
+                 context: typing.Optional[typing.Mapping] = None, extra: typing.Optional[typing.Mapping] = None,
+                 flavours: int = _RENDER_ALL, timings: typing.Optional[dict] = None, caller_frame=None) -> tuple:
+        """
+        Format log message, only the render flavours needed by the sinks are rendered, the others are empty.
+
+        If timings is given, the time of each stage is stored in it for the profiler.
 
-        msg = msg_list[0] if msg_list else ''
-        for prev, curr in zip(msg_list, msg_list[1:]):
-            if prev.endswith('\n') or curr.startswith('\n'):
-                msg += curr
+        - Returns:
+            - The record (text, text_console, text_color, message, level, timings)
+        """
+        if timings is not None:
+            stage_start = time.perf_counter()
+        if len(args) == 1:
+            msg = self.__render_arg(args[0])
+        else:
+            msg_parts = []
+            prev = ''
+            for idx, arg in enumerate(args):
+                curr = self.__render_arg(arg)
+                if idx > 0 and not (prev.endswith('\n') or curr.startswith('\n')):
+                    msg_parts.append(' ')
+                msg_parts.append(curr)
+                prev = curr
+            msg = ''.join(msg_parts)
+            del msg_parts, prev
+        if timings is not None:
+            stage_end = time.perf_counter()
+            timings['message'] = stage_end - stage_start
+            stage_start = stage_end
+        if self.__redactor is not None:
+            # Redacted once here, so all render flavours and the message share the result
+            msg = self.__redactor.redact(msg)
+            if timings is not None:
+                stage_end = time.perf_counter()
+                timings['redaction'] = stage_end - stage_start
+                stage_start = stage_end
+        if caller_info is None and extra and 'moduleName' in extra and 'functionName' in extra:
+            caller_info = self.__caller_info_from_extra(extra)
+        elif caller_info is None and caller_frame is not None:
+            caller_info = _caller_info_from_frame(caller_frame)
+            caller_info['thread_name'] = self.__get_thread_name()
+            caller_info['process_name'] = _get_current_process_name()
+        elif caller_info is None:
+            caller_info = self.__find_caller()
+        if timings is not None:
+            stage_end = time.perf_counter()
+            timings['caller_lookup'] = stage_end - stage_start
+            stage_start = stage_end
+        format_fields = self.__format_fields
+        var_dict = self.__var_dict
+        if 'asctime' in format_fields:
+            created = datetime.fromtimestamp(caller_info['created']) if 'created' in caller_info else datetime.now()
+            var_dict['asctime'].set_text(created.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3])
+        if 'consoleLine' in format_fields:
+            var_dict['consoleLine'].set_text(f'File "{caller_info["script_path"]}", line {caller_info["line_num"]}')
+        var_dict['logName'].set_text(self.__log_name)
+        var_dict['processName'].set_text(caller_info['process_name'])
+        var_dict['threadName'].set_text(caller_info['thread_name'])
+        var_dict['moduleName'].set_text(caller_info['module_name'])
+        var_dict['scriptName'].set_text(caller_info['script_name'])
+        var_dict['scriptPath'].set_text(caller_info['script_path'])
+        var_dict['functionName'].set_text(caller_info['caller_name'])
+        var_dict['className'].set_text(caller_info['class_name'])
+        var_dict['levelName'].set_text(log_level)
+        var_dict['lineNum'].set_text(caller_info['line_num'])
+        var_dict['message'].set_text(msg)
+        wantPlain = flavours & _RENDER_BITS[LogRenderType.PLAIN]
+        wantConsole = flavours & _RENDER_BITS[LogRenderType.CONSOLE]
+        wantColor = flavours & _RENDER_BITS[LogRenderType.COLOR]
+        # The field dicts are scratch buffers of the current thread, they are cleared and reused for each record
+        scratch = _acquire_scratch()
+        used_messages, used_messages_console, used_messages_color = scratch
+        try:
+            # Precedence of the fields: per-call extra > bound context > constructor and default fields
+            if extra and context:
+                fields = collections.ChainMap(extra, context)
             else:
-                msg += ' ' + curr
-        caller_info = self.__find_caller()
-        script_path = caller_info['script_path']
-        line_num = caller_info['line_num']
-        self.__var_dict['logName'].set_text(self.__log_name)
-        self.__var_dict['asctime'].set_text(datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3])
-        self.__var_dict['processName'].set_text(caller_info['process_name'])
-        self.__var_dict['threadName'].set_text(caller_info['thread_name'])
-        self.__var_dict['moduleName'].set_text(caller_info['module_name'])
-        self.__var_dict['scriptName'].set_text(caller_info['script_name'])
-        self.__var_dict['scriptPath'].set_text(caller_info['script_path'])
-        self.__var_dict['functionName'].set_text(caller_info['caller_name'])
-        self.__var_dict['className'].set_text(caller_info['class_name'])
-        self.__var_dict['levelName'].set_text(log_level)
-        self.__var_dict['lineNum'].set_text(caller_info['line_num'])
-        self.__var_dict['message'].set_text(msg)
-        self.__var_dict['consoleLine'].set_text(f'File "{script_path}", line {line_num}')
-        pattern = r'%\((.*?)\)(\.\d+)?([sdfxXobeEgGc%])'
-        used_var_names = re.findall(pattern, self.__message_format)
-        used_messages = {}
-        used_messages_console = {}
-        used_messages_color = {}
-        for tuple_item in used_var_names:
-            name: str = tuple_item[0]
-            if name not in self.__var_dict:
-                continue
-            item: _LogMessageItem = self.__var_dict[name]
-            if name == 'levelName':
-                used_messages[name] = self.__level_color_dict[item.text].text
-                used_messages_color[name] = self.__level_color_dict[item.text].text_color
-                used_messages_console[name] = self.__level_color_dict[item.text].text_console
-                continue
-            used_messages[name] = item.text
-            used_messages_color[name] = item.text_color
-            used_messages_console[name] = item.text_console
-        text = self.__message_format % used_messages + '\n'
-        text_console = self.__message_format % used_messages_console + '\n'
-        text_color = self.__message_format % used_messages_color + '\n'
-        if self.__highlight_type == LogHighlightType.HTML:
-            text_color = text_color.replace('\n', '<br>')
-        return text, text_console, text_color, msg
-
-    def __printf(self, message: str) -> None:
-        """ Print log message """
-        if not self.__enableConsoleOutput:
-            return
-        if sys.stdout:
-            sys.stdout.write(message)
+                fields = extra or context
+            for name in format_fields:
+                if fields and name in fields:
+                    # Extra and context fields are rendered only when they are used in the format
+                    item = _LogMessageItem(name, font_color=_ColorMap.CYAN, highlight_type=self.__highlight_type)
+                    item.set_text(fields[name])
+                elif name == 'levelName':
+                    item = self.__level_color_dict[var_dict[name].text]
+                elif name in var_dict:
+                    item: _LogMessageItem = var_dict[name]
+                else:
+                    # Fields that are not provided by this record, e.g. context fields of other adapters
+                    used_messages[name] = used_messages_color[name] = used_messages_console[name] = ''
+                    continue
+                # Only the flavours needed by the sinks are rendered by the item
+                if wantPlain:
+                    used_messages[name] = item.text
+                if wantConsole:
+                    used_messages_console[name] = item.text_console
+                if wantColor:
+                    used_messages_color[name] = item.text_color
+            if timings is not None:
+                stage_end = time.perf_counter()
+                timings['field_collection'] = stage_end - stage_start
+                stage_start = stage_end
+            text = text_console = text_color = ''
+            if 'message' in format_fields and len(msg) > self.__message_chunk_size:
+                # Render the format around a placeholder, the message itself is not copied into the records
+                message_color = used_messages_color.get('message', '')
+                used_messages['message'] = used_messages_console['message'] = used_messages_color['message'] = '\0'
+                if wantPlain:
+                    text = self.__split_chunked(self.__message_format % used_messages + '\n', msg)
+                if wantConsole:
+                    text_console = self.__split_chunked(self.__message_format % used_messages_console + '\n', msg)
+                if wantColor:
+                    text_color = self.__message_format % used_messages_color + '\n'
+                    if self.__highlight_type == LogHighlightType.HTML:
+                        text_color = text_color.replace('\n', '<br>')
+                    text_color = self.__split_chunked(text_color, message_color)
+            else:
+                if wantPlain:
+                    text = self.__message_format % used_messages + '\n'
+                if wantConsole:
+                    text_console = self.__message_format % used_messages_console + '\n'
+                if wantColor:
+                    text_color = self.__message_format % used_messages_color + '\n'
+                    if self.__highlight_type == LogHighlightType.HTML:
+                        text_color = text_color.replace('\n', '<br>')
+        finally:
+            _release_scratch(scratch)
+        if timings is not None:
+            timings['rendering'] = time.perf_counter() - stage_start
+        return text, text_console, text_color, msg, log_level, timings
+
+    def __render_arg(self, arg) -> str:
+        """ Render a message parameter, with the truncation settings applied """
+        if isinstance(arg, (dict, list, tuple)):
+            if self.__repr_limiter is not None:
+                # Only the first items of each level are visited, so huge containers are never rendered in full
+                text = self.__repr_limiter.repr(arg)
+            elif self.__truncate_max_depth > 0:
+                text = pprint.pformat(arg, depth=self.__truncate_max_depth)
+            else:
+                text = pprint.pformat(arg)
+        else:
+            text = str(arg)
+        if 0 < self.__truncate_max_chars < len(text):
+            text = text[:self.__truncate_max_chars] + self.__truncation_marker.format(
+                count=len(text) - self.__truncate_max_chars)
+        return text
+
+    def __split_chunked(self, text: str, message: str) -> typing.Union[str, _ChunkedText]:
+        """ Split the record rendered with the placeholder into prefix and suffix around the message """
+        prefix, sep, suffix = text.partition('\0')
+        if not sep or '\0' in suffix:
+            # The message is not used exactly once in the format, render it in full
+            return text.replace('\0', message)
+        return _ChunkedText(prefix, message, suffix, self.__message_chunk_size)
+
+    def __compress_current_old_log(self, allowBacklog: bool = True) -> None:
+        """
+        Compress the old logs currently rotated (not the historical log before startup)
 
-    def __compress_current_old_log(self) -> None:
-        """Compress the old logs currently rotated (not the historical log before startup)"""
+        If the columnar archive is enabled, the log is converted into `<log file name>.jfcol` before it is compressed.
+        If the backlog compression is enabled and enough files are waiting, all of them are processed in a process pool,
+        and compressed into new archives beside `zip_file_path`.
+        """
         with self.__thread_compress_lock:
-            if not self.__log_file_path_last_queue.empty():
+            if (allowBacklog and 0 < self.__backlog_threshold <= self.__log_file_path_last_queue.qsize()):
+                self.__compress_backlog()
+            elif not self.__log_file_path_last_queue.empty():
                 last_log_file_path = self.__log_file_path_last_queue.get()
+                if self.__enableColumnarArchive:
+                    try:
+                        JFLogColumnarArchive.convert(last_log_file_path,
+                                                     os.path.splitext(last_log_file_path)[0] + '.jfcol',
+                                                     self.__message_format)
+                    except Exception as e:
+                        self.__output(LogLevel.CRITICAL,
+                                      f"Failed to convert log data into columnar archive. {last_log_file_path}: {e}")
+                if not self.__enableRuntimeZip:
+                    return
                 try:
                     with zipfile.ZipFile(self.__zip_file_path, 'a', zipfile.ZIP_DEFLATED) as zipf:
                         arcname = os.path.basename(last_log_file_path)
@@ -724,14 +1125,27 @@ class JFLogger(object):
                         zipf.write(last_log_file_path, arcname=arcname)
                     os.remove(last_log_file_path)
                 except Exception as e:
-                    self.__output(level=LogLevel.CRITICAL,
-                                  message=f"Failed to compress log data. {last_log_file_path}: {e}")
+                    self.__output(LogLevel.CRITICAL, f"Failed to compress log data. {last_log_file_path}: {e}")
+
+    def __compress_backlog(self) -> None:
+        """ Process all waiting rotated files in a process pool, the lock of compression is held by the caller """
+        paths = []
+        while not self.__log_file_path_last_queue.empty():
+            paths.append(self.__log_file_path_last_queue.get())
+        try:
+            failures = compress_backlog(paths, self.__zip_file_path,
+                                        self.__message_format if self.__enableColumnarArchive else None,
+                                        self.__enableRuntimeZip, self.__backlog_max_workers, self.__backlog_niceness)
+        except Exception as e:  # e.g. the platform does not support process pools
+            failures = [(', '.join(paths), e)]
+        for path, e in failures:
+            self.__output(LogLevel.CRITICAL, f"Failed to compress log data. {path}: {e}")
 
     def __run_async_rotated_log_compression(self):
-        if self.__log_file_path_last_queue.empty() or not self.__enableRuntimeZip:
+        if self.__log_file_path_last_queue.empty() or not (self.__enableRuntimeZip or self.__enableColumnarArchive):
             return
         zip_dir = os.path.dirname(self.__zip_file_path)
-        if not os.path.exists(zip_dir):
+        if self.__enableRuntimeZip and not os.path.exists(zip_dir):
             os.makedirs(zip_dir)
         t = _CompressThread(name=f'RotatedLogCompressThread-{self.name}', func=self.__compress_current_old_log)
         t.finished.connect(self.__compress_current_old_log_finished)
@@ -741,40 +1155,97 @@ class JFLogger(object):
     def __compress_current_old_log_finished(self, thread_obj: _CompressThread):
         self.__compression_thread_pool.discard(thread_obj)
 
-    def __compress_current_old_log_end(self):
-        if not self.__enableRuntimeZip:
+    def _before_fork(self) -> None:
+        """ Hold the write lock during fork, so that no record is half written in the child """
+        self.__thread_write_log_lock.acquire()
+
+    def _after_fork_in_parent(self) -> None:
+        self.__thread_write_log_lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        """
+        Reinitialize the state inherited from the parent process.
+
+        The locks and queues are recreated, the compression threads do not exist in the child,
+        and the child writes to its own log file, whose name contains the process id.
+        """
+        _process_name_cache.clear()
+        self.__thread_write_log_lock = threading.Lock()
+        self.__thread_compress_lock = threading.Lock()
+        self.__exception_cache_lock = threading.Lock()
+        self.__call_site_lock = threading.Lock()
+        self.__log_file_path_last_queue = queue.Queue()
+        self.__message_queue = collections.deque()
+        self.__compression_thread_pool = set()
+        self.__isWriting = False
+        self.__hasWrittenFirstFile = False
+        self.__isNewFile = True
+        self.__zip_file_path = ''
+        self.__current_size = 0
+        self.__current_records = 0
+
+    def _shutdown(self, deadline: float) -> None:
+        """
+        Flush the pending messages and drain the compression work before the process exits.
+
+        It is called by the process manager at exit, the deadline is a `time.monotonic()` value.
+        """
+        if not self.__isWriting:
+            self.__write_and_broadcast()
+        self.__file_sink.flush(max(0.0, deadline - time.monotonic()))
+        for thread in list(self.__compression_thread_pool):
+            thread.join(max(0.0, deadline - time.monotonic()))
+        if not (self.__enableRuntimeZip or self.__enableColumnarArchive) or not self.__hasWrittenFirstFile:
             return
         try:
             self.__log_file_path_last_queue.put(self.__log_file_path)
-            self.__compress_current_old_log()
-            time.sleep(0.5)
+            # No process pool is started at exit
+            self.__compress_current_old_log(allowBacklog=False)
         except:
             pass
 
-    def __write(self, message: str) -> None:
-        """ Write log to file """
+    def __update_rollover_deadline(self) -> None:
+        """ Compute the time of the next rollover, so that each record only needs one comparison """
+        self.__rollover_deadline = _next_rollover_deadline(time.time(), self.__enableDailySplit,
+                                                           self.__rotation_interval_seconds)
+
+    def __write(self, message: typing.Union[str, _ChunkedText]) -> None:
+        """ Write log to file, a chunked message is encoded and written chunk by chunk """
         if not self.__enableFileOutput or self.__isExistsPath is False:
             return
         with self.__thread_write_log_lock:  # Avoid multi-threading creation and writing files
             if self.__limit_single_file_size_Bytes and self.__limit_single_file_size_Bytes > 0:
                 # Size limit
-                writting_size = len(message.encode('utf-8'))
+                if isinstance(message, _ChunkedText):
+                    writting_size = message.encoded_size()
+                else:
+                    writting_size = len(message.encode('utf-8'))
                 self.__current_size += writting_size
                 if self.__current_size >= self.__limit_single_file_size_Bytes:
                     self.__isNewFile = True
-            if self.__enableDailySplit:
-                # Split by day
-                if datetime.today().date() != self.__current_day:
+            if self.__limit_file_records > 0:
+                # Record count limit
+                self.__current_records += 1
+                if self.__current_records > self.__limit_file_records:
                     self.__isNewFile = True
+            if time.time() >= self.__rollover_deadline:
+                # Split by day or by time interval, the deadline is computed once per file
+                self.__isNewFile = True
             if self.__isNewFile:
                 # Create a new file
                 self.__isNewFile = False
                 self.__set_log_file_path()
-                self.__current_day = datetime.today().date()
+                self.__update_rollover_deadline()
+                self.__current_records = 1
                 file_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 start_time = self.__start_time_log.strftime('%Y-%m-%d %H:%M:%S')
-                message = f"""{'#' * 66}\n# <start time> This Program is started at\t {start_time}.\n# <file  time> This log file is created at\t {file_time}.\n{'#' * 66}\n\n{message}"""
-                self.__current_size = len(message.encode('utf-8'))
+                header = f"""{'#' * 66}\n# <start time> This Program is started at\t {start_time}.\n# <file  time> This log file is created at\t {file_time}.\n{'#' * 66}\n\n"""
+                if isinstance(message, _ChunkedText):
+                    message = message.with_prefix(header)
+                    self.__current_size = message.encoded_size()
+                else:
+                    message = header + message
+                    self.__current_size = len(message.encode('utf-8'))
                 self.__run_async_rotated_log_compression()
             # Prevent folders from being deleted accidentally before writing
             if not os.path.exists(self.__log_dir):
@@ -784,78 +1255,181 @@ class JFLogger(object):
                 self.__clear_files()
             # Write to new log file
             with open(self.__log_file_path, 'a+', encoding='utf-8') as f:
-                f.write(message)
+                if isinstance(message, _ChunkedText):
+                    for chunk in message.iter_chunks():
+                        f.write(chunk)
+                else:
+                    f.write(message)
             self.__hasWrittenFirstFile = True
 
-    def __output(self, level, *args, **kwargs) -> tuple:
-        res = self.__format(level, *args)
-        text, text_console, text_color, msg = res
-        self.__message_queue.put(res)
+    def __output(self, level, *args, caller_info: typing.Optional[dict] = None,
+                 context: typing.Optional[typing.Mapping] = None, extra: typing.Optional[typing.Mapping] = None,
+                 timings: typing.Optional[dict] = None, caller_frame=None, **kwargs) -> tuple:
+        flavours = 0
+        for sink in self.__sinks:
+            if sink.isActive:
+                flavours |= _RENDER_BITS[sink.flavour]
+        record = self.__format(level, *args, caller_info=caller_info, context=context, extra=extra,
+                               flavours=flavours, timings=timings, caller_frame=caller_frame)
+        self.__message_queue.append(record)
         if not self.__isWriting:
             self.__isWriting = True
             self.__write_and_broadcast()
-        return text, text_console, text_color, msg
+        return record[:4]
 
     def __write_and_broadcast(self) -> None:
-        while not self.__message_queue.empty():
-            text, text_console, text_color, msg = self.__message_queue.get()
-            self.__write(text)
-            self.__printf(text_console)
+        # The record is one tuple (text, text_console, text_color, message, level, timings), the sinks select
+        # the text by the index of their flavour, so no other container is allocated per record
+        message_queue = self.__message_queue
+        while message_queue:
+            record = message_queue.popleft()
+            level = record[4]
+            timings = record[5]
+            if timings is None:
+                for sink in self.__sinks:
+                    sink._emit(level, record)
+                continue
+            for sink in self.__sinks:
+                stage_start = time.perf_counter()
+                sink._emit(level, record)
+                timings[f'sink:{sink.name}'] = time.perf_counter() - stage_start
+            profiler = self.__profiler
+            if profiler is not None:
+                profiler._finish(self.__log_name, timings)
         self.__isWriting = False
 
-    def _trace(self, *args, _sender=None, **kwargs) -> None:
-        # This method is mainly used to separate the _sender parameter and prevent external misinformation.
-        if self.__log_level > LogLevel.TRACE and _sender != '_LoggingListener':
-            return
-        text, text_console, text_color, msg = self.__output(LogLevel.TRACE, *args, **kwargs)
-        self.signal_format.emit(LogLevel.TRACE, text)
-        self.signal_colorized.emit(LogLevel.TRACE, text_color)
-        self.signal_message.emit(LogLevel.TRACE, msg)
-
-    def _debug(self, *args, _sender=None, **kwargs) -> None:
-        # This method is mainly used to separate the _sender parameter and prevent external misinformation.
-        if self.__log_level > LogLevel.DEBUG and _sender != '_LoggingListener':
-            return
-        text, text_console, text_color, msg = self.__output(LogLevel.DEBUG, *args, **kwargs)
-        self.signal_format.emit(LogLevel.DEBUG, text)
-        self.signal_colorized.emit(LogLevel.DEBUG, text_color)
-        self.signal_message.emit(LogLevel.DEBUG, msg)
-
-    def _info(self, *args, _sender=None, **kwargs) -> None:
-        # This method is mainly used to separate the _sender parameter and prevent external misinformation.
-        if self.__log_level > LogLevel.INFO and _sender != '_LoggingListener':
-            return
-        text, text_console, text_color, msg = self.__output(LogLevel.INFO, *args, **kwargs)
-        self.signal_format.emit(LogLevel.INFO, text)
-        self.signal_colorized.emit(LogLevel.INFO, text_color)
-        self.signal_message.emit(LogLevel.INFO, msg)
-
-    def _warning(self, *args, _sender=None, **kwargs) -> None:
-        # This method is mainly used to separate the _sender parameter and prevent external misinformation.
-        if self.__log_level > LogLevel.WARNING and _sender != '_LoggingListener':
-            return
-        text, text_console, text_color, msg = self.__output(LogLevel.WARNING, *args, **kwargs)
-        self.signal_format.emit(LogLevel.WARNING, text)
-        self.signal_colorized.emit(LogLevel.WARNING, text_color)
-        self.signal_message.emit(LogLevel.WARNING, msg)
-
-    def _error(self, *args, _sender=None, **kwargs) -> None:
-        # This method is mainly used to separate the _sender parameter and prevent external misinformation.
-        if self.__log_level > LogLevel.ERROR and _sender != '_LoggingListener':
-            return
-        text, text_console, text_color, msg = self.__output(LogLevel.ERROR, *args, **kwargs)
-        self.signal_format.emit(LogLevel.ERROR, text)
-        self.signal_colorized.emit(LogLevel.ERROR, text_color)
-        self.signal_message.emit(LogLevel.ERROR, msg)
-
-    def _critical(self, *args, _sender=None, **kwargs) -> None:
-        # This method is mainly used to separate the _sender parameter and prevent external misinformation.
-        if self.__log_level > LogLevel.CRITICAL and _sender != '_LoggingListener':
+    def __update_sinks(self) -> None:
+        """ Collect the sinks which receive the records, the console and file output can be disabled """
+        sinks = []
+        if self.__enableFileOutput:
+            sinks.append(self.__file_sink)
+        if self.__enableConsoleOutput:
+            sinks.append(self.__console_sink)
+        sinks.extend(self.__signal_sinks)
+        sinks.extend(self.__user_sinks)
+        self.__sinks = tuple(sinks)
+
+    def __handle_logging_record(self, record: logging.LogRecord) -> None:
+        """
+        Output a record forwarded by the logging listener.
+
+        The caller information is taken from the `LogRecord` directly, so no stack walk is needed.
+        The level of JFLogger is not checked here, the level of the listener has been applied by `logging`.
+        """
+        level = min(LogLevel._normalize_log_level(record.levelno + 10), LogLevel.CRITICAL)
+        caller_info = {
+            'caller_name' : record.funcName,
+            'class_name'  : '<module>',
+            'line_num'    : record.lineno,
+            'module_name' : record.module,
+            'script_name' : record.filename,
+            'script_path' : record.pathname,
+            'thread_name' : record.threadName,
+            'process_name': _get_current_process_name() if record.process == os.getpid()
+            else _format_process_name(record.process, record.processName),
+            'created'     : record.created,
+        }
+        self._log(level, (record.getMessage(),), caller_info=caller_info, _sender='_LoggingListener')
+
+    def __get_caller_level(self) -> int:
+        """ Get the level of the caller from the level overrides, the result is cached by the code object """
+        frame = sys._getframe(1)
+        while frame is not None and frame.f_globals.get('__name__', '').startswith(_SELF_PACKAGE_NAME):
+            frame = frame.f_back
+        if frame is None:
+            return self.__log_level
+        code = frame.f_code
+        level = self.__level_cache.get(code, None)
+        if level is None:
+            level = self.__log_level
+            parts = f"{frame.f_globals.get('__name__', '')}.{code.co_qualname}".split('.')
+            for idx in range(len(parts), 0, -1):
+                name = '.'.join(parts[:idx])
+                if name in self.__level_overrides:
+                    level = self.__level_overrides[name]
+                    break
+            self.__level_cache[code] = level
+        return level
+
+    def _is_level_enabled(self, level: int) -> bool:
+        """ Check whether a record of the level from the current caller passes the level filter """
+        if not self.__level_overrides:
+            return level >= self.__log_level
+        if level < self.__min_enabled_level:
+            return False
+        return level >= self.__get_caller_level()
+
+    def _log(self, level: int, args: tuple, context: typing.Optional[typing.Mapping] = None,
+             extra: typing.Optional[typing.Mapping] = None, caller_info: typing.Optional[dict] = None,
+             lazy: bool = False, stacklevel: typing.Optional[int] = None, _sender=None, _stack_depth: int = 3,
+             **kwargs) -> None:
+        """
+        Common entry of all log methods.
+
+        - Args:
+            - level(int): The log level of the record
+            - args(tuple): The message parameters
+            - context(Mapping): Context fields of the record, e.g. from `JFLoggerAdapter`
+            - extra(Mapping): Per-call fields of the record, they take precedence over the context fields
+                and the constructor fields. If `moduleName` and `functionName` are given, the stack walk will be skipped
+            - caller_info(dict): Caller information, if it is given, the stack walk will be skipped
+            - lazy(bool): If True, callable parameters and `%`-style templates are rendered
+                only after the record passed the level filter
+            - stacklevel(int): The caller frame is taken `stacklevel` frames above the log call directly,
+                1 is the caller of the log method. The default is the stacklevel of the logger, see `set_stacklevel`.
+                If both are None, the caller is found by walking the stack with the exclusion rules
+        """
+        profiler = self.__profiler
+        timings = None
+        if profiler is not None and profiler._should_sample():
+            timings = {}
+            stage_start = time.perf_counter()
+        # The _sender parameter is given by the internal senders which have applied their own level check,
+        # e.g. the logging listener. It is used to prevent external misinformation.
+        isEnabled = True
+        if _sender is None:
+            if self.__level_overrides:
+                isEnabled = self._is_level_enabled(level)
+            else:
+                isEnabled = self.__log_level <= level
+        if timings is not None:
+            timings['level_gate'] = time.perf_counter() - stage_start
+            if not isEnabled:
+                profiler._finish(self.__log_name, timings)
+        if not isEnabled:
             return
-        text, text_console, text_color, msg = self.__output(LogLevel.CRITICAL, *args, **kwargs)
-        self.signal_format.emit(LogLevel.CRITICAL, text)
-        self.signal_colorized.emit(LogLevel.CRITICAL, text_color)
-        self.signal_message.emit(LogLevel.CRITICAL, msg)
+        if lazy:
+            args = _resolve_lazy_args(args)
+        caller_frame = None
+        if stacklevel is None:
+            stacklevel = self.__stacklevel
+        if stacklevel is not None and caller_info is None:
+            # _stack_depth is the count of frames from here to the caller of the public log method,
+            # given by the wrappers which know their own depth, e.g. 3 for info() -> _info() -> _log()
+            try:
+                caller_frame = sys._getframe(_stack_depth + max(stacklevel, 1) - 1)
+            except ValueError:  # The stack is not deep enough, fall back to the stack walk
+                caller_frame = None
+        self.__output(level, *args, caller_info=caller_info, context=context, extra=extra, timings=timings,
+                      caller_frame=caller_frame)
+
+    def _trace(self, *args, **kwargs) -> None:
+        self._log(LogLevel.TRACE, args, **kwargs)
+
+    def _debug(self, *args, **kwargs) -> None:
+        self._log(LogLevel.DEBUG, args, **kwargs)
+
+    def _info(self, *args, **kwargs) -> None:
+        self._log(LogLevel.INFO, args, **kwargs)
+
+    def _warning(self, *args, **kwargs) -> None:
+        self._log(LogLevel.WARNING, args, **kwargs)
+
+    def _error(self, *args, **kwargs) -> None:
+        self._log(LogLevel.ERROR, args, **kwargs)
+
+    def _critical(self, *args, **kwargs) -> None:
+        self._log(LogLevel.CRITICAL, args, **kwargs)
 
     def trace(self, *args, **kwargs) -> None:
         self._trace(*args, **kwargs)
@@ -875,7 +1449,141 @@ class JFLogger(object):
     def critical(self, *args, **kwargs) -> None:
         self._critical(*args, **kwargs)
 
-    def exception(self, *args, level: str | int = LogLevel.ERROR, **kwargs) -> None:
+    def _log_limited(self, level: int, mode: str, limit, args: tuple, kwargs: dict,
+                     context: typing.Optional[typing.Mapping] = None, _stack_depth: int = 2) -> None:
+        """
+        Log the record only if the state of its call site allows it.
+
+        The call site is the (code object, line number) of the caller of the public method.
+        The state is checked before any formatting or caller lookup, and only if the level is enabled,
+        so a record of a disabled level does not consume the limit.
+        The adapters and the child loggers share the state of the call sites with this logger.
+
+        - Args:
+            - mode(str): 'once' to log once, 'every' to log every `limit`-th call,
+                'every_seconds' to log at most once in `limit` seconds
+            - limit(int | float): The count or seconds of the mode
+            - context(Mapping): The context fields of the adapter
+            - _stack_depth(int): The depth of the call site from this method
+        """
+        if mode == 'every' and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+            error_text = ansi_color_text(f"n must be a positive int, but {limit} was given.", 33)
+            raise ValueError(error_text)
+        if mode == 'every_seconds' and (not isinstance(limit, (int, float)) or limit <= 0):
+            error_text = ansi_color_text(f"seconds must be a positive number, but {limit} was given.", 33)
+            raise ValueError(error_text)
+        if kwargs.get('_sender', None) is None and not self._is_level_enabled(level):
+            return
+        frame = sys._getframe(_stack_depth)
+        call_site = (frame.f_code, frame.f_lineno)
+        del frame
+        with self.__call_site_lock:
+            if mode == 'once':
+                if call_site in self.__call_site_once:
+                    return
+                self.__call_site_once.add(call_site)
+            elif mode == 'every':
+                count = self.__call_site_counts.get(call_site, 0)
+                self.__call_site_counts[call_site] = count + 1
+                if count % limit != 0:
+                    return
+            else:
+                now = time.monotonic()
+                last = self.__call_site_times.get(call_site, None)
+                if last is not None and now - last < limit:
+                    return
+                self.__call_site_times[call_site] = now
+        # _log <- _log_limited <- <level>_once / _every / _every_seconds <- caller
+        self._log(level, args, context=context, _stack_depth=_stack_depth + 1, **kwargs)
+
+    def trace_once(self, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.TRACE, 'once', 0, args, kwargs)
+
+    def trace_every(self, n: int, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.TRACE, 'every', n, args, kwargs)
+
+    def trace_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.TRACE, 'every_seconds', seconds, args, kwargs)
+
+    def debug_once(self, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.DEBUG, 'once', 0, args, kwargs)
+
+    def debug_every(self, n: int, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.DEBUG, 'every', n, args, kwargs)
+
+    def debug_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.DEBUG, 'every_seconds', seconds, args, kwargs)
+
+    def info_once(self, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.INFO, 'once', 0, args, kwargs)
+
+    def info_every(self, n: int, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.INFO, 'every', n, args, kwargs)
+
+    def info_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.INFO, 'every_seconds', seconds, args, kwargs)
+
+    def warning_once(self, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.WARNING, 'once', 0, args, kwargs)
+
+    def warning_every(self, n: int, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.WARNING, 'every', n, args, kwargs)
+
+    def warning_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.WARNING, 'every_seconds', seconds, args, kwargs)
+
+    def error_once(self, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.ERROR, 'once', 0, args, kwargs)
+
+    def error_every(self, n: int, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.ERROR, 'every', n, args, kwargs)
+
+    def error_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.ERROR, 'every_seconds', seconds, args, kwargs)
+
+    def critical_once(self, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.CRITICAL, 'once', 0, args, kwargs)
+
+    def critical_every(self, n: int, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.CRITICAL, 'every', n, args, kwargs)
+
+    def critical_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self._log_limited(LogLevel.CRITICAL, 'every_seconds', seconds, args, kwargs)
+
+    def __format_exception_dedup(self, exc_type, exc_value, exc_traceback) -> str:
+        """
+        Format the exception, the full text is only written at the first occurrence of a fingerprint.
+
+        The fingerprint is built from the exception type, the code objects and the line numbers of the traceback,
+        so that the traceback is only formatted when the full text is required.
+        """
+        frames = []
+        tb = exc_traceback
+        while tb is not None:
+            frames.append((tb.tb_frame.f_code, tb.tb_lineno))
+            tb = tb.tb_next
+        fingerprint = (exc_type, tuple(frames))
+        with self.__exception_cache_lock:
+            cache_item = self.__exception_cache.get(fingerprint, None)
+            if cache_item is None:
+                if len(self.__exception_cache) >= _Log_Default.EXCEPTION_CACHE_SIZE:
+                    self.__exception_cache.pop(next(iter(self.__exception_cache)))
+                cache_item = [f'{hash(fingerprint) & 0xFFFFFFFF:08x}', 0, None]
+                self.__exception_cache[fingerprint] = cache_item
+            cache_item[1] += 1
+            ref_id, count, full_text = cache_item
+        if count == 1 or (self.__exception_repeat_every > 0 and (count - 1) % self.__exception_repeat_every == 0):
+            if full_text is None:
+                if self.__enableTracebackException:
+                    full_text = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+                else:
+                    full_text = f'{exc_type.__name__}: {exc_value}'
+                cache_item[2] = full_text
+            return f'[exception #{ref_id}, occurrence {count}]\n{full_text}'
+        return f'{exc_type.__name__}: {exc_value} [repeated exception #{ref_id}, occurrence {count}]'
+
+    def exception(self, *args, level: str | int = LogLevel.ERROR, exc_info: typing.Optional[tuple] = None,
+                  **kwargs) -> None:
         """
         Log an exception.
 
@@ -884,17 +1592,26 @@ class JFLogger(object):
         Format: `traceback_message` + `message`
 
         You can specify the log level of the exception message, default is ERROR.
+        The exception is taken from `exc_info` if it is given, otherwise from `sys.exc_info()`.
         """
-        if self.__enableTracebackException:
-            exception_str = traceback.format_exc()
+        level = LogLevel._normalize_log_level(level)
+        if not kwargs.get('_sender', None) and not self._is_level_enabled(level):
+            return
+        if exc_info is None:
+            exc_info = sys.exc_info()
+        exc_type, exc_value, exc_traceback = exc_info
+        if exc_type is None:
+            return
+        if self.__enableExceptionDedup:
+            exception_str = self.__format_exception_dedup(exc_type, exc_value, exc_traceback)
+        elif self.__enableTracebackException:
+            exception_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
         else:
-            exc_type, exc_value, _ = sys.exc_info()
             exception_str = f'{exc_type.__name__}: {exc_value}'
-        if exception_str == f'{type(None).__name__}: {None}':
-            return
         if len(args) != 0:
             exception_str += '\n'
-        level = LogLevel._normalize_log_level(level)
+        # The level methods below add one frame between the caller and _log
+        kwargs['_stack_depth'] = kwargs.get('_stack_depth', 3) + 1
         if level == LogLevel.TRACE:
             self.trace(exception_str, *args, **kwargs)
         elif level == LogLevel.DEBUG:
@@ -908,6 +1625,130 @@ class JFLogger(object):
         else:
             self.error(exception_str, *args, **kwargs)
 
+    def bind(self, **context) -> 'JFLoggerAdapter':
+        """
+        Return a child view of the logger holding the given context fields.
+
+        The context is immutable and captured by reference for each record, the logger itself is not changed.
+        The context fields are used in the message format like the custom parameters.
+
+        - Args:
+            - **context: The context fields, e.g. `request_id=...`, `user=...`
+
+        Example:
+
+            request_log = logger.bind(requestId='abc')
+
+            logger.set_message_format('%(asctime)s [%(requestId)s] %(message)s')
+
+            request_log.info('handled')
+        """
+        return JFLoggerAdapter(self, context)
+
+    @classmethod
+    def get(cls, name: str) -> typing.Union['JFLogger', 'JFChildLogger', None]:
+        """
+        Return the living logger with the name.
+
+        If there is no logger with the name, but a logger with a dotted prefix of the name exists,
+        e.g. `app` for `app.db.pool`, a child logger of it is returned.
+
+        - Args:
+            - name(str): The name of the logger
+
+        - Returns:
+            - The logger, or None if there is no logger for the name
+        """
+        logger = _LoggerRegistry.get(name)
+        if logger is not None:
+            return logger
+        parts = name.split('.')
+        for idx in range(len(parts) - 1, 0, -1):
+            parent = _LoggerRegistry.get('.'.join(parts[:idx]))
+            if parent is not None:
+                return parent.get_child('.'.join(parts[idx:]))
+        return None
+
+    def get_child(self, suffix: str) -> 'JFChildLogger':
+        """
+        Return the child logger `<name>.<suffix>`, it is created on the first call.
+
+        The child logger writes through the sinks of this logger, no file, queue or thread is created for it.
+        Its level is inherited from the parent child logger, or from this logger, unless it is set with `set_level`.
+        The child logger lives as long as this logger, so its configuration is kept when the caller drops it.
+
+        - Args:
+            - suffix(str): The dotted suffix of the name, e.g. `db.pool`
+        """
+        parent = self
+        name = self.__log_name
+        for part in suffix.split('.'):
+            name = f'{name}.{part}'
+            child = self.__children.get(name, None)
+            if child is None:
+                child = _LoggerRegistry.get_or_create(name, lambda: JFChildLogger(self, name, parent))
+                child = self.__children.setdefault(name, child)
+            parent = child
+        return parent
+
+    def add_sink(self, sink: JFLogSink) -> typing.Self:
+        """
+        Add a sink which receives the records of this logger
+
+        - Args:
+            - sink(JFLogSink): The sink, it receives the records in its render flavour and level
+        """
+        if not isinstance(sink, JFLogSink):
+            error_text = ansi_color_text(f"sink must be JFLogSink, but {type(sink)} was given.", 33)
+            raise TypeError(error_text)
+        if sink not in self.__user_sinks:
+            self.__user_sinks.append(sink)
+            self.__update_sinks()
+        return self
+
+    def remove_sink(self, sink: JFLogSink) -> typing.Self:
+        """
+        Remove a sink added by `add_sink`, the sink is not closed
+
+        - Args:
+            - sink(JFLogSink): The sink
+        """
+        if sink in self.__user_sinks:
+            self.__user_sinks.remove(sink)
+            self.__update_sinks()
+        return self
+
+    def search(self, pattern: str, since: typing.Union[datetime, float, str, None] = None,
+               until: typing.Union[datetime, float, str, None] = None,
+               levels: typing.Optional[typing.Iterable[typing.Union[str, int]]] = None,
+               max_workers: int = 0, ignoreCase: bool = False) -> typing.Iterator[tuple]:
+        """
+        Search the records of the `.log` files and the `--Compressed.zip` and `--Compressed-<n>.zip` archives in the log folder
+
+        The pending records are written before. The files are searched in parallel by worker processes,
+        the log files through `mmap` and the archive members by streaming decompression.
+        The files must be written with the current message format.
+        The workers import `__main__`, so a script must guard its code with `if __name__ == '__main__':`.
+        The same search is available on the command line: `python -m DToolslib._JFLogger <folder> <pattern>`
+
+        - Args:
+            - pattern(str): The regular expression to be searched in the records, '' for all records
+            - since(datetime | float | str): Only the records at or after the time, as datetime, epoch or ISO format
+            - until(datetime | float | str): Only the records at or before the time
+            - levels(Iterable[str | int]): Only the records of the levels, e.g. ('ERROR', 'CRITICAL')
+            - max_workers(int): The count of the worker processes, 0 for the count of CPUs, 1 to search in this process
+            - ignoreCase(bool): Whether the pattern ignores the case
+
+        - Returns:
+            - Iterator of (file, line, record), the file of an archive member is `<archive>::<member>`
+        """
+        if not self.__isWriting:
+            self.__write_and_broadcast()
+        self.__file_sink.flush()
+        if not os.path.isdir(self.__log_dir):
+            return iter(())
+        return search_logs(self.__log_dir, pattern, self.__message_format, since, until, levels, max_workers, ignoreCase)
+
     def set_listen_logging(self, logger_name: str = '', level: LogLevel = LogLevel.NOTSET) -> typing.Self:
         """
         Set logging listener
@@ -916,16 +1757,12 @@ class JFLogger(object):
             - logger_name: The name of the logger to be listened
             - level: The level of the listener
         """
+        level = LogLevel._normalize_log_level(level)
         if not (hasattr(self, f'_{self.__class__.__name__}__logging_listener_handler') and hasattr(self,
                                                                                                    f'_{self.__class__.__name__}__logging_listener')):
-            self.__logging_listener_handler = _LoggingListener(self.__log_level_translation_dict[level])
+            self.__logging_listener_handler = _LoggingListener(self.__log_level_translation_dict[level],
+                                                               self.__handle_logging_record)
             self.__logging_listener: logging.Logger = logging.getLogger(logger_name)
-            self.__logging_listener_handler.signal_trace.connect(self._trace)
-            self.__logging_listener_handler.signal_debug.connect(self._debug)
-            self.__logging_listener_handler.signal_info.connect(self._info)
-            self.__logging_listener_handler.signal_warning.connect(self._warning)
-            self.__logging_listener_handler.signal_error.connect(self._error)
-            self.__logging_listener_handler.signal_critical.connect(self._critical)
             self.__logging_listener.addHandler(self.__logging_listener_handler)
         else:
             self.__logging_listener_handler.set_level(self.__log_level_translation_dict[level])
@@ -960,6 +1797,8 @@ class JFLogger(object):
         """
         self.__exclude_classes: set = {
             self.__class__.__name__,
+            'JFLoggerAdapter',
+            'JFChildLogger',
             '_LoggingListener',
             '_LogSignal',
             '_BoundSignal',
@@ -1087,11 +1926,15 @@ class JFLogger(object):
                     _ColorMap.LIGHTYELLOW.ANSI_TXT))
             if sys.stdout:
                 sys.stdout.write(warning_text)
-            self.__log_folder_name: str = self.__log_name
+            log_folder_name = self.__log_name
         elif not log_folder_name:
-            self.__log_folder_name: str = self.__log_name
-        else:
-            self.__log_folder_name: str = log_folder_name
+            log_folder_name = self.__log_name
+        if not _LoggerRegistry.register_folder(log_folder_name, self):
+            error_text = ansi_color_text(f'<ERROR> Log folder name "{log_folder_name}" is already in use.', 33)
+            raise ValueError(error_text)
+        if log_folder_name != self.__log_folder_name:
+            _LoggerRegistry.unregister_folder(self.__log_folder_name, self)
+        self.__log_folder_name: str = log_folder_name
         self.__log_dir: str = os.path.join(self.__root_path, self.__log_folder_name)
         return self
 
@@ -1103,6 +1946,66 @@ class JFLogger(object):
             - log_level(LogLevel): log level
         """
         self.__log_level = LogLevel._normalize_log_level(log_level)
+        self.__compile_level_overrides()
+        return self
+
+    def __compile_level_overrides(self) -> None:
+        self.__level_cache.clear()
+        self.__min_enabled_level = min([self.__log_level, *self.__level_overrides.values()])
+        self.__update_level_methods()
+
+    def __update_level_methods(self) -> None:
+        """ Rebind the methods of disabled levels to no-op, so that a disabled call costs one attribute lookup """
+        for level_name, level in _LEVEL_METHODS:
+            for suffix in _LIMITED_SUFFIXES:
+                method_name = level_name + suffix
+                if level < self.__min_enabled_level:
+                    self.__dict__[method_name] = _noop_log
+                else:
+                    self.__dict__.pop(method_name, None)
+
+    def isEnabledFor(self, level: typing.Union[str, int]) -> bool:
+        """
+        Check whether a record of the level from the current caller would be output
+
+        - Args:
+            - level(str | int): The log level
+        """
+        return self._is_level_enabled(LogLevel._normalize_log_level(level))
+
+    def set_level_for(self, name: str, log_level: LogLevel) -> typing.Self:
+        """
+        Set the log level for a module, a class or a function, which overrides the log level of the logger
+
+        The name is matched hierarchically, the most specific override is used.
+        The result is cached by the code object of the caller after the first lookup.
+
+        - Args:
+            - name(str): The dotted name, e.g. `pkg.sub`, `pkg.sub.ClassName` or `pkg.sub.ClassName.method`
+            - log_level(LogLevel): The log level for the name
+
+        Example:
+
+            logger.set_level(LogLevel.INFO)
+
+            logger.set_level_for('app.database', LogLevel.DEBUG)
+        """
+        if not isinstance(name, str) or not name:
+            error_text = ansi_color_text(f"name must be a non-empty str, but {name!r} was given.", 33)
+            raise TypeError(error_text)
+        self.__level_overrides[name] = LogLevel._normalize_log_level(log_level)
+        self.__compile_level_overrides()
+        return self
+
+    def remove_level_for(self, name: str) -> typing.Self:
+        """
+        Remove the log level override of a module, a class or a function
+
+        - Args:
+            - name(str): The dotted name given in `set_level_for`
+        """
+        self.__level_overrides.pop(name, None)
+        self.__compile_level_overrides()
         return self
 
     def set_enable_daily_split(self, enable: bool) -> typing.Self:
@@ -1113,6 +2016,37 @@ class JFLogger(object):
             - enable(bool): whether to enable daily split log
         """
         self.__enableDailySplit = enable
+        self.__update_rollover_deadline()
+        return self
+
+    def set_rotation_interval_minutes(self, minutes: int) -> typing.Self:
+        """
+        Set the time interval to split log files, e.g. 60 for hourly rotation
+
+        The interval is aligned to the local midnight, e.g. with 15 minutes the files are split at xx:00, xx:15, ...
+        It can be combined with the daily split.
+
+        - Args:
+            - minutes(int): The rotation interval in minutes, 0 or negative to disable
+        """
+        if not isinstance(minutes, int):
+            error_text = ansi_color_text(f"minutes must be int, but {type(minutes)} was given.", 33)
+            raise TypeError(error_text)
+        self.__rotation_interval_seconds = minutes * 60 if minutes > 0 else 0
+        self.__update_rollover_deadline()
+        return self
+
+    def set_file_record_limit(self, record_limit: int) -> typing.Self:
+        """
+        Set the limit on the number of records in a single log file
+
+        - Args:
+            - record_limit(int): The maximum count of records in a single log file, 0 or negative to disable
+        """
+        if not isinstance(record_limit, int):
+            error_text = ansi_color_text(f"record_limit must be int, but {type(record_limit)} was given.", 33)
+            raise TypeError(error_text)
+        self.__limit_file_records = record_limit if record_limit > 0 else -1
         return self
 
     def set_enable_console_output(self, enable: bool) -> typing.Self:
@@ -1123,6 +2057,7 @@ class JFLogger(object):
             - enable(bool): Whether to enable console output
         """
         self.__enableConsoleOutput = enable
+        self.__update_sinks()
         return self
 
     def set_enable_file_output(self, enable: bool) -> typing.Self:
@@ -1133,6 +2068,7 @@ class JFLogger(object):
             - enable(bool): Whether to enable file output
         """
         self.__enableFileOutput = enable
+        self.__update_sinks()
         return self
 
     def set_enable_runtime_zip(self, enable: bool) -> typing.Self:
@@ -1145,6 +2081,84 @@ class JFLogger(object):
         self.__enableRuntimeZip: bool = enable
         return self
 
+    def set_enable_columnar_archive(self, enable: bool) -> typing.Self:
+        """
+        Set whether to convert the rotated log files into columnar archives
+
+        The conversion runs in the background after rotation, the archive `<log file name>.jfcol` is written
+        beside the log file, before the log file is compressed. Read it with `JFLogColumnarArchive`.
+        The archives are removed by the file count and days limits like the log files, they are counted separately.
+
+        - Args:
+            - enable(bool): Whether to convert the rotated log files
+        """
+        if not isinstance(enable, bool):
+            error_text = ansi_color_text(f"enable must be bool, but {type(enable)} was given.", 33)
+            raise TypeError(error_text)
+        self.__enableColumnarArchive: bool = enable
+        return self
+
+    def set_backlog_compression(self, threshold: int = _Log_Default.BACKLOG_THRESHOLD, max_workers: int = 0,
+                                niceness: int = _Log_Default.BACKLOG_NICENESS) -> typing.Self:
+        """
+        Set the backlog mode of the runtime compression
+
+        If at least `threshold` rotated files are waiting, e.g. after runtime zip is enabled later or after an outage,
+        they are processed by a pool of worker processes instead of one by one. The files are split into one part
+        per worker, and each worker runs the whole work of its part:
+
+            - It converts the files into columnar archives, if `set_enable_columnar_archive(True)` is set
+            - It deflates the files into a new archive `<name>--Compressed-<n>.zip` beside `zip_file_path`,
+                if runtime zip is enabled, and then removes the log files
+
+        This process only waits for the workers and logs their failures. The backlog is not added to `zip_file_path`,
+        so the existing archive is neither copied nor rewritten, however large it is. `search` reads all the archives.
+
+        The workers are started with `spawn`, which imports the `__main__` module of the application in each worker,
+        so a script which creates its loggers at the top level must guard its code with `if __name__ == '__main__':`.
+        If the pool breaks nevertheless, the remaining parts are processed one after another in this process.
+
+        - Args:
+            - threshold(int): The count of waiting files to start the backlog mode, -1 to disable it, this is the default
+            - max_workers(int): The count of the worker processes, 0 for the count of CPUs
+            - niceness(int): The increment of the niceness of the worker processes, only on POSIX
+        """
+        for arg_name, value in (('threshold', threshold), ('max_workers', max_workers), ('niceness', niceness)):
+            if not isinstance(value, int) or isinstance(value, bool):
+                error_text = ansi_color_text(f"{arg_name} must be int, but {type(value)} was given.", 33)
+                raise TypeError(error_text)
+        if max_workers < 0 or niceness < 0:
+            error_text = ansi_color_text(f"max_workers and niceness must not be negative, but {max_workers} and {niceness} were given.", 33)
+            raise ValueError(error_text)
+        self.__backlog_threshold = threshold
+        self.__backlog_max_workers = max_workers
+        self.__backlog_niceness = niceness
+        return self
+
+    def set_signal_batching(self, max_rate: float = _Log_Default.SIGNAL_MAX_RATE,
+                            max_pending: int = _Log_Default.SIGNAL_MAX_PENDING) -> typing.Self:
+        """
+        Set the delivery of the batch signals `signal_format_batch`, `signal_colorized_batch` and `signal_message_batch`
+
+        The records are buffered and emitted as lists at most `max_rate` times per second.
+        If more than `max_pending` records are waiting, the oldest ones are dropped and counted in
+        `overflow_count` of the sinks, e.g. `Log.sinks`.
+
+        - Args:
+            - max_rate(float): The maximum emits per second of each batch signal
+            - max_pending(int): The maximum records waiting for each batch signal, -1 for no limit
+
+        Example:
+
+            Log.set_signal_batching(max_rate=30, max_pending=5000)
+
+            Log.signal_colorized_batch.connect(lambda records: text_browser.append(''.join(text for _, text in records)))
+        """
+        for sink in self.__signal_sinks:
+            if isinstance(sink, BatchedSignalSink):
+                sink.set_rate(max_rate, max_pending)
+        return self
+
     # def set_enable_startup_zip(self, enable: bool) -> typing.Self:
     #     """
     #     Set whether to compress log files before running
@@ -1219,6 +2233,7 @@ class JFLogger(object):
             self.__log_folder_name: str = os.path.basename(self.__log_dir)
             self.__hasWrittenFirstFile = True
             self.__isNewFile = False
+            self.__update_rollover_deadline()
         return self
 
     def set_message_format(self, message_format: str) -> typing.Self:
@@ -1261,6 +2276,7 @@ class JFLogger(object):
             self.__message_format = _Log_Default.MESSAGE_FORMAT
         else:
             self.__message_format: str = message_format
+        self.__format_fields = _parse_format_fields(self.__message_format)
         return self
 
     def set_highlight_type(self, highlight_type: LogHighlightType) -> typing.Self:
@@ -1296,6 +2312,167 @@ class JFLogger(object):
         self.__enableTracebackException = enable
         return self
 
+    def set_enable_exception_dedup(self, enable: bool, repeat_every: int = 0) -> typing.Self:
+        """
+        Set whether to deduplicate the exceptions logged by exception()
+
+        Exceptions are fingerprinted by the type, the code objects and the line numbers of the traceback.
+        The full text is written at the first occurrence, later occurrences are replaced with a short reference
+        `[repeated exception #<id>, occurrence <count>]`.
+
+        - Args:
+            - enable(bool): Whether to deduplicate the exceptions
+            - repeat_every(int): Write the full text again every `repeat_every` occurrences, i.e. at the occurrences
+                1, repeat_every + 1, 2 * repeat_every + 1, ..., 0 for never, this is the default.
+                The formatted text is cached and reused.
+        """
+        if not isinstance(repeat_every, int) or isinstance(repeat_every, bool):
+            error_text = ansi_color_text(f"repeat_every must be int, but {type(repeat_every)} was given.", 33)
+            raise TypeError(error_text)
+        if repeat_every < 0:
+            error_text = ansi_color_text(f"repeat_every must not be negative, but {repeat_every} was given.", 33)
+            raise ValueError(error_text)
+        self.__enableExceptionDedup = enable
+        self.__exception_repeat_every = repeat_every
+        with self.__exception_cache_lock:
+            self.__exception_cache.clear()
+        return self
+
+    def set_message_truncation(self, max_chars: int = -1, max_depth: int = -1, max_items: int = -1,
+                               marker: str = _Log_Default.TRUNCATION_MARKER) -> typing.Self:
+        """
+        Set the size limits for rendering the message parameters, default is no limit.
+
+        - Args:
+            - max_chars(int): The maximum characters of each rendered parameter,
+                the rest is replaced with the marker
+            - max_depth(int): The maximum nesting depth of rendered dict, list and tuple parameters
+            - max_items(int): The maximum items of each rendered dict, list and tuple, if it is given,
+                containers are rendered in one line and only the rendered items are visited
+            - marker(str): The elision marker, `{count}` is replaced with the count of truncated characters
+        """
+        for name, value in (('max_chars', max_chars), ('max_depth', max_depth), ('max_items', max_items)):
+            if not isinstance(value, int):
+                error_text = ansi_color_text(f"{name} must be int, but {type(value)} was given.", 33)
+                raise TypeError(error_text)
+        if not isinstance(marker, str):
+            error_text = ansi_color_text(f"marker must be str, but {type(marker)} was given.", 33)
+            raise TypeError(error_text)
+        self.__truncate_max_chars = max_chars
+        self.__truncate_max_depth = max_depth
+        self.__truncate_max_items = max_items
+        self.__truncation_marker = marker
+        if max_items > 0:
+            limiter = reprlib.Repr()
+            limiter.maxlevel = max_depth if max_depth > 0 else limiter.maxlevel
+            limiter.maxtuple = limiter.maxlist = limiter.maxdict = limiter.maxset = limiter.maxfrozenset = max_items
+            limiter.maxdeque = limiter.maxarray = max_items
+            limiter.maxstring = limiter.maxother = limiter.maxlong = max_chars if max_chars > 0 else sys.maxsize
+            self.__repr_limiter = limiter
+        else:
+            self.__repr_limiter = None
+        return self
+
+    def set_profiler(self, enable: bool, sample_rate: float = _Log_Default.PROFILER_SAMPLE_RATE,
+                     callback: typing.Optional[typing.Callable[[str, dict], None]] = None) -> typing.Self:
+        """
+        Set whether to time the stages of the records, the results are collected by `profiler`
+
+        - Args:
+            - enable(bool): Whether to enable the profiler
+            - sample_rate(float): The share of the records to be timed, e.g. 0.01 for every 100th record
+            - callback(Callable): Called with the log name and the timings {stage: seconds} of each sampled record
+
+        Example:
+
+            Log.set_profiler(True, sample_rate=0.01)
+
+            print(Log.profiler.percentiles((50, 99)))
+        """
+        if not isinstance(enable, bool):
+            error_text = ansi_color_text(f"enable must be bool, but {type(enable)} was given.", 33)
+            raise TypeError(error_text)
+        self.__profiler = JFLogProfiler(sample_rate, callback) if enable else None
+        return self
+
+    def set_stacklevel(self, stacklevel: typing.Optional[int]) -> typing.Self:
+        """
+        Set the default stacklevel of the log calls.
+
+        With a stacklevel, the caller frame is taken directly by its depth, instead of walking the stack
+        and checking the exclusion rules for each frame. The class name is then taken from the qualified name
+        of the function. The `stacklevel` argument of a log call takes precedence over this default.
+
+        - Args:
+            - stacklevel(int): 1 is the caller of the log method, 2 is its caller, and so on.
+                None to find the caller by the stack walk, this is the default.
+
+        Example:
+
+            def log_state(state):
+                Log.info('state', state, stacklevel=2)  # The record shows the caller of log_state
+        """
+        if stacklevel is not None and (not isinstance(stacklevel, int) or isinstance(stacklevel, bool) or stacklevel < 1):
+            error_text = ansi_color_text(f"stacklevel must be a positive int or None, but {stacklevel} was given.", 33)
+            raise ValueError(error_text)
+        self.__stacklevel = stacklevel
+        return self
+
+    def set_redaction(self, keys: typing.Iterable[str] = (),
+                      patterns: typing.Union[typing.Mapping[str, str], typing.Iterable[str]] = (),
+                      replacement: str = _Log_Default.REDACTION_REPLACEMENT) -> typing.Self:
+        """
+        Set the secrets to be redacted from the messages.
+
+        The keys and patterns are compiled into one expression, which is applied once to the message
+        before rendering, so the file, console, signals and sinks receive the same redacted message.
+        The hits of each key and pattern are counted in `redactor.hit_counts`.
+
+        - Args:
+            - keys(Iterable[str]): The keys whose values are redacted, e.g. `password` in `password=abc`
+            - patterns(Mapping[str, str] | Iterable[str]): The regular expressions to be redacted,
+                a mapping gives the names of the patterns, e.g. {'card': JFLogRedactor.CARD_NUMBER}
+            - replacement(str): The replacement of the secrets
+
+        If neither keys nor patterns are given, the redaction is disabled.
+
+        Example:
+
+            Log.set_redaction(keys=('password', 'token'), patterns={'card': JFLogRedactor.CARD_NUMBER})
+
+            Log.info('login password=hunter2')  # login password=***
+        """
+        if isinstance(keys, str):
+            keys = (keys,)
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        keys = tuple(keys)
+        patterns = dict(patterns) if isinstance(patterns, typing.Mapping) else tuple(patterns)
+        if not keys and not patterns:
+            self.__redactor = None
+        else:
+            self.__redactor = JFLogRedactor(keys, patterns, replacement)
+        return self
+
+    def set_message_chunk_size(self, chunk_size: int) -> typing.Self:
+        """
+        Set the size of the chunks to write huge messages.
+
+        Messages longer than the chunk size are written to the file and console chunk by chunk,
+        without joining the record into full strings.
+
+        - Args:
+            - chunk_size(int): The chunk size in characters
+        """
+        if not isinstance(chunk_size, int):
+            error_text = ansi_color_text(f"chunk_size must be int, but {type(chunk_size)} was given.", 33)
+            raise TypeError(error_text)
+        if chunk_size <= 0:
+            error_text = ansi_color_text(f"chunk_size must be greater than 0, but {chunk_size} was given.", 33)
+            raise ValueError(error_text)
+        self.__message_chunk_size = chunk_size
+        return self
+
 
 class Logger(JFLogger):
     """ 
@@ -1306,7 +2483,318 @@ class Logger(JFLogger):
     pass
 
 
+class JFLoggerAdapter(object):
+    """
+    A lightweight view of a JFLogger carrying its own context fields.
+
+    The adapter owns no queue, lock or file, all records are written by the wrapped JFLogger.
+    The context fields can be used in the message format like the custom parameters of JFLogger.
+
+    - Args:
+        - logger(JFLogger): The wrapped logger
+        - context(Mapping): The context fields of the adapter
+
+    - Attributes:
+        - logger: The wrapped logger
+        - context: The read-only context fields
+
+    - methods:
+        - bind(**context): Return a new adapter with the merged context fields
+        - <level>_once, <level>_every, <level>_every_seconds: See JFLogger, the records carry the context fields
+
+    Other attributes and methods are delegated to the wrapped logger.
+    """
+    __slots__ = ('__logger', '__context')
+
+    def __init__(self, logger: JFLogger, context: typing.Optional[typing.Mapping] = None) -> None:
+        self.__logger: JFLogger = logger
+        if isinstance(context, types.MappingProxyType):
+            self.__context: typing.Mapping = context
+        else:
+            self.__context: typing.Mapping = types.MappingProxyType(dict(context) if context else {})
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}<"{self.__logger.name}"> with context {dict(self.__context)} at 0x{id(self):016x}'
+
+    def __getattr__(self, name: str):
+        return getattr(self.__logger, name)
+
+    @property
+    def logger(self) -> JFLogger:
+        return self.__logger
+
+    @property
+    def context(self) -> typing.Mapping:
+        return self.__context
+
+    def bind(self, **context) -> 'JFLoggerAdapter':
+        """
+        Return a new adapter with the context fields of this adapter updated by the given ones.
+
+        The contexts are merged once here, this adapter is not changed.
+        """
+        if not context:
+            return self
+        merged_context = dict(self.__context)
+        merged_context.update(context)
+        return JFLoggerAdapter(self.__logger, types.MappingProxyType(merged_context))
+
+    def trace(self, *args, **kwargs) -> None:
+        self.__logger._log(LogLevel.TRACE, args, context=self.__context, _stack_depth=2, **kwargs)
+
+    def debug(self, *args, **kwargs) -> None:
+        self.__logger._log(LogLevel.DEBUG, args, context=self.__context, _stack_depth=2, **kwargs)
+
+    def info(self, *args, **kwargs) -> None:
+        self.__logger._log(LogLevel.INFO, args, context=self.__context, _stack_depth=2, **kwargs)
+
+    def warning(self, *args, **kwargs) -> None:
+        self.__logger._log(LogLevel.WARNING, args, context=self.__context, _stack_depth=2, **kwargs)
+
+    def error(self, *args, **kwargs) -> None:
+        self.__logger._log(LogLevel.ERROR, args, context=self.__context, _stack_depth=2, **kwargs)
+
+    def critical(self, *args, **kwargs) -> None:
+        self.__logger._log(LogLevel.CRITICAL, args, context=self.__context, _stack_depth=2, **kwargs)
+
+    def exception(self, *args, level: str | int = LogLevel.ERROR, **kwargs) -> None:
+        self.__logger.exception(*args, level=level, context=self.__context, _stack_depth=4, **kwargs)
+
+    def trace_once(self, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.TRACE, 'once', 0, args, kwargs, context=self.__context)
+
+    def trace_every(self, n: int, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.TRACE, 'every', n, args, kwargs, context=self.__context)
+
+    def trace_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.TRACE, 'every_seconds', seconds, args, kwargs, context=self.__context)
+
+    def debug_once(self, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.DEBUG, 'once', 0, args, kwargs, context=self.__context)
+
+    def debug_every(self, n: int, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.DEBUG, 'every', n, args, kwargs, context=self.__context)
+
+    def debug_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.DEBUG, 'every_seconds', seconds, args, kwargs, context=self.__context)
+
+    def info_once(self, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.INFO, 'once', 0, args, kwargs, context=self.__context)
+
+    def info_every(self, n: int, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.INFO, 'every', n, args, kwargs, context=self.__context)
+
+    def info_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.INFO, 'every_seconds', seconds, args, kwargs, context=self.__context)
+
+    def warning_once(self, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.WARNING, 'once', 0, args, kwargs, context=self.__context)
+
+    def warning_every(self, n: int, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.WARNING, 'every', n, args, kwargs, context=self.__context)
+
+    def warning_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.WARNING, 'every_seconds', seconds, args, kwargs, context=self.__context)
+
+    def error_once(self, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.ERROR, 'once', 0, args, kwargs, context=self.__context)
+
+    def error_every(self, n: int, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.ERROR, 'every', n, args, kwargs, context=self.__context)
+
+    def error_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.ERROR, 'every_seconds', seconds, args, kwargs, context=self.__context)
+
+    def critical_once(self, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.CRITICAL, 'once', 0, args, kwargs, context=self.__context)
+
+    def critical_every(self, n: int, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.CRITICAL, 'every', n, args, kwargs, context=self.__context)
+
+    def critical_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__logger._log_limited(LogLevel.CRITICAL, 'every_seconds', seconds, args, kwargs, context=self.__context)
+
+
+class JFChildLogger(JFLoggerAdapter):
+    """
+    A named child of a JFLogger, created by `JFLogger.get_child()` or `JFLogger.get()`.
+
+    The child logger writes through the sinks of its root logger, the field `logName` is its own dotted name.
+    Without an own level, the level is inherited from the parent child logger, or from the root logger.
+
+    - Attributes:
+        - name: The dotted name of the child logger
+        - parent: The parent child logger or the root logger
+        - log_level: The own level, None if it is inherited
+
+    - methods:
+        - set_level(log_level): Set the own level of this child logger and its descendants, None to inherit it
+        - get_child(suffix): Return a child logger of this child logger
+        - <level>_once, <level>_every, <level>_every_seconds: See JFLogger, the level of the child logger applies
+    """
+    __slots__ = ('__name', '__parent', '__log_level', '__weakref__')
+
+    def __init__(self, logger: JFLogger, name: str, parent: typing.Union[JFLogger, 'JFChildLogger']) -> None:
+        super().__init__(logger, {'logName': name})
+        self.__name: str = name
+        self.__parent: typing.Union[JFLogger, JFChildLogger] = parent
+        self.__log_level: typing.Optional[int] = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}<"{self.__name}"> at 0x{id(self):016x}'
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def parent(self) -> typing.Union[JFLogger, 'JFChildLogger']:
+        return self.__parent
+
+    @property
+    def log_level(self) -> typing.Optional[int]:
+        return self.__log_level
+
+    def _effective_level(self) -> typing.Optional[int]:
+        """ Return the nearest own level of this child logger or its ancestors, None if the root level applies """
+        if self.__log_level is not None:
+            return self.__log_level
+        if isinstance(self.__parent, JFChildLogger):
+            return self.__parent._effective_level()
+        return None
+
+    def set_level(self, log_level: typing.Union[str, int, None]) -> typing.Self:
+        """
+        Set the own level of this child logger, the root logger is not changed
+
+        - Args:
+            - log_level(LogLevel): The log level, None to inherit the level of the parent
+        """
+        self.__log_level = None if log_level is None else LogLevel._normalize_log_level(log_level)
+        return self
+
+    def isEnabledFor(self, level: typing.Union[str, int]) -> bool:
+        level = LogLevel._normalize_log_level(level)
+        limit = self._effective_level()
+        if limit is None:
+            return self.logger.isEnabledFor(level)
+        return level >= limit
+
+    def get_child(self, suffix: str) -> 'JFChildLogger':
+        return self.logger.get_child(f'{self.__name[len(self.logger.name) + 1:]}.{suffix}')
+
+    def __log(self, level: int, args: tuple, kwargs: dict) -> None:
+        limit = self._effective_level()
+        if limit is not None:
+            if level < limit:
+                return
+            # The own level replaces the level of the root logger
+            kwargs['_sender'] = 'JFChildLogger'
+        self.logger._log(level, args, context=self.context, **kwargs)
+
+    def trace(self, *args, **kwargs) -> None:
+        self.__log(LogLevel.TRACE, args, kwargs)
+
+    def debug(self, *args, **kwargs) -> None:
+        self.__log(LogLevel.DEBUG, args, kwargs)
+
+    def info(self, *args, **kwargs) -> None:
+        self.__log(LogLevel.INFO, args, kwargs)
+
+    def warning(self, *args, **kwargs) -> None:
+        self.__log(LogLevel.WARNING, args, kwargs)
+
+    def error(self, *args, **kwargs) -> None:
+        self.__log(LogLevel.ERROR, args, kwargs)
+
+    def critical(self, *args, **kwargs) -> None:
+        self.__log(LogLevel.CRITICAL, args, kwargs)
+
+    def exception(self, *args, level: str | int = LogLevel.ERROR, **kwargs) -> None:
+        level = LogLevel._normalize_log_level(level)
+        limit = self._effective_level()
+        if limit is not None:
+            if level < limit:
+                return
+            kwargs['_sender'] = 'JFChildLogger'
+        self.logger.exception(*args, level=level, context=self.context, _stack_depth=4, **kwargs)
+
+    def __log_limited(self, level: int, mode: str, limit, args: tuple, kwargs: dict) -> None:
+        limit_level = self._effective_level()
+        if limit_level is not None:
+            if level < limit_level:
+                return
+            kwargs['_sender'] = 'JFChildLogger'
+        # _log_limited <- __log_limited <- <level>_once / _every / _every_seconds <- caller
+        self.logger._log_limited(level, mode, limit, args, kwargs, context=self.context, _stack_depth=3)
+
+    def trace_once(self, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.TRACE, 'once', 0, args, kwargs)
+
+    def trace_every(self, n: int, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.TRACE, 'every', n, args, kwargs)
+
+    def trace_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.TRACE, 'every_seconds', seconds, args, kwargs)
+
+    def debug_once(self, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.DEBUG, 'once', 0, args, kwargs)
+
+    def debug_every(self, n: int, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.DEBUG, 'every', n, args, kwargs)
+
+    def debug_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.DEBUG, 'every_seconds', seconds, args, kwargs)
+
+    def info_once(self, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.INFO, 'once', 0, args, kwargs)
+
+    def info_every(self, n: int, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.INFO, 'every', n, args, kwargs)
+
+    def info_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.INFO, 'every_seconds', seconds, args, kwargs)
+
+    def warning_once(self, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.WARNING, 'once', 0, args, kwargs)
+
+    def warning_every(self, n: int, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.WARNING, 'every', n, args, kwargs)
+
+    def warning_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.WARNING, 'every_seconds', seconds, args, kwargs)
+
+    def error_once(self, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.ERROR, 'once', 0, args, kwargs)
+
+    def error_every(self, n: int, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.ERROR, 'every', n, args, kwargs)
+
+    def error_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.ERROR, 'every_seconds', seconds, args, kwargs)
+
+    def critical_once(self, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.CRITICAL, 'once', 0, args, kwargs)
+
+    def critical_every(self, n: int, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.CRITICAL, 'every', n, args, kwargs)
+
+    def critical_every_seconds(self, seconds: float, *args, **kwargs) -> None:
+        self.__log_limited(LogLevel.CRITICAL, 'every_seconds', seconds, args, kwargs)
+
+
 class JFClassLogger:
+    """
+    The descriptor to define a logger in the class body.
+
+    - Args:
+        - The same as JFLogger, and
+        - isStaticLogger(bool): If True, all instances of the class share one JFLogger which is stored in the class.
+        - isSharedLogger(bool): If True, all instances share one JFLogger, but each instance gets a `JFLoggerAdapter`
+            with the context field `instanceId`, so creating an instance does not construct a logger.
+        Otherwise, each instance gets its own JFLogger.
+    """
+
     def __init__(
         self,
         log_name: str,
@@ -1317,10 +2805,14 @@ class JFClassLogger:
         enableConsoleOutput: bool = True,
         enableFileOutput: bool = True,
         isStaticLogger: bool = False,
+        isSharedLogger: bool = False,
         **kwargs,
     ) -> None:
         self.__log_name = log_name
         self.__isStaticLogger = isStaticLogger
+        self.__isSharedLogger = isSharedLogger
+        self.__shared_logger: typing.Optional[JFLogger] = None
+        self.__shared_logger_lock = threading.Lock()
         self.__root_dir = root_dir
         self.__root_folder_name = root_folder_name
         self.__log_folder_name = log_folder_name
@@ -1329,7 +2821,7 @@ class JFClassLogger:
         self.__enableFileOutput = enableFileOutput
         self.__kwargs = kwargs
 
-    def __get__(self, instance, instance_type) -> JFLogger:
+    def __get__(self, instance, instance_type) -> typing.Union[JFLogger, JFLoggerAdapter]:
         if instance is None:
             return self
         else:
@@ -1337,6 +2829,8 @@ class JFClassLogger:
             module_globals = module.__dict__
             if self.__isStaticLogger:
                 return self.__handle_class_logger(instance_type)
+            elif self.__isSharedLogger:
+                return self.__handle_shared_logger(instance)
             else:
                 return self.__handle_instance_logger(instance)
 
@@ -1353,32 +2847,37 @@ class JFClassLogger:
         if not hasattr(instance_type, '__class_logger__'):
             instance_type.__class_logger__ = {}
         if self not in instance_type.__class_logger__:
-            instance_type.__class_logger__[self] = JFLogger(
-                log_name=self.__log_name,
-                root_dir=self.__root_dir,
-                root_folder_name=self.__root_folder_name,
-                log_folder_name=self.__log_folder_name,
-                log_level=self.__log_level,
-                enableConsoleOutput=self.__enableConsoleOutput,
-                enableFileOutput=self.__enableFileOutput,
-                **self.__kwargs
-            )
+            instance_type.__class_logger__[self] = self.__create_logger()
         return instance_type.__class_logger__[self]
 
+    def __create_logger(self) -> JFLogger:
+        return JFLogger(
+            log_name=self.__log_name,
+            root_dir=self.__root_dir,
+            root_folder_name=self.__root_folder_name,
+            log_folder_name=self.__log_folder_name,
+            log_level=self.__log_level,
+            enableConsoleOutput=self.__enableConsoleOutput,
+            enableFileOutput=self.__enableFileOutput,
+            **self.__kwargs
+        )
+
+    def __handle_shared_logger(self, instance) -> JFLoggerAdapter:
+        if not hasattr(instance, '__logger__'):
+            instance.__logger__ = {}
+        if self not in instance.__logger__:
+            if self.__shared_logger is None:
+                with self.__shared_logger_lock:
+                    if self.__shared_logger is None:
+                        self.__shared_logger = self.__create_logger()
+            instance.__logger__[self] = JFLoggerAdapter(self.__shared_logger, {'instanceId': f'0x{id(instance):016x}'})
+        return instance.__logger__[self]
+
     def __handle_instance_logger(self, instance) -> JFLogger:
         if not hasattr(instance, '__logger__'):
             instance.__logger__ = {}
         if self not in instance.__logger__:
-            instance.__logger__[self] = JFLogger(
-                log_name=self.__log_name,
-                root_dir=self.__root_dir,
-                root_folder_name=self.__root_folder_name,
-                log_folder_name=self.__log_folder_name,
-                log_level=self.__log_level,
-                enableConsoleOutput=self.__enableConsoleOutput,
-                enableFileOutput=self.__enableFileOutput,
-                **self.__kwargs
-            )
+            instance.__logger__[self] = self.__create_logger()
         return instance.__logger__[self]
 
 
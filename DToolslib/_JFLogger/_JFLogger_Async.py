@@ -0,0 +1,267 @@
+import asyncio
+import contextlib
+import contextvars
+import queue
+import sys
+import threading
+import time
+import traceback
+import types
+import typing
+from ._LogEnum import LogLevel
+from ._JFLogger import JFLogger, _get_current_process_name, _caller_info_from_frame
+from ._Process_Manager import _ProcessManager
+
+_EMPTY_CONTEXT = types.MappingProxyType({})
+
+
+class _FlushMarker(object):
+    """ This class marks a position in the queue, the future is resolved when the writer reaches it. """
+    __slots__ = ('loop', 'future')
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, future: asyncio.Future) -> None:
+        self.loop = loop
+        self.future = future
+
+    def done(self) -> None:
+        def set_result() -> None:
+            if not self.future.done():
+                self.future.set_result(None)
+        try:
+            self.loop.call_soon_threadsafe(set_result)
+        except RuntimeError:  # The event loop is closed
+            pass
+
+
+class JFAsyncLogger(object):
+    """
+    The asyncio front end of JFLogger.
+
+    The log methods never block the event loop: they only collect the caller information and hand the record
+    over to a writer thread, which does the formatting, file I/O and signal dispatch with the wrapped JFLogger.
+
+    - Args:
+        - logger(JFLogger): The wrapped logger
+        - max_pending(int): The maximum count of records waiting for the writer, default is no limit.
+            Records exceeding the limit are dropped and counted in `dropped_count`.
+
+    - Attributes:
+        - logger: The wrapped logger
+        - context: The context fields of the current task
+        - dropped_count: The count of dropped records
+
+    - methods:
+        - trace(*message), debug(*message), info(*message), warning(*message), error(*message), critical(*message)
+        - exception(*message, level=LogLevel.ERROR): The exception is formatted by the writer
+        - bind_context(**context): Set context fields for the current task, return a token for `reset_context`
+        - reset_context(token): Restore the context fields
+        - contextualize(**context): Context manager to set context fields for the current task
+        - aflush(): Wait until all records handed over before are written
+        - close(): Stop the writer after the pending records are written
+
+    The field `taskName` (name of the current asyncio task) is provided for the message format.
+
+    Example:
+
+        Log = JFLogger('service', root_dir='D:/test')
+
+        ALog = JFAsyncLogger(Log)
+
+        async def handle(request_id):
+            with ALog.contextualize(requestId=request_id):
+                ALog.info('handled')
+            await ALog.aflush()
+    """
+
+    _shutdown_phase = 0
+
+    def __init__(self, logger: JFLogger, max_pending: int = -1) -> None:
+        self.__logger: JFLogger = logger
+        self.__max_pending: int = max_pending if isinstance(max_pending, int) else -1
+        self.__dropped_count: int = 0
+        self.__context_var: contextvars.ContextVar = contextvars.ContextVar(
+            f'JFAsyncLogger_context_{logger.name}', default=_EMPTY_CONTEXT)
+        self.__queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.__isClosed: bool = False
+        self.__writer_thread = threading.Thread(name=f'JFAsyncLoggerWriter-{logger.name}', target=self.__run_writer,
+                                                daemon=True)
+        self.__writer_thread.start()
+        _ProcessManager.register(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}<"{self.__logger.name}"> at 0x{id(self):016x}'
+
+    @property
+    def logger(self) -> JFLogger:
+        return self.__logger
+
+    @property
+    def context(self) -> typing.Mapping:
+        return self.__context_var.get()
+
+    @property
+    def dropped_count(self) -> int:
+        return self.__dropped_count
+
+    def __run_writer(self) -> None:
+        while True:
+            item = self.__queue.get()
+            if item is None:
+                break
+            if isinstance(item, _FlushMarker):
+                item.done()
+                continue
+            func, args, kwargs = item
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                if sys.stderr:
+                    sys.stderr.write(traceback.format_exc())
+
+    def __capture(self, level: int, kwargs: dict, depth: int) -> typing.Optional[dict]:
+        """
+        Collect the fields which must be taken on the event loop thread, return None if the record is rejected
+
+        - Args:
+            - depth(int): The depth of the frame calling the log method, relative to this method.
+                The `stacklevel` in kwargs, or the stacklevel of the logger, moves the frame further up
+        """
+        if self.__isClosed or not self.__logger._is_level_enabled(level):
+            return None
+        if self.__max_pending > 0 and self.__queue.qsize() >= self.__max_pending:
+            self.__dropped_count += 1
+            return None
+        stacklevel = kwargs.pop('stacklevel', None)
+        if stacklevel is None:
+            stacklevel = self.__logger.stacklevel or 1
+        try:
+            frame = sys._getframe(depth + max(stacklevel, 1) - 1)
+        except ValueError:  # The stack is not deep enough
+            frame = sys._getframe(depth)
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:  # No running event loop
+            task = None
+        extra = {'taskName': task.get_name() if task is not None else ''}
+        if kwargs.get('extra', None):
+            extra.update(kwargs['extra'])
+        kwargs['extra'] = extra
+        kwargs['context'] = self.__context_var.get()
+        kwargs['_sender'] = 'JFAsyncLogger'
+        caller_info = _caller_info_from_frame(frame)
+        caller_info['thread_name'] = threading.current_thread().name
+        caller_info['process_name'] = _get_current_process_name()
+        caller_info['created'] = time.time()
+        kwargs['caller_info'] = caller_info
+        return kwargs
+
+    def __enqueue(self, level: int, args: tuple, kwargs: dict) -> None:
+        kwargs = self.__capture(level, kwargs, 3)
+        if kwargs is None:
+            return
+        self.__queue.put((self.__logger._log, (level, args), kwargs))
+
+    def trace(self, *args, **kwargs) -> None:
+        self.__enqueue(LogLevel.TRACE, args, kwargs)
+
+    def debug(self, *args, **kwargs) -> None:
+        self.__enqueue(LogLevel.DEBUG, args, kwargs)
+
+    def info(self, *args, **kwargs) -> None:
+        self.__enqueue(LogLevel.INFO, args, kwargs)
+
+    def warning(self, *args, **kwargs) -> None:
+        self.__enqueue(LogLevel.WARNING, args, kwargs)
+
+    def error(self, *args, **kwargs) -> None:
+        self.__enqueue(LogLevel.ERROR, args, kwargs)
+
+    def critical(self, *args, **kwargs) -> None:
+        self.__enqueue(LogLevel.CRITICAL, args, kwargs)
+
+    def exception(self, *args, level: str | int = LogLevel.ERROR, **kwargs) -> None:
+        """
+        Log the current exception.
+
+        Only the exception info is taken on the event loop thread, the traceback is formatted by the writer.
+        """
+        level = LogLevel._normalize_log_level(level)
+        kwargs = self.__capture(level, kwargs, 2)
+        if kwargs is None:
+            return
+        kwargs['exc_info'] = sys.exc_info()
+        kwargs['level'] = level
+        self.__queue.put((self.__logger.exception, args, kwargs))
+
+    def bind_context(self, **context) -> contextvars.Token:
+        """
+        Set context fields for the current task and its child tasks, they are merged with the current fields.
+
+        - Args:
+            - **context: The context fields
+
+        - Returns:
+            - The token to restore the previous context with `reset_context`
+        """
+        merged_context = dict(self.__context_var.get())
+        merged_context.update(context)
+        return self.__context_var.set(types.MappingProxyType(merged_context))
+
+    def reset_context(self, token: contextvars.Token) -> None:
+        """
+        Restore the context fields changed by `bind_context`
+
+        - Args:
+            - token: The token returned by `bind_context`
+        """
+        self.__context_var.reset(token)
+
+    @contextlib.contextmanager
+    def contextualize(self, **context):
+        """
+        Context manager to set context fields for the current task
+
+        - Args:
+            - **context: The context fields
+        """
+        token = self.bind_context(**context)
+        try:
+            yield self
+        finally:
+            self.__context_var.reset(token)
+
+    async def aflush(self) -> None:
+        """ Wait until all records handed over before are written, without blocking the event loop """
+        if not self.__writer_thread.is_alive():
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__queue.put(_FlushMarker(loop, future))
+        await future
+
+    def _after_fork_in_child(self) -> None:
+        """ The writer thread does not exist in the child, start a new one with an empty queue """
+        self.__queue = queue.SimpleQueue()
+        if self.__isClosed:
+            return
+        self.__writer_thread = threading.Thread(name=f'JFAsyncLoggerWriter-{self.__logger.name}',
+                                                target=self.__run_writer, daemon=True)
+        self.__writer_thread.start()
+
+    def _shutdown(self, deadline: float) -> None:
+        """ Write the pending records before the process exits, it is called by the process manager """
+        self.close(max(0.0, deadline - time.monotonic()))
+
+    def close(self, timeout: typing.Optional[float] = None) -> None:
+        """
+        Stop the writer after the pending records are written
+
+        - Args:
+            - timeout(float): The maximum time to wait for the writer, default is no limit
+        """
+        if self.__isClosed:
+            return
+        self.__isClosed = True
+        self.__queue.put(None)
+        if threading.current_thread() is not self.__writer_thread:
+            self.__writer_thread.join(timeout)
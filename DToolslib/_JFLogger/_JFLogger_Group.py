@@ -7,12 +7,14 @@ from datetime import datetime
 import typing
 import zipfile
 import time
-import atexit
+import math
 from DToolslib import EventSignal
 from DToolslib.Color_Text import *
 from ._LogEnum import LogLevel, _ColorMap, _Log_Default
-from ._JFLogger import JFLogger
+from ._JFLogger import JFLogger, _next_rollover_deadline
 from ._Compressed_Thread import _CompressThread
+from ._Process_Manager import _ProcessManager
+from ._Log_Registry import _LoggerRegistry
 
 
 class JFLoggerGroup(object):
@@ -121,7 +123,7 @@ class JFLoggerGroup(object):
         self.__limit_files_days = limit_files_days if isinstance(limit_files_days, int) else -1
         self.__log_dir = os.path.join(self.__root_path, _Log_Default.GROUP_FOLDER_NAME)
         self.__current_size = 0
-        self.__current_day = datetime.today().date()
+        self.__rollover_deadline = math.inf
         self.__log_group = []
         self.__exclude_logs = exclude_logs if isinstance(exclude_logs, list) else []
         self.__isInitializationFinished = False
@@ -135,7 +137,7 @@ class JFLoggerGroup(object):
         self.__isStrictLimit = False
         self.__zip_file_path = ''
         self.set_log_group(log_group)
-        atexit.register(self.__compress_current_old_log_end)
+        _ProcessManager.register(self)
         self.__isInitializationFinished = True
 
     def set_root_dir(self, root_dir: str) -> typing.Self:
@@ -177,6 +179,7 @@ class JFLoggerGroup(object):
             - enable(bool): whether to split the log files daily        
         """
         self.__enableDailySplit: bool = enable
+        self.__rollover_deadline = _next_rollover_deadline(time.time(), self.__enableDailySplit)
         return self
 
     def set_enable_file_output(self, enable: bool) -> typing.Self:
@@ -318,14 +321,14 @@ class JFLoggerGroup(object):
         self.__connect_all()
 
     def __connect_all(self) -> None:
-        for log_obj in JFLogger.__instance_list__:
+        for log_obj in _LoggerRegistry.loggers(JFLogger):
             log_obj: JFLogger
             if log_obj in self.__exclude_logs:
                 continue
             self.__connect_single(log_obj)
 
     def __disconnect_all(self) -> None:
-        for log_obj in JFLogger.__instance_list__:
+        for log_obj in _LoggerRegistry.loggers(JFLogger):
             log_obj: JFLogger
             self.__disconnect_single(log_obj)
 
@@ -427,13 +430,37 @@ class JFLoggerGroup(object):
     def __compress_current_old_log_finished(self, thread_obj: _CompressThread):
         self.__compression_thread_pool.discard(thread_obj)
 
-    def __compress_current_old_log_end(self):
-        if not self.__enableRuntimeZip:
+    def _before_fork(self) -> None:
+        """ Hold the write lock during fork, so that no record is half written in the child """
+        self.__thread_lock.acquire()
+
+    def _after_fork_in_parent(self) -> None:
+        self.__thread_lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        """ Reinitialize the locks and queues inherited from the parent, the child writes to its own log file """
+        self.__thread_lock = threading.Lock()
+        self.__thread_compress_lock = threading.Lock()
+        self.__log_file_path_last_queue = queue.Queue()
+        self.__compression_thread_pool = set()
+        self.__hasWrittenFirstFile = False
+        self.__isNewFile = True
+        self.__zip_file_path = ''
+        self.__current_size = 0
+
+    def _shutdown(self, deadline: float) -> None:
+        """
+        Flush the pending messages and drain the compression work before the process exits.
+
+        It is called by the process manager at exit, the deadline is a `time.monotonic()` value.
+        """
+        for thread in list(self.__compression_thread_pool):
+            thread.join(max(0.0, deadline - time.monotonic()))
+        if not self.__enableRuntimeZip or not self.__hasWrittenFirstFile:
             return
         try:
             self.__log_file_path_last_queue.put(self.__log_file_path)
             self.__compress_current_old_log()
-            time.sleep(0.5)
         except:
             pass
 
@@ -447,15 +474,14 @@ class JFLoggerGroup(object):
                 self.__current_size += writting_size
                 if self.__current_size >= self.__limit_single_file_size_Bytes:
                     self.__isNewFile = True
-            if self.__enableDailySplit:
-                # Split by day
-                if datetime.today().date() != self.__current_day:
-                    self.__isNewFile = True
+            if time.time() >= self.__rollover_deadline:
+                # Split by day, the deadline is computed once per file
+                self.__isNewFile = True
             if self.__isNewFile:
                 # Create a new file
                 self.__isNewFile = False
                 self.__set_log_file_path()
-                self.__current_day = datetime.today().date()
+                self.__rollover_deadline = _next_rollover_deadline(time.time(), self.__enableDailySplit)
                 file_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 start_time = self.__start_time.strftime('%Y-%m-%d %H:%M:%S')
                 message = f"""{'#'*66}\n# <start time> This Program is started at\t {start_time}.\n# <file time> This log file is created at\t {file_time}.\n{'#'*66}\n\n{message}"""
@@ -47,12 +47,39 @@ class LogHighlightType(StaticEnum):
     NONE = None
 
 
+class LogRenderType(StaticEnum):
+    """ Render flavour enumeration class, it declares which rendered text a sink receives """
+    PLAIN = 'PLAIN'  # The formatted text without color
+    CONSOLE = 'CONSOLE'  # The formatted text with ANSI color
+    COLOR = 'COLOR'  # The formatted text with the color of the highlight type
+    MESSAGE = 'MESSAGE'  # The message without format
+
+
 class _Log_Default(StaticEnum):
     """ This class represents the default log level enumeration. """
     GROUP_FOLDER_NAME = '#Global_Log'
     HISTORY_FOLDER_NAME = '#History_Log'
     LIST_RESERVE_NAME = [GROUP_FOLDER_NAME, HISTORY_FOLDER_NAME]
     ROOT_FOLDER_NAME = 'Logs'
+    EXCEPTION_CACHE_SIZE = 1024
+    SHUTDOWN_TIMEOUT = 5
+    MESSAGE_CHUNK_SIZE = 65536
+    TRUNCATION_MARKER = ' ...<{count} chars truncated>'
+    CONSOLE_BUFFER_SIZE = 65536
+    CONSOLE_MAX_LATENCY = 0.05
+    SOCKET_BATCH_SIZE = 256
+    SOCKET_MAX_LATENCY = 0.05
+    SOCKET_SPILL_SIZE = 10000
+    SOCKET_BACKOFF_MIN = 0.1
+    SOCKET_BACKOFF_MAX = 30
+    SOCKET_CONNECT_TIMEOUT = 5
+    PROFILER_SAMPLE_RATE = 0.01
+    PROFILER_MAX_SAMPLES = 4096
+    REDACTION_REPLACEMENT = '***'
+    BACKLOG_THRESHOLD = 8
+    BACKLOG_NICENESS = 10
+    SIGNAL_MAX_RATE = 30
+    SIGNAL_MAX_PENDING = 10000
 
     # MESSAGE_FORMAT =  '%(consoleLine)s\n[%(asctime)s] [log: %(logName)s] [module: %(moduleName)s] [class: %(className)s] [function: %(functionName)s] [line: %(lineNum)s]- %(levelName)s\n%(message)s\n'
 
@@ -101,7 +128,12 @@ class _ColorMap(StaticEnum):
 
 
 class _LogMessageItem(object):
-    """ This class is used to store the log message item. """
+    """
+    This class is used to store the log message item.
+
+    The colored and console texts are rendered on the first access after `set_text`,
+    so the flavours which are not needed by any sink are never rendered.
+    """
 
     def __init__(self, title, text='', font_color=None, background_color=None, dim=False, bold=False, italic=False, underline=False, blink=False, highlight_type=None) -> None:
         self.__title = title
@@ -129,20 +161,24 @@ class _LogMessageItem(object):
 
     @property
     def text_color(self) -> str:
+        if self.__text_color is None:
+            self.__text_color = self.__colorize_text(self.__text, self.__color_font, self.__color_background, self.__bold, self.__dim, self.__italic, self.__underline, self.__blink)
         return self.__text_color
 
     @property
     def text_console(self) -> str:
+        if self.__text_console is None:
+            text_color: _ColorMapItem = self.__color_font
+            background_color: _ColorMapItem = self.__color_background
+            ansi_text_color = text_color.ANSI_TXT if text_color else ''
+            ansi_background_color = background_color.ANSI_BG if background_color else ''
+            self.__text_console = ansi_color_text(self.__text, ansi_text_color, ansi_background_color, self.__bold, self.__dim, self.__italic, self.__underline, self.__blink)
         return self.__text_console
 
     def set_text(self, text) -> None:
         self.__text = text
-        text_color: _ColorMapItem = self.__color_font
-        background_color: _ColorMapItem = self.__color_background
-        ansi_text_color = text_color.ANSI_TXT if text_color else ''
-        ansi_background_color = background_color.ANSI_BG if background_color else ''
-        self.__text_color = self.__colorize_text(self.__text, text_color, background_color, self.__bold, self.__dim, self.__italic, self.__underline, self.__blink)
-        self.__text_console = ansi_color_text(text, ansi_text_color, ansi_background_color, self.__bold, self.__dim, self.__italic, self.__underline, self.__blink)
+        self.__text_color = None
+        self.__text_console = None
 
     def __colorize_text(self, text: str, text_color: _ColorMapItem, background_color: _ColorMapItem, *args, highlight_type=None, **kwargs) -> str:
         if highlight_type is None:
@@ -161,3 +197,4 @@ class _LogMessageItem(object):
 
     def set_highlight_type(self, highlight_type: LogHighlightType) -> None:
         self.__highlight_type: LogHighlightType = highlight_type
+        self.__text_color = None
@@ -0,0 +1,144 @@
+import concurrent.futures
+import multiprocessing
+import os
+import typing
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+from ._Log_Columnar import JFLogColumnarArchive
+
+
+def _init_worker(niceness: int) -> None:
+    """ Lower the CPU priority of the worker process, so the conversion does not slow down the application """
+    if niceness and hasattr(os, 'nice'):
+        try:
+            os.nice(niceness)
+        except OSError:
+            pass
+
+
+def _convert_rotated_file(path: str, message_format: str) -> None:
+    """ Convert one rotated log file into a columnar archive """
+    JFLogColumnarArchive.convert(path, os.path.splitext(path)[0] + '.jfcol', message_format)
+
+
+def _write_archive(paths: list, archive_path: str, compresslevel: int) -> None:
+    """
+    Compress the log files into a new archive.
+
+    The archive is written to a temporary file, which then replaces the archive,
+    so the archive contains either all or none of them, even if the process is killed meanwhile.
+    """
+    temp_path = f'{archive_path}.tmp'
+    with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zipf:
+        for path in paths:
+            zipf.write(path, arcname=os.path.basename(path))
+    os.replace(temp_path, archive_path)
+
+
+def _process_rotated_files(paths: list, message_format: typing.Optional[str], archive_path: typing.Optional[str],
+                           compresslevel: int) -> list:
+    """
+    Convert a part of the rotated log files, and compress them into their own archive, it runs in a worker process
+
+    - Returns:
+        - The failures as a list of (path, exception)
+    """
+    # The files are gone if this part was already done before the pool broke
+    paths = [path for path in paths if os.path.exists(path)]
+    failures = []
+    if message_format is not None:
+        # A failed conversion does not keep the file from being compressed, as with a single rotated file
+        for path in paths:
+            try:
+                _convert_rotated_file(path, message_format)
+            except Exception as e:
+                failures.append((path, e))
+    if archive_path is None or not paths:
+        return failures
+    try:
+        _write_archive(paths, archive_path, compresslevel)
+    except Exception as e:
+        return failures + [(path, e) for path in paths]
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError as e:
+            failures.append((path, e))
+    return failures
+
+
+def _new_archive_paths(zip_path: str, count: int) -> list:
+    """ The paths of new archives beside the archive of the logger, e.g. `<name>--Compressed-1.zip` """
+    base_path = os.path.splitext(zip_path)[0]
+    archive_paths = []
+    index = 1
+    while len(archive_paths) < count:
+        archive_path = f'{base_path}-{index}.zip'
+        if not os.path.exists(archive_path):
+            archive_paths.append(archive_path)
+        index += 1
+    return archive_paths
+
+
+def compress_backlog(paths: list, zip_path: str, message_format: typing.Optional[str], enableZip: bool,
+                     max_workers: int = 0, niceness: int = 0, compresslevel: int = 6) -> list:
+    """
+    Convert and compress the rotated log files in a process pool
+
+    The files are split into one part per worker. Each worker converts the files of its part into columnar archives,
+    if a message format is given, and deflates them into a new archive `<name>--Compressed-<n>.zip` beside the archive
+    of the logger, then it removes the log files. Both the conversion and the compression run in the workers,
+    this process only assigns the parts and collects the failures. The archive of the logger is not rewritten,
+    since `zipfile` cannot add compressed members written by another process to an existing archive.
+    Without compression, each file is converted by a worker of its own.
+
+    The workers are started with `spawn`, which imports the `__main__` module of the application in each worker.
+    A script which creates its loggers at the top level must guard its code with `if __name__ == '__main__':`.
+    If the pool breaks nevertheless, the remaining parts are processed in this process.
+
+    - Args:
+        - paths(list): The rotated log files
+        - zip_path(str): The archive of the logger
+        - message_format(str): The message format to convert the files into columnar archives, None to skip it
+        - enableZip(bool): Whether to compress the files
+        - max_workers(int): The count of the worker processes, 0 for the count of CPUs
+        - niceness(int): The increment of the niceness of the workers, only on POSIX
+        - compresslevel(int): The zlib compression level
+
+    - Returns:
+        - The failures as a list of (path, exception)
+    """
+    paths = [path for path in paths if os.path.exists(path)]
+    if not paths or (message_format is None and not enableZip):
+        return []
+    workers = min(max_workers if max_workers > 0 else (os.cpu_count() or 1), len(paths))
+    if enableZip:
+        # Contiguous parts, so the archive with the lower number contains the older files
+        size = -(-len(paths) // workers)
+        parts = [paths[idx:idx + size] for idx in range(0, len(paths), size)]
+        archive_paths = _new_archive_paths(zip_path, len(parts))
+    else:
+        parts = [[path] for path in paths]
+        archive_paths = [None] * len(parts)
+    tasks = list(zip(parts, archive_paths))
+    failures = []
+    if workers > 1:
+        # The workers are spawned, since forking a process with running threads is not safe
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                                    initializer=_init_worker, initargs=(niceness,)) as executor:
+            futures = {executor.submit(_process_rotated_files, part, message_format, archive_path, compresslevel): idx
+                       for idx, (part, archive_path) in enumerate(tasks)}
+            remaining = set(futures.values())
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    failures.extend(future.result())
+                except BrokenProcessPool:
+                    # e.g. a worker died while importing `__main__`, the remaining parts are processed in this process
+                    break
+                except Exception as e:
+                    failures.extend((path, e) for path in tasks[futures[future]][0])
+                remaining.discard(futures[future])
+        tasks = [tasks[idx] for idx in sorted(remaining)]
+    for part, archive_path in tasks:
+        failures.extend(_process_rotated_files(part, message_format, archive_path, compresslevel))
+    return failures
@@ -0,0 +1,350 @@
+import array
+import collections
+import math
+import os
+import re
+import struct
+import sys
+import time
+import typing
+import zlib
+from DToolslib.Color_Text import *
+
+_MAGIC = b'JFCOL1'
+# Archive header: row count, column count. Column header: kind, payload length. All in little-endian.
+_ARCHIVE_HEADER = struct.Struct('<IH')
+_COLUMN_HEADER = struct.Struct('<BI')
+_NAME_HEADER = struct.Struct('<H')
+_LENGTH = struct.Struct('<I')
+_KIND_FLOAT = 0
+_KIND_INT = 1
+_KIND_DICT = 2
+_FORMAT_FIELD_PATTERN = re.compile(r'%\((.*?)\)(\.\d+)?([sdfxXobeEgGc%])')
+_CONSOLE_LINE_PATTERN = re.compile(r'line (\d+)')
+
+# Column name -> (field of the message format, kind)
+_COLUMNS = {
+    'timestamp': ('asctime', _KIND_FLOAT),
+    'level'    : ('levelName', _KIND_DICT),
+    'logger'   : ('logName', _KIND_DICT),
+    'module'   : ('moduleName', _KIND_DICT),
+    'function' : ('functionName', _KIND_DICT),
+    'line'     : ('lineNum', _KIND_INT),
+    'message'  : ('message', _KIND_DICT),
+}
+
+
+def _build_record_patterns(message_format: str) -> tuple:
+    """
+    Build the expressions matching one record and the start of a record written with the message format.
+
+    The fields are matched within one line, only the message may span lines. It ends where the next record starts.
+    The expressions are returned as str, so they can be compiled for str or bytes.
+
+    - Returns:
+        - (record expression, start expression)
+    """
+    fields = []
+    start_parts = []
+    pos = 0
+    for match in _FORMAT_FIELD_PATTERN.finditer(message_format):
+        fields.append((message_format[pos:match.start()], match.group(1)))
+        pos = match.end()
+    tail = message_format[pos:] + '\n'
+    parts = ['^']
+    seen = set()
+    hasMessage = False
+    for literal, name in fields:
+        literal = re.escape(literal.replace('%%', '%'))
+        parts.append(literal)
+        if not hasMessage:
+            start_parts.append(literal)
+        if name == 'message' and not hasMessage:
+            parts.append(r'(?P<message>.*?)')
+            hasMessage = True
+            continue
+        if name.isidentifier() and name not in seen and name != 'message':
+            seen.add(name)
+            parts.append(rf'(?P<{name}>[^\n]*?)')
+        else:
+            parts.append(r'[^\n]*?')
+        if not hasMessage:
+            start_parts.append(r'[^\n]*?')
+    parts.append(re.escape(tail.replace('%%', '%')))
+    if not hasMessage:
+        return ''.join(parts), '^' + ''.join(start_parts)
+    # The message ends at the start of the next record or at the end of the file
+    parts.append(rf'(?=(?:{"".join(start_parts)})|\Z)')
+    return ''.join(parts), '^' + ''.join(start_parts)
+
+
+def _compile_record_pattern(message_format: str) -> re.Pattern:
+    return re.compile(_build_record_patterns(message_format)[0], re.MULTILINE | re.DOTALL)
+
+
+class _AsctimeParser(object):
+    """ This class parses the `asctime` field into an epoch, the epoch of each second is cached """
+
+    def __init__(self) -> None:
+        self.__cache: dict = {}
+
+    def parse(self, asctime: str) -> float:
+        """ Return the epoch of `%Y-%m-%d %H:%M:%S.fff`, or NaN if it is not a time """
+        second = asctime[:19]
+        epoch = self.__cache.get(second, None)
+        if epoch is None:
+            try:
+                epoch = time.mktime(time.strptime(second, '%Y-%m-%d %H:%M:%S'))
+            except ValueError:
+                epoch = math.nan
+            if len(self.__cache) > 4096:
+                self.__cache.clear()
+            self.__cache[second] = epoch
+        fraction = asctime[20:]
+        return epoch + int(fraction) / 10 ** len(fraction) if fraction.isdigit() else epoch
+
+
+def _to_little_endian(values: array.array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class JFLogColumnarArchive(object):
+    """
+    This class reads the columnar archive of a rotated log file.
+
+    The archive stores the columns `timestamp`, `level`, `logger`, `module`, `function`, `line` and `message`
+    separately, each one compressed with zlib. The string columns are dictionary encoded, so the repeated values,
+    e.g. levels and modules, are stored once and the rows only keep the integer codes.
+    The aggregate queries work on the codes and do not decode the strings of each row.
+
+    The archive is written by `JFLogColumnarArchive.convert()`, which JFLogger calls on rotation
+    if `set_enable_columnar_archive(True)` is set.
+
+    Archive format (little-endian):
+        - b'JFCOL1', row count (uint32), column count (uint16)
+        - per column: name length (uint16), UTF-8 name, kind (uint8), payload length (uint32), zlib payload
+        - payload of float and int columns: float64 / int64 values
+        - payload of dictionary columns: value count (uint32), values as length (uint32) and UTF-8 text, uint32 codes
+
+    - Args:
+        - path(str): The path of the archive
+
+    - methods:
+        - read(columns): Load the selected columns, as `array` for numbers and as list for strings
+        - read_codes(column): Load the codes and the dictionary of a string column
+        - count_by(*columns, interval): Count the rows grouped by the columns, optionally per time interval
+
+    Example:
+
+        archive = JFLogColumnarArchive('Logs/app/app-[20250101_000000]-[1-2]--0.jfcol')
+
+        archive.count_by('level', 'module', interval=60)  # {(minute, level, module): count}
+    """
+
+    def __init__(self, path: str) -> None:
+        self.__path: str = path
+        self.__columns: dict = {}
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:len(_MAGIC)] != _MAGIC:
+            error_text = ansi_color_text(f'<ERROR> "{path}" is not a columnar log archive.', 33)
+            raise ValueError(error_text)
+        offset = len(_MAGIC)
+        self.__row_count, column_count = _ARCHIVE_HEADER.unpack_from(data, offset)
+        offset += _ARCHIVE_HEADER.size
+        for _ in range(column_count):
+            (name_length,) = _NAME_HEADER.unpack_from(data, offset)
+            offset += _NAME_HEADER.size
+            name = data[offset:offset + name_length].decode('utf-8')
+            offset += name_length
+            kind, length = _COLUMN_HEADER.unpack_from(data, offset)
+            offset += _COLUMN_HEADER.size
+            # The payload is only decompressed when the column is read
+            self.__columns[name] = (kind, data[offset:offset + length])
+            offset += length
+        self.__cache: dict = {}
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def columns(self) -> tuple:
+        return tuple(self.__columns)
+
+    @property
+    def row_count(self) -> int:
+        return self.__row_count
+
+    def __load(self, name: str):
+        if name not in self.__columns:
+            error_text = ansi_color_text(f'<ERROR> Column "{name}" does not exist, the columns are {self.columns}.', 33)
+            raise KeyError(error_text)
+        if name in self.__cache:
+            return self.__cache[name]
+        kind, payload = self.__columns[name]
+        payload = zlib.decompress(payload)
+        if kind == _KIND_FLOAT:
+            result = _from_little_endian('d', payload)
+        elif kind == _KIND_INT:
+            result = _from_little_endian('q', payload)
+        else:
+            (value_count,) = _LENGTH.unpack_from(payload, 0)
+            offset = _LENGTH.size
+            values = []
+            for _ in range(value_count):
+                (length,) = _LENGTH.unpack_from(payload, offset)
+                offset += _LENGTH.size
+                values.append(payload[offset:offset + length].decode('utf-8'))
+                offset += length
+            result = (_from_little_endian('I', payload[offset:]), values)
+        self.__cache[name] = result
+        return result
+
+    def read(self, columns: typing.Optional[typing.Iterable[str]] = None) -> dict:
+        """
+        Load the selected columns
+
+        - Args:
+            - columns(Iterable[str]): The names of the columns, all columns if None
+
+        - Returns:
+            - {name: values}, `array('d')` for timestamp, `array('q')` for line, and list of str for the others
+        """
+        result = {}
+        for name in (self.__columns if columns is None else columns):
+            loaded = self.__load(name)
+            if isinstance(loaded, tuple):
+                codes, values = loaded
+                result[name] = [values[code] for code in codes]
+            else:
+                result[name] = loaded
+        return result
+
+    def read_codes(self, column: str) -> tuple:
+        """
+        Load a string column without decoding the rows
+
+        - Returns:
+            - (codes, values), the value of row `i` is `values[codes[i]]`
+        """
+        loaded = self.__load(column)
+        if not isinstance(loaded, tuple):
+            error_text = ansi_color_text(f'<ERROR> Column "{column}" is not a string column.', 33)
+            raise TypeError(error_text)
+        return loaded
+
+    def count_by(self, *columns: str, interval: typing.Optional[float] = None) -> dict:
+        """
+        Count the rows grouped by the columns
+
+        - Args:
+            - columns(str): The names of the columns to group by
+            - interval(float): If given, the rows are grouped by the time interval in seconds as well,
+                the start of the interval is the first item of the keys
+
+        - Returns:
+            - {key tuple: count}
+        """
+        keys_columns = []
+        for name in columns:
+            loaded = self.__load(name)
+            keys_columns.append(loaded[0] if isinstance(loaded, tuple) else loaded)
+        if interval is not None:
+            buckets = array.array('d', (math.floor(ts / interval) * interval if ts == ts else ts
+                                        for ts in self.__load('timestamp')))
+            keys_columns.insert(0, buckets)
+        counter = collections.Counter(zip(*keys_columns))
+        # Decode the codes of the string columns only once per group
+        decoders = [None] * (interval is not None)
+        for name in columns:
+            loaded = self.__load(name)
+            decoders.append(loaded[1] if isinstance(loaded, tuple) else None)
+        result = {}
+        for key, count in counter.items():
+            result[tuple(value if decoder is None else decoder[value] for value, decoder in zip(key, decoders))] = count
+        return result
+
+    @classmethod
+    def convert(cls, log_path: str, archive_path: str, message_format: str) -> int:
+        """
+        Convert a log file into a columnar archive
+
+        The records are parsed with the message format they were written with. The text which is not a record,
+        e.g. the header of the file, is skipped. The fields missing from the format are stored as empty values.
+
+        - Args:
+            - log_path(str): The path of the log file
+            - archive_path(str): The path of the archive to be written, it is replaced atomically
+            - message_format(str): The message format of the records
+
+        - Returns:
+            - The count of the converted records
+        """
+        pattern = _compile_record_pattern(message_format)
+        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        group_names = pattern.groupindex
+        timestamps = array.array('d')
+        lines = array.array('q')
+        dictionaries = {name: {} for name, (_, kind) in _COLUMNS.items() if kind == _KIND_DICT}
+        codes = {name: array.array('I') for name in dictionaries}
+        asctime_parser = _AsctimeParser()
+        for match in pattern.finditer(text):
+            asctime = match.group('asctime').strip() if 'asctime' in group_names else ''
+            timestamps.append(asctime_parser.parse(asctime))
+            line_num = -1
+            if 'lineNum' in group_names and match.group('lineNum').strip().isdigit():
+                line_num = int(match.group('lineNum'))
+            elif 'consoleLine' in group_names:
+                line_match = _CONSOLE_LINE_PATTERN.search(match.group('consoleLine'))
+                if line_match is not None:
+                    line_num = int(line_match.group(1))
+            lines.append(line_num)
+            for name, dictionary in dictionaries.items():
+                field = _COLUMNS[name][0]
+                value = match.group(field) if field in group_names else ''
+                if name != 'message':
+                    value = value.strip()
+                code = dictionary.get(value, None)
+                if code is None:
+                    code = dictionary[value] = len(dictionary)
+                codes[name].append(code)
+        payloads = {}
+        for name, (_, kind) in _COLUMNS.items():
+            if kind == _KIND_FLOAT:
+                payloads[name] = (kind, _to_little_endian(timestamps))
+            elif kind == _KIND_INT:
+                payloads[name] = (kind, _to_little_endian(lines))
+            else:
+                values = [_LENGTH.pack(len(dictionaries[name]))]
+                for value in dictionaries[name]:
+                    data = value.encode('utf-8')
+                    values.append(_LENGTH.pack(len(data)))
+                    values.append(data)
+                values.append(_to_little_endian(codes[name]))
+                payloads[name] = (kind, b''.join(values))
+        temp_path = f'{archive_path}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(_ARCHIVE_HEADER.pack(len(timestamps), len(payloads)))
+            for name, (kind, payload) in payloads.items():
+                payload = zlib.compress(payload)
+                name_bytes = name.encode('utf-8')
+                f.write(_NAME_HEADER.pack(len(name_bytes)))
+                f.write(name_bytes)
+                f.write(_COLUMN_HEADER.pack(kind, len(payload)))
+                f.write(payload)
+        os.replace(temp_path, archive_path)
+        return len(timestamps)
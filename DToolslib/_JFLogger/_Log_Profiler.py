@@ -0,0 +1,97 @@
+import collections
+import itertools
+import math
+import typing
+from DToolslib.Color_Text import *
+from ._LogEnum import _Log_Default
+
+
+class JFLogProfiler(object):
+    """
+    This class samples the time spent in each stage of the records of a logger.
+
+    Every `1 / sample_rate`-th record is timed, the other records only cost one counter increment.
+    The stages are:
+        - level_gate: The level filter
+        - message: Rendering the message parameters
+        - redaction: Redacting the secrets from the message, only if the redaction is set
+        - caller_lookup: Finding the caller frame
+        - field_collection: Collecting the fields of the message format
+        - rendering: Rendering the message format in the flavours needed by the sinks
+        - sink:<name>: Each sink, e.g. `sink:<log name>.file`, `sink:<log name>.console`, `sink:<log name>.signal_format`.
+            For threaded sinks, only the handover to the worker is timed.
+
+    The latest `max_samples` timings of each stage are kept to compute the percentiles.
+
+    - Args:
+        - sample_rate(float): The share of the records to be timed, between 0 and 1
+        - callback(Callable): Called with the log name and the timings {stage: seconds} of each sampled record
+        - max_samples(int): The maximum timings kept per stage
+
+    - methods:
+        - percentiles(percents): Return the percentiles in seconds of each stage
+        - reset(): Clear the collected timings
+    """
+
+    def __init__(self, sample_rate: float = _Log_Default.PROFILER_SAMPLE_RATE,
+                 callback: typing.Optional[typing.Callable[[str, dict], None]] = None,
+                 max_samples: int = _Log_Default.PROFILER_MAX_SAMPLES) -> None:
+        if not isinstance(sample_rate, (int, float)) or not 0 < sample_rate <= 1:
+            error_text = ansi_color_text(f"sample_rate must be a number in (0, 1], but {sample_rate} was given.", 33)
+            raise ValueError(error_text)
+        self.__interval: int = max(1, round(1 / sample_rate))
+        self.__counter = itertools.count()
+        self.__callback = callback
+        self.__max_samples: int = max_samples
+        self.__samples: dict = {}
+        self.__sampled_count: int = 0
+
+    @property
+    def sample_rate(self) -> float:
+        return 1 / self.__interval
+
+    @property
+    def sampled_count(self) -> int:
+        return self.__sampled_count
+
+    def _should_sample(self) -> bool:
+        return next(self.__counter) % self.__interval == 0
+
+    def _finish(self, log_name: str, timings: dict) -> None:
+        """ Store the timings of a sampled record """
+        self.__sampled_count += 1
+        for stage, seconds in timings.items():
+            samples = self.__samples.get(stage, None)
+            if samples is None:
+                samples = self.__samples.setdefault(stage, collections.deque(maxlen=self.__max_samples))
+            samples.append(seconds)
+        if self.__callback is not None:
+            self.__callback(log_name, timings)
+
+    def percentiles(self, percents: typing.Iterable[float] = (50, 90, 99)) -> dict:
+        """
+        Return the percentiles of each stage
+
+        - Args:
+            - percents: The percentiles to compute, e.g. (50, 90, 99)
+
+        - Returns:
+            - {stage: {'count': int, 'mean': float, 'p50': float, ...}}, the times are in seconds
+        """
+        result = {}
+        for stage, samples in list(self.__samples.items()):
+            values = sorted(samples)
+            if not values:
+                continue
+            stats = {'count': len(values), 'mean': sum(values) / len(values)}
+            for percent in percents:
+                # Nearest-rank percentile
+                rank = max(1, math.ceil(percent / 100 * len(values)))
+                stats[f'p{percent:g}'] = values[min(rank, len(values)) - 1]
+            result[stage] = stats
+        return result
+
+    def reset(self) -> None:
+        """ Clear the collected timings """
+        self.__samples = {}
+        self.__sampled_count = 0
@@ -0,0 +1,147 @@
+import re
+import threading
+import typing
+from DToolslib.Color_Text import *
+from ._LogEnum import _Log_Default
+
+
+class JFLogRedactor(object):
+    """
+    This class redacts secrets from the log messages with one compiled regular expression.
+
+    The literal keys and the patterns are compiled into a single alternation, so a message is scanned once,
+    no matter how many patterns are configured. A message without any secret costs one `search`.
+
+    - Keys: The value following a key and `=` or `:` is replaced, the key itself is kept,
+        e.g. `password=abc` -> `password=***`, `"token": "abc"` -> `"token": "***"`
+    - Patterns: The whole match of the pattern is replaced
+
+    The hits of each key and pattern are counted for auditing.
+
+    - Args:
+        - keys(Iterable[str]): The literal keys whose values are redacted, matched as whole words
+        - patterns(Mapping[str, str] | Iterable[str]): The regular expressions to be redacted,
+            a mapping gives the names of the patterns in `hit_counts`, otherwise the pattern is its own name.
+            The patterns must not use numbered back references, since they are combined into one expression.
+            Their named groups are renamed in the combined expression, so two patterns may use the same group names
+        - replacement(str): The replacement of the secrets
+        - ignoreCase(bool): Whether the keys and patterns ignore the case
+
+    - methods:
+        - redact(text): Return the text with the secrets replaced
+        - reset_counts(): Reset the hit counters
+
+    Example:
+
+        redactor = JFLogRedactor(keys=('password', 'token'), patterns={'card': JFLogRedactor.CARD_NUMBER})
+
+        redactor.redact('login password=hunter2 card 4111 1111 1111 1111')
+
+        You will get: `login password=*** card ***`
+    """
+    CARD_NUMBER = r'\b(?:\d[ -]?){12,18}\d\b'
+    BEARER_TOKEN = r'\bBearer\s+[A-Za-z0-9\-._~+/]+=*'
+    # An escaped character, a named group or a named back reference of a pattern
+    __GROUP_SYNTAX = re.compile(r'\\.|\(\?P<(\w+)>|\(\?P=(\w+)\)', re.DOTALL)
+
+    def __init__(self, keys: typing.Iterable[str] = (), patterns: typing.Union[typing.Mapping[str, str], typing.Iterable[str]] = (),
+                 replacement: str = _Log_Default.REDACTION_REPLACEMENT, ignoreCase: bool = True) -> None:
+        if isinstance(keys, str):
+            keys = (keys,)
+        if isinstance(patterns, str):
+            patterns = (patterns,)
+        if not isinstance(replacement, str):
+            error_text = ansi_color_text(f"replacement must be str, but {type(replacement)} was given.", 33)
+            raise TypeError(error_text)
+        named_patterns = dict(patterns) if isinstance(patterns, typing.Mapping) else {pattern: pattern for pattern in patterns}
+        self.__keys: tuple = tuple(dict.fromkeys(keys))
+        self.__replacement: str = replacement
+        self.__ignoreCase: bool = ignoreCase
+        self.__flags: int = re.IGNORECASE if ignoreCase else 0
+        # Group name in the combined expression -> name in the hit counters
+        self.__group_names: dict = {}
+        alternatives = []
+        for idx, (name, pattern) in enumerate(named_patterns.items()):
+            try:
+                re.compile(pattern, self.__flags)
+            except re.error as e:
+                error_text = ansi_color_text(f'<ERROR> Redaction pattern "{name}" is invalid: {e}', 33)
+                raise ValueError(error_text) from None
+            self.__group_names[f'_p{idx}'] = name
+            alternatives.append(f'(?P<_p{idx}>{self.__rename_groups(pattern, f"_p{idx}_")})')
+        if self.__keys:
+            # The key and the separator are kept, only the value is replaced
+            key_names = '|'.join(re.escape(key) for key in sorted(self.__keys, key=len, reverse=True))
+            alternatives.insert(0, rf'''(?P<_key>\b(?P<_key_name>{key_names})\b["']?\s*[:=]\s*)'''
+                                   rf'''(?P<_key_value>"[^"]*"|'[^']*'|[^\s,;&"'}}]+)''')
+        try:
+            self.__pattern: typing.Optional[re.Pattern] = re.compile('|'.join(alternatives), self.__flags) if alternatives else None
+        except re.error as e:
+            error_text = ansi_color_text(f'<ERROR> Redaction patterns cannot be combined: {e}', 33)
+            raise ValueError(error_text) from None
+        self.__key_lookup: dict = {key.lower() if ignoreCase else key: key for key in self.__keys}
+        self.__hit_counts: dict = dict.fromkeys(self.__keys + tuple(named_patterns), 0)
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def __rename_groups(cls, pattern: str, prefix: str) -> str:
+        """ Prefix the named groups and their back references, so they are unique in the combined expression """
+        def rename(match: re.Match) -> str:
+            if match.group(1) is not None:
+                return f'(?P<{prefix}{match.group(1)}>'
+            if match.group(2) is not None:
+                return f'(?P={prefix}{match.group(2)})'
+            return match.group(0)
+        return cls.__GROUP_SYNTAX.sub(rename, pattern)
+
+    @property
+    def keys(self) -> tuple:
+        return self.__keys
+
+    @property
+    def patterns(self) -> tuple:
+        return tuple(self.__group_names.values())
+
+    @property
+    def replacement(self) -> str:
+        return self.__replacement
+
+    @property
+    def hit_counts(self) -> dict:
+        """ The count of the redacted secrets of each key and pattern """
+        with self.__lock:
+            return dict(self.__hit_counts)
+
+    def reset_counts(self) -> None:
+        with self.__lock:
+            for name in self.__hit_counts:
+                self.__hit_counts[name] = 0
+
+    def redact(self, text: str) -> str:
+        """
+        Return the text with the secrets replaced
+
+        - Args:
+            - text(str): The text to be redacted
+        """
+        pattern = self.__pattern
+        if pattern is None or pattern.search(text) is None:
+            return text
+        hits = []
+
+        def replace(match: re.Match) -> str:
+            # The group closed last is the one wrapping the matched alternative
+            if match.lastgroup == '_key_value':
+                key_name = match.group('_key_name')
+                hits.append(self.__key_lookup.get(key_name.lower() if self.__ignoreCase else key_name, key_name))
+                value = match.group('_key_value')
+                quote = value[0] if value[:1] in ('"', "'") else ''
+                return f'{match.group("_key")}{quote}{self.__replacement}{quote}'
+            hits.append(self.__group_names[match.lastgroup])
+            return self.__replacement
+
+        result = pattern.sub(replace, text)
+        with self.__lock:
+            for name in hits:
+                self.__hit_counts[name] = self.__hit_counts.get(name, 0) + 1
+        return result
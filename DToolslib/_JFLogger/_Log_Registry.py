@@ -0,0 +1,82 @@
+import os
+import threading
+import typing
+import weakref
+
+
+class _LoggerRegistry(object):
+    """
+    This class indexes the living loggers by name and by log folder name.
+
+    The entries are weak references, so a logger which is no longer used is removed automatically,
+    and the lookups and registrations do not depend on the count of loggers.
+    The child loggers of `JFLogger.get_child()` are registered by name as well, but they own no folder,
+    and they are kept alive by their root logger.
+    """
+    __names = weakref.WeakValueDictionary()
+    __folders = weakref.WeakValueDictionary()
+    __lock = threading.RLock()
+
+    @classmethod
+    def register_name(cls, name: str, logger) -> bool:
+        """ Register the name of the logger, return False if the name is used by another living logger """
+        with cls.__lock:
+            existing = cls.__names.get(name, None)
+            if existing is not None and existing is not logger:
+                return False
+            cls.__names[name] = logger
+            return True
+
+    @classmethod
+    def unregister_name(cls, name: str, logger) -> None:
+        with cls.__lock:
+            if cls.__names.get(name, None) is logger:
+                del cls.__names[name]
+
+    @classmethod
+    def register_folder(cls, folder_name: str, logger) -> bool:
+        """ Register the log folder name of the logger, return False if the folder is used by another living logger """
+        with cls.__lock:
+            existing = cls.__folders.get(folder_name, None)
+            if existing is not None and existing is not logger:
+                return False
+            cls.__folders[folder_name] = logger
+            return True
+
+    @classmethod
+    def unregister_folder(cls, folder_name: str, logger) -> None:
+        with cls.__lock:
+            if cls.__folders.get(folder_name, None) is logger:
+                del cls.__folders[folder_name]
+
+    @classmethod
+    def get(cls, name: str):
+        return cls.__names.get(name, None)
+
+    @classmethod
+    def get_or_create(cls, name: str, factory: typing.Callable):
+        """ Return the logger registered by the name, or register the one created by the factory """
+        with cls.__lock:
+            logger = cls.__names.get(name, None)
+            if logger is None:
+                logger = factory()
+                cls.__names[name] = logger
+            return logger
+
+    @classmethod
+    def loggers(cls, logger_type: typing.Optional[type] = None) -> list:
+        """ Return the living loggers, optionally only the instances of the given type """
+        with cls.__lock:
+            loggers = list(cls.__names.values())
+        if logger_type is None:
+            return loggers
+        return [logger for logger in loggers if isinstance(logger, logger_type)]
+
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        # The lock may be held by a thread of the parent, which does not exist in the child
+        cls.__lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_LoggerRegistry._after_fork_in_child)
@@ -0,0 +1,320 @@
+import argparse
+import concurrent.futures
+import datetime
+import mmap
+import multiprocessing
+import os
+import re
+import typing
+import zipfile
+from concurrent.futures.process import BrokenProcessPool
+from DToolslib.Color_Text import *
+from ._LogEnum import LogLevel, _Log_Default
+from ._Log_Columnar import _AsctimeParser, _build_record_patterns
+
+_LEVEL_NAMES = {
+    LogLevel.NOTSET  : 'NOTSET',
+    LogLevel.TRACE   : 'TRACE',
+    LogLevel.DEBUG   : 'DEBUG',
+    LogLevel.INFO    : 'INFO',
+    LogLevel.WARNING : 'WARNING',
+    LogLevel.ERROR   : 'ERROR',
+    LogLevel.CRITICAL: 'CRITICAL',
+}
+# The archive of a logger, and the archives written by the backlog compression, e.g. `<name>--Compressed-1.zip`
+_ZIP_NAME = re.compile(r'--Compressed(?:-\d+)?\.zip$')
+_CHUNK_SIZE = 1 << 20
+
+
+class _RecordMatcher(object):
+    """ This class finds the records matching the search in a buffer of bytes, e.g. a mmap or a decompressed chunk """
+
+    def __init__(self, pattern: str, message_format: str, levels: typing.Optional[frozenset],
+                 since: typing.Optional[float], until: typing.Optional[float], ignoreCase: bool) -> None:
+        record_expression, start_expression = _build_record_patterns(message_format)
+        self.__pattern = re.compile(pattern.encode('utf-8'), re.MULTILINE | (re.IGNORECASE if ignoreCase else 0))
+        self.__isEmpty: bool = not pattern
+        self.__record_pattern = re.compile(record_expression.encode('utf-8'), re.MULTILINE | re.DOTALL)
+        self.__start_pattern = re.compile(start_expression.encode('utf-8'), re.MULTILINE)
+        self.__group_names: dict = self.__record_pattern.groupindex
+        self.__levels = levels
+        self.__since = since
+        self.__until = until
+        self.__hasFilter: bool = levels is not None or since is not None or until is not None
+        self.__asctime_parser = _AsctimeParser()
+
+    def __record_start(self, buffer, pos: int) -> int:
+        """ Walk back line by line from the position to the start of its record, 0 if there is none """
+        line_start = buffer.rfind(b'\n', 0, pos) + 1
+        while line_start > 0 and self.__start_pattern.match(buffer, line_start) is None:
+            line_start = buffer.rfind(b'\n', 0, line_start - 1) + 1
+        return line_start
+
+    def __record_end(self, buffer, start: int, end: int) -> int:
+        """ Return the start of the next record after the record starting at the position """
+        next_line = buffer.find(b'\n', start, end)
+        if next_line < 0:
+            return end
+        match = self.__start_pattern.search(buffer, next_line + 1, end)
+        return end if match is None else match.start()
+
+    def __accept(self, buffer, start: int, end: int) -> bool:
+        if not self.__hasFilter:
+            return True
+        match = self.__record_pattern.match(buffer, start, end)
+        if match is None:
+            return False
+        if self.__levels is not None:
+            if 'levelName' not in self.__group_names:
+                return False
+            if match.group('levelName').strip().decode('utf-8', 'replace') not in self.__levels:
+                return False
+        if self.__since is not None or self.__until is not None:
+            if 'asctime' not in self.__group_names:
+                return False
+            epoch = self.__asctime_parser.parse(match.group('asctime').strip().decode('utf-8', 'replace'))
+            # NaN fails both comparisons, the records without a time are excluded
+            if self.__since is not None and not epoch >= self.__since:
+                return False
+            if self.__until is not None and not epoch <= self.__until:
+                return False
+        return True
+
+    def last_record_start(self, buffer, end: int) -> int:
+        """ Return the start of the record which contains the last byte before the end """
+        return self.__record_start(buffer, end - 1) if end > 0 else 0
+
+    def find(self, buffer, end: int) -> typing.Iterator[tuple]:
+        """
+        Find the matching records in the buffer up to the end, the buffer must not end within a record.
+
+        The pattern is searched over the whole buffer, only the records around the hits are located,
+        so the records without a hit are not parsed.
+
+        - Returns:
+            - Iterator of (record start, record end)
+        """
+        pos = 0
+        while pos < end:
+            if self.__isEmpty:
+                start = pos
+            else:
+                hit = self.__pattern.search(buffer, pos, end)
+                if hit is None:
+                    return
+                start = self.__record_start(buffer, hit.start())
+            record_end = self.__record_end(buffer, start, end)
+            # A hit crossing into the next record does not count for this record
+            if (self.__isEmpty or hit.end() <= record_end or self.__pattern.search(buffer, start, record_end) is not None) \
+                    and self.__accept(buffer, start, record_end):
+                yield start, record_end
+            pos = record_end
+
+
+def _decode_record(data: bytes) -> str:
+    return data.decode('utf-8', 'replace').rstrip('\r\n')
+
+
+def _search_file(path: str, matcher: _RecordMatcher) -> list:
+    results = []
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return results
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            line_num = 1
+            counted = 0
+            for start, end in matcher.find(buffer, len(buffer)):
+                line_num += buffer[counted:start].count(b'\n')
+                counted = start
+                results.append((path, line_num, _decode_record(buffer[start:end])))
+    return results
+
+
+def _search_member(zip_path: str, member: str, matcher: _RecordMatcher) -> list:
+    results = []
+    source = f'{zip_path}::{member}'
+    line_num = 1
+    with zipfile.ZipFile(zip_path, 'r') as zipf, zipf.open(member) as f:
+        carry = b''
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            buffer = carry + chunk
+            # The last record may continue in the next chunk, it is carried over
+            cut = len(buffer) if not chunk else matcher.last_record_start(buffer, len(buffer))
+            counted = 0
+            for start, end in matcher.find(buffer, cut):
+                line_num += buffer.count(b'\n', counted, start)
+                counted = start
+                results.append((source, line_num, _decode_record(buffer[start:end])))
+            line_num += buffer.count(b'\n', counted, cut)
+            carry = buffer[cut:]
+            if not chunk:
+                return results
+
+
+def _search_source(source: tuple, pattern: str, message_format: str, levels: typing.Optional[frozenset],
+                   since: typing.Optional[float], until: typing.Optional[float], ignoreCase: bool) -> list:
+    """
+    Search one log file or one member of an archive, it runs in a worker process
+
+    - Returns:
+        - The matching records as a list of (file, line, record)
+    """
+    matcher = _RecordMatcher(pattern, message_format, levels, since, until, ignoreCase)
+    zip_path, member = source
+    if member is None:
+        return _search_file(zip_path, matcher)
+    return _search_member(zip_path, member, matcher)
+
+
+def _to_epoch(value: typing.Union[datetime.datetime, int, float, str, None], arg_name: str) -> typing.Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            error_text = ansi_color_text(f'<ERROR> {arg_name} "{value}" is not an ISO format time.', 33)
+            raise ValueError(error_text) from None
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    error_text = ansi_color_text(f"{arg_name} must be datetime, epoch or ISO format str, but {type(value)} was given.", 33)
+    raise TypeError(error_text)
+
+
+def _collect_sources(folder: str, since: typing.Optional[float]) -> list:
+    """
+    List the members of the archives and the log files in the folder, the ones last written before `since` are skipped
+
+    The archived files are older than the log files, so the archives come first.
+    The members of all archives and the log files are each ordered by time.
+    """
+    members = []
+    log_files = []
+    for name in sorted(os.listdir(folder)):
+        path = os.path.join(folder, name)
+        if name.endswith('.log') and os.path.isfile(path):
+            mtime = os.path.getmtime(path)
+            if since is None or mtime >= since:
+                log_files.append((mtime, path))
+        elif _ZIP_NAME.search(name) and os.path.isfile(path):
+            try:
+                with zipfile.ZipFile(path, 'r') as zipf:
+                    infos = zipf.infolist()
+            except zipfile.BadZipFile:
+                continue
+            for info in infos:
+                if not info.filename.endswith('.log'):
+                    continue
+                # The time in the archive has a resolution of 2 seconds
+                if since is not None and datetime.datetime(*info.date_time).timestamp() + 2 < since:
+                    continue
+                members.append((info.date_time, path, info.filename))
+    # The sort is stable, the members of the same time stay in the order they were added
+    members.sort(key=lambda member: member[0])
+    return [(path, member) for _, path, member in members] + [(path, None) for _, path in sorted(log_files)]
+
+
+def search_logs(folder: str, pattern: str, message_format: str = _Log_Default.MESSAGE_FORMAT,
+                since: typing.Union[datetime.datetime, float, str, None] = None,
+                until: typing.Union[datetime.datetime, float, str, None] = None,
+                levels: typing.Optional[typing.Iterable[typing.Union[str, int]]] = None,
+                max_workers: int = 0, ignoreCase: bool = False) -> typing.Iterator[tuple]:
+    """
+    Search the records of the log files and the archives in the folder.
+
+    Each `.log` file and each member of the `--Compressed.zip` and `--Compressed-<n>.zip` archives
+    is searched by a worker process.
+    The log files are mapped with `mmap`, the members are decompressed in chunks, so neither is loaded at once.
+    The results of each file are yielded as soon as the file is searched, the older files first.
+    The workers are started with `spawn`, which imports the `__main__` module of the application in each worker,
+    so a script which creates its loggers at the top level must guard its code with `if __name__ == '__main__':`.
+    If the pool breaks nevertheless, the files are searched in this process.
+
+    - Args:
+        - folder(str): The folder of the logger
+        - pattern(str): The regular expression to be searched in the records, '' for all records
+        - message_format(str): The message format the files were written with
+        - since(datetime | float | str): Only the records at or after the time, as datetime, epoch or ISO format
+        - until(datetime | float | str): Only the records at or before the time
+        - levels(Iterable[str | int]): Only the records of the levels
+        - max_workers(int): The count of the worker processes, 0 for the count of CPUs, 1 to search in this process
+        - ignoreCase(bool): Whether the pattern ignores the case
+
+    - Returns:
+        - Iterator of (file, line, record), the file of a member is `<archive>::<member>`
+    """
+    if not isinstance(pattern, str):
+        error_text = ansi_color_text(f"pattern must be str, but {type(pattern)} was given.", 33)
+        raise TypeError(error_text)
+    if not isinstance(max_workers, int) or max_workers < 0:
+        error_text = ansi_color_text(f"max_workers must be a non-negative int, but {max_workers} was given.", 33)
+        raise ValueError(error_text)
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        error_text = ansi_color_text(f'<ERROR> Search pattern "{pattern}" is invalid: {e}', 33)
+        raise ValueError(error_text) from None
+    since = _to_epoch(since, 'since')
+    until = _to_epoch(until, 'until')
+    if levels is not None:
+        levels = (levels,) if isinstance(levels, (str, int)) else levels
+        levels = frozenset(_LEVEL_NAMES.get(LogLevel._normalize_log_level(level), str(level)) for level in levels)
+    sources = _collect_sources(folder, since)
+    args = (pattern, message_format, levels, since, until, ignoreCase)
+    workers = min(max_workers if max_workers > 0 else (os.cpu_count() or 1), len(sources))
+    if workers <= 1:
+        for source in sources:
+            yield from _search_source(source, *args)
+        return
+    # The workers are spawned, since forking a process with running threads is not safe
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        futures = [executor.submit(_search_source, source, *args) for source in sources]
+        for idx, future in enumerate(futures):
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                # e.g. a worker died while importing `__main__`, the remaining files are searched in this process
+                for source in sources[idx:]:
+                    yield from _search_source(source, *args)
+                return
+            yield from results
+    finally:
+        # The pending files are dropped if the iteration is stopped early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Command line entry of the search, e.g.
+
+        python -m DToolslib._JFLogger Logs/app "timeout" --level ERROR --since 2025-01-01T08:00
+
+    It prints `<file>:<line>: <record>` per record, and returns 0 if any record matches, otherwise 1.
+    """
+    parser = argparse.ArgumentParser(prog='python -m DToolslib._JFLogger',
+                                     description='Search the log files and the compressed archives of a JFLogger folder.')
+    parser.add_argument('folder', help='The folder of the logger')
+    parser.add_argument('pattern', help="The regular expression to be searched, '' for all records")
+    parser.add_argument('--since', help='Only the records at or after the ISO format time')
+    parser.add_argument('--until', help='Only the records at or before the ISO format time')
+    parser.add_argument('--level', action='append', dest='levels',
+                        help='Only the records of the level, can be given multiple times or comma separated')
+    parser.add_argument('--format', default=_Log_Default.MESSAGE_FORMAT, dest='message_format',
+                        help='The message format the files were written with')
+    parser.add_argument('--workers', type=int, default=0, help='The count of the worker processes, 0 for the count of CPUs')
+    parser.add_argument('-i', '--ignore-case', action='store_true', help='The pattern ignores the case')
+    options = parser.parse_args(argv)
+    levels = None
+    if options.levels:
+        levels = [level.strip() for value in options.levels for level in value.split(',') if level.strip()]
+    found = False
+    for file, line_num, record in search_logs(options.folder, options.pattern, options.message_format,
+                                              options.since, options.until, levels, options.workers, options.ignore_case):
+        found = True
+        print(f'{file}:{line_num}: {record}')
+    return 0 if found else 1
+
@@ -0,0 +1,684 @@
+import collections
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import typing
+import weakref
+from DToolslib.Color_Text import *
+from ._LogEnum import LogLevel, LogRenderType, _Log_Default
+from ._Process_Manager import _ProcessManager
+
+# Index of each render flavour in the rendered record (text, text_console, text_color, message)
+_RENDER_INDEX = {
+    LogRenderType.PLAIN  : 0,
+    LogRenderType.CONSOLE: 1,
+    LogRenderType.COLOR  : 2,
+    LogRenderType.MESSAGE: 3,
+}
+# Bit of each render flavour in the flavour mask of the logger, the message needs no rendering
+_RENDER_BITS = {
+    LogRenderType.PLAIN  : 0b001,
+    LogRenderType.CONSOLE: 0b010,
+    LogRenderType.COLOR  : 0b100,
+    LogRenderType.MESSAGE: 0b000,
+}
+_RENDER_ALL = 0b111
+
+
+class _ChunkedText(object):
+    """
+    This class represents a rendered record whose message is too long to be joined into one string.
+
+    The record is kept as prefix, message and suffix, and written in chunks, so that only one copy
+    of the message exists in memory. `str()` joins the parts, it is only used if a sink needs the full text.
+    """
+    __slots__ = ('prefix', 'body', 'suffix', 'chunk_size')
+
+    def __init__(self, prefix: str, body: str, suffix: str, chunk_size: int) -> None:
+        self.prefix = prefix
+        self.body = body
+        self.suffix = suffix
+        self.chunk_size = chunk_size
+
+    def __str__(self) -> str:
+        return ''.join((self.prefix, self.body, self.suffix))
+
+    def iter_chunks(self) -> typing.Iterator[str]:
+        yield self.prefix
+        for idx in range(0, len(self.body), self.chunk_size):
+            yield self.body[idx:idx + self.chunk_size]
+        yield self.suffix
+
+    def encoded_size(self, encoding: str = 'utf-8') -> int:
+        return sum(len(chunk.encode(encoding)) for chunk in self.iter_chunks())
+
+    def with_prefix(self, text: str) -> '_ChunkedText':
+        return _ChunkedText(text + self.prefix, self.body, self.suffix, self.chunk_size)
+
+
+class JFLogSink(object):
+    """
+    The base class of the log sinks.
+
+    A sink receives the rendered records of a logger in the render flavour it declares.
+    Each sink has its own level filter, and it can run inline on the logging thread
+    or on its own worker thread, so that a slow sink does not stall the others.
+    Exceptions raised by a sink are caught and counted, they do not reach the logging call or the other sinks.
+
+    Subclasses implement `write(level, text)`, and optionally `flush_output()` and `close_output()`.
+
+    - Args:
+        - level(LogLevel): The minimum level of the records written by this sink
+        - flavour(LogRenderType): The rendered text this sink receives
+        - isThreaded(bool): Whether to write the records on a worker thread of this sink
+        - max_pending(int): The maximum count of records waiting for the worker, default is no limit.
+            Records exceeding the limit are dropped and counted in `dropped_count`.
+        - name(str): The name of the sink, it is used for the worker thread
+
+    - Attributes:
+        - level: The minimum level
+        - flavour: The render flavour
+        - isThreaded: Whether the sink has a worker thread
+        - isActive: Whether the sink currently needs the records
+        - dropped_count: The count of dropped records
+        - failed_count: The count of records failed to be written
+
+    Example:
+
+        class ListSink(JFLogSink):
+            def __init__(self):
+                super().__init__(flavour=LogRenderType.MESSAGE)
+                self.records = []
+
+            def write(self, level, text):
+                self.records.append((level, text))
+
+        Log = JFLogger('test')
+        Log.add_sink(ListSink())
+    """
+    _shutdown_phase = 2
+    _acceptChunked = False  # Whether write() handles _ChunkedText itself
+
+    def __init__(self, level: typing.Union[str, int] = LogLevel.NOTSET, flavour: str = LogRenderType.PLAIN,
+                 isThreaded: bool = False, max_pending: int = -1, name: str = '') -> None:
+        if flavour not in _RENDER_INDEX:
+            error_text = ansi_color_text(f'<ERROR> Render flavour "{flavour}" is not a valid LogRenderType.', 33)
+            raise ValueError(error_text)
+        self.__name: str = name if name else self.__class__.__name__
+        self.__level: int = LogLevel._normalize_log_level(level)
+        self.__flavour: str = flavour
+        self.__render_index: int = _RENDER_INDEX[flavour]
+        self.__max_pending: int = max_pending if isinstance(max_pending, int) else -1
+        self.__dropped_count: int = 0
+        self.__failed_count: int = 0
+        self.__isThreaded: bool = False
+        self.__isClosed: bool = False
+        self.__isShutDown: bool = False
+        self.__queue: typing.Optional[queue.SimpleQueue] = None
+        self.__worker_thread: typing.Optional[threading.Thread] = None
+        self.__write_lock = threading.RLock()
+        _ProcessManager.register(self)
+        if isThreaded:
+            self.set_threaded(True, max_pending)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}<"{self.__name}"> at 0x{id(self):016x}'
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def level(self) -> int:
+        return self.__level
+
+    @property
+    def flavour(self) -> str:
+        return self.__flavour
+
+    @property
+    def isThreaded(self) -> bool:
+        return self.__isThreaded
+
+    @property
+    def isActive(self) -> bool:
+        return not self.__isClosed
+
+    @property
+    def dropped_count(self) -> int:
+        return self.__dropped_count
+
+    @property
+    def failed_count(self) -> int:
+        return self.__failed_count
+
+    def write(self, level: int, text: str) -> None:
+        """
+        Write a rendered record, it must be implemented by the subclasses
+
+        - Args:
+            - level(int): The log level of the record
+            - text(str): The rendered text in the flavour of this sink
+        """
+        raise NotImplementedError
+
+    def flush_output(self) -> None:
+        """ Flush the buffered output, it is called on the thread which writes the records """
+        pass
+
+    def close_output(self) -> None:
+        """ Release the resources of the output, it is called once when the sink is closed """
+        pass
+
+    def _emit(self, level: int, record: tuple) -> None:
+        """ Receive a rendered record from the logger """
+        if level < self.__level or self.__isClosed:
+            return
+        text = record[self.__render_index]
+        if not self._acceptChunked and isinstance(text, _ChunkedText):
+            text = str(text)
+        if not self.__isThreaded:
+            self.__write_safely(level, text)
+            if self.__isShutDown:
+                self.__flush_safely()
+            return
+        if self.__max_pending > 0 and self.__queue.qsize() >= self.__max_pending:
+            self.__dropped_count += 1
+            return
+        self.__queue.put((level, text))
+
+    def __report_failure(self) -> None:
+        self.__failed_count += 1
+        if sys.stderr:
+            sys.stderr.write(f'<ERROR> Log sink {self!r} failed:\n{traceback.format_exc()}')
+
+    def __write_safely(self, level: int, text) -> None:
+        with self.__write_lock:
+            try:
+                self.write(level, text)
+            except Exception:
+                self.__report_failure()
+
+    def __flush_safely(self) -> None:
+        with self.__write_lock:
+            try:
+                self.flush_output()
+            except Exception:
+                self.__report_failure()
+
+    def __run_worker(self, work_queue: queue.SimpleQueue) -> None:
+        while True:
+            item = work_queue.get()
+            if item is None:
+                self.__flush_safely()
+                break
+            if isinstance(item, threading.Event):
+                self.__flush_safely()
+                item.set()
+                continue
+            self.__write_safely(*item)
+
+    def __start_worker(self) -> None:
+        self.__queue = queue.SimpleQueue()
+        self.__worker_thread = threading.Thread(name=f'LogSinkWorker-{self.__name}', target=self.__run_worker,
+                                                args=(self.__queue,), daemon=True)
+        self.__worker_thread.start()
+
+    def __stop_worker(self, timeout: typing.Optional[float] = None) -> None:
+        if self.__worker_thread is None:
+            return
+        self.__queue.put(None)
+        if threading.current_thread() is not self.__worker_thread:
+            self.__worker_thread.join(timeout)
+        self.__worker_thread = None
+
+    def set_level(self, level: typing.Union[str, int]) -> typing.Self:
+        """
+        Set the minimum level of the records written by this sink
+
+        - Args:
+            - level(LogLevel): The minimum level
+        """
+        self.__level = LogLevel._normalize_log_level(level)
+        return self
+
+    def set_flavour(self, flavour: str) -> typing.Self:
+        """
+        Set the rendered text this sink receives
+
+        - Args:
+            - flavour(LogRenderType): The render flavour
+        """
+        if flavour not in _RENDER_INDEX:
+            error_text = ansi_color_text(f'<ERROR> Render flavour "{flavour}" is not a valid LogRenderType.', 33)
+            raise ValueError(error_text)
+        self.__flavour = flavour
+        self.__render_index = _RENDER_INDEX[flavour]
+        return self
+
+    def set_threaded(self, enable: bool, max_pending: int = -1) -> typing.Self:
+        """
+        Set whether to write the records on a worker thread of this sink
+
+        - Args:
+            - enable(bool): Whether to use a worker thread
+            - max_pending(int): The maximum count of records waiting for the worker, default is no limit
+        """
+        if not isinstance(enable, bool):
+            error_text = ansi_color_text(f"enable must be bool, but {type(enable)} was given.", 33)
+            raise TypeError(error_text)
+        if not isinstance(max_pending, int):
+            error_text = ansi_color_text(f"max_pending must be int, but {type(max_pending)} was given.", 33)
+            raise TypeError(error_text)
+        self.__max_pending = max_pending
+        if enable == self.__isThreaded or self.__isClosed or self.__isShutDown:
+            return self
+        self.__isThreaded = enable
+        if enable:
+            self.__start_worker()
+        else:
+            self.__stop_worker()
+        return self
+
+    def flush(self, timeout: typing.Optional[float] = None) -> bool:
+        """
+        Wait until the records received before are written, and flush the output
+
+        - Args:
+            - timeout(float): The maximum time to wait for the worker, default is no limit
+
+        - Returns:
+            - True if the records are written before the timeout
+        """
+        worker_thread = self.__worker_thread
+        if worker_thread is None or not worker_thread.is_alive():
+            self.__flush_safely()
+            return True
+        if threading.current_thread() is worker_thread:
+            return False
+        event = threading.Event()
+        self.__queue.put(event)
+        return event.wait(timeout)
+
+    def close(self, timeout: typing.Optional[float] = None) -> None:
+        """
+        Write the pending records and release the output, the sink receives no records after it is closed
+
+        - Args:
+            - timeout(float): The maximum time to wait for the worker, default is no limit
+        """
+        if self.__isClosed:
+            return
+        self.__isClosed = True
+        if self.__worker_thread is not None:
+            self.__stop_worker(timeout)
+        else:
+            self.__flush_safely()
+        with self.__write_lock:
+            try:
+                self.close_output()
+            except Exception:
+                self.__report_failure()
+        _ProcessManager.unregister(self)
+
+    def _shutdown(self, deadline: float) -> None:
+        """
+        Write the pending records before the process exits, it is called by the process manager.
+
+        The sinks are shut down in the last phase, after the loggers and groups, but the output is not released,
+        since atexit handlers running afterwards may still log. Each later record is written and flushed
+        on the calling thread instead.
+        """
+        if self.__isClosed or self.__isShutDown:
+            return
+        self.__isShutDown = True
+        self.__isThreaded = False
+        if self.__worker_thread is not None:
+            self.__stop_worker(max(0.0, deadline - time.monotonic()))
+        else:
+            self.__flush_safely()
+
+    def _before_fork(self) -> None:
+        self.__write_lock.acquire()
+
+    def _after_fork_in_parent(self) -> None:
+        self.__write_lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        """ The worker thread does not exist in the child, start a new one with an empty queue """
+        self.__write_lock = threading.RLock()
+        if self.__isThreaded and not self.__isClosed:
+            self.__start_worker()
+
+
+class FileSink(JFLogSink):
+    """
+    This sink appends the records to a file.
+
+    It has no rotation, the rotated log files of JFLogger are written by its own file output.
+
+    - Args:
+        - file_path(str): The path of the file
+        - encoding(str): The encoding of the file
+        - other arguments: See `JFLogSink`
+    """
+    _acceptChunked = True
+
+    def __init__(self, file_path: str, level: typing.Union[str, int] = LogLevel.NOTSET,
+                 flavour: str = LogRenderType.PLAIN, isThreaded: bool = False, max_pending: int = -1,
+                 encoding: str = 'utf-8', name: str = '') -> None:
+        self.__file_path: str = file_path
+        self.__encoding: str = encoding
+        self.__file = None
+        super().__init__(level=level, flavour=flavour, isThreaded=isThreaded, max_pending=max_pending,
+                         name=name if name else os.path.basename(file_path))
+
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    def write(self, level: int, text) -> None:
+        if self.__file is None:
+            self.__file = open(self.__file_path, 'a', encoding=self.__encoding)
+        if isinstance(text, _ChunkedText):
+            for chunk in text.iter_chunks():
+                self.__file.write(chunk)
+        else:
+            self.__file.write(text)
+        self.__file.flush()
+
+    def close_output(self) -> None:
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def _after_fork_in_child(self) -> None:
+        # The file object is shared with the parent, the child opens its own one
+        self.__file = None
+        super()._after_fork_in_child()
+
+
+class ConsoleSink(JFLogSink):
+    """
+    This sink writes the records to the console in batches.
+
+    The records are collected in a buffer, which is written when it reaches `buffer_size` characters,
+    when a record reaches `flush_level`, or at the latest `max_latency` seconds after the first buffered record.
+    If the stream has a binary buffer, e.g. `sys.stdout.buffer`, the batch is encoded once and written in bytes.
+
+    By default, ANSI colors are only used if the stream is a TTY and the environment variable `NO_COLOR` is not set.
+    Otherwise the sink receives the plain text, so the colored text is not rendered at all.
+
+    - Args:
+        - stream: The text stream to write, default is `sys.stdout` at the time of writing
+        - enableColor(bool): Whether to use ANSI colors, default is detected from the stream and `NO_COLOR`
+        - buffer_size(int): The buffered characters to write a batch, 0 writes every record immediately
+        - max_latency(float): The maximum seconds a record stays in the buffer
+        - flush_level(LogLevel): Records of this level or higher are written immediately with the buffer
+        - other arguments: See `JFLogSink`
+    """
+    _acceptChunked = True
+
+    def __init__(self, stream: typing.Optional[typing.TextIO] = None, level: typing.Union[str, int] = LogLevel.NOTSET,
+                 flavour: typing.Optional[str] = None, isThreaded: bool = False, max_pending: int = -1,
+                 enableColor: typing.Optional[bool] = None, buffer_size: int = _Log_Default.CONSOLE_BUFFER_SIZE,
+                 max_latency: float = _Log_Default.CONSOLE_MAX_LATENCY,
+                 flush_level: typing.Union[str, int] = LogLevel.ERROR, name: str = '') -> None:
+        self.__stream = stream
+        if enableColor is None:
+            enableColor = self.__detect_color(stream)
+        self.__enableColor: bool = enableColor
+        if flavour is None:
+            flavour = LogRenderType.CONSOLE if enableColor else LogRenderType.PLAIN
+        self.__buffer_size: int = buffer_size
+        self.__max_latency: float = max_latency
+        self.__flush_level: int = LogLevel._normalize_log_level(flush_level)
+        self.__buffer: list = []
+        self.__buffered_size: int = 0
+        self.__buffer_event = threading.Event()
+        self.__flusher_thread: typing.Optional[threading.Thread] = None
+        super().__init__(level=level, flavour=flavour, isThreaded=isThreaded, max_pending=max_pending, name=name)
+
+    @property
+    def enableColor(self) -> bool:
+        return self.__enableColor
+
+    @staticmethod
+    def __detect_color(stream: typing.Optional[typing.TextIO]) -> bool:
+        """ ANSI colors are only useful on a terminal, and `NO_COLOR` disables them (https://no-color.org) """
+        if os.environ.get('NO_COLOR', ''):
+            return False
+        stream = stream if stream is not None else sys.stdout
+        try:
+            return bool(stream) and stream.isatty()
+        except Exception:
+            return False
+
+    def __start_flusher(self) -> None:
+        self.__flusher_thread = threading.Thread(name=f'LogConsoleFlusher-{self.name}', target=self.__run_flusher,
+                                                 daemon=True)
+        self.__flusher_thread.start()
+
+    def __run_flusher(self) -> None:
+        while self.isActive:
+            self.__buffer_event.wait()
+            time.sleep(self.__max_latency)
+            self.flush()
+
+    def write(self, level: int, text) -> None:
+        chunks = text.iter_chunks() if isinstance(text, _ChunkedText) else (text,)
+        for chunk in chunks:
+            self.__buffer.append(chunk)
+            self.__buffered_size += len(chunk)
+            if self.__buffered_size >= self.__buffer_size:
+                self.flush_output()
+        if level >= self.__flush_level:
+            self.flush_output()
+        elif self.__buffer and not self.__buffer_event.is_set():
+            if self.__flusher_thread is None:
+                self.__start_flusher()
+            self.__buffer_event.set()
+
+    def flush_output(self) -> None:
+        self.__buffer_event.clear()
+        if not self.__buffer:
+            return
+        data = ''.join(self.__buffer)
+        self.__buffer.clear()
+        self.__buffered_size = 0
+        stream = self.__stream if self.__stream is not None else sys.stdout
+        if not stream:
+            return
+        binary_buffer = getattr(stream, 'buffer', None)
+        if binary_buffer is None:
+            stream.write(data)
+            stream.flush()
+            return
+        # Text written by print() is still in the text layer, it must be written before the batch
+        stream.flush()
+        binary_buffer.write(data.encode(getattr(stream, 'encoding', None) or 'utf-8', errors='replace'))
+        binary_buffer.flush()
+
+    def close_output(self) -> None:
+        # Wake up the flusher, it exits because the sink is closed
+        self.__buffer_event.set()
+
+    def _after_fork_in_child(self) -> None:
+        # The flusher thread does not exist in the child, the buffered records belong to the parent
+        self.__buffer_event = threading.Event()
+        self.__buffer.clear()
+        self.__buffered_size = 0
+        self.__flusher_thread = None
+        super()._after_fork_in_child()
+
+
+class SignalSink(JFLogSink):
+    """
+    This sink emits the records with an EventSignal(int, str).
+
+    The sink is only active if the signal has slots, so the logger does not render the flavour for nobody.
+
+    - Args:
+        - signal: The bound EventSignal instance, e.g. `Log.signal_format`
+        - other arguments: See `JFLogSink`
+    """
+
+    def __init__(self, signal, flavour: str = LogRenderType.PLAIN, level: typing.Union[str, int] = LogLevel.NOTSET,
+                 isThreaded: bool = False, max_pending: int = -1, name: str = '') -> None:
+        self.__signal = signal
+        super().__init__(level=level, flavour=flavour, isThreaded=isThreaded, max_pending=max_pending, name=name)
+
+    @property
+    def isActive(self) -> bool:
+        return self.__signal.slot_count > 0 and super().isActive
+
+    def write(self, level: int, text: str) -> None:
+        self.__signal.emit(level, text)
+
+
+class BatchedSignalSink(JFLogSink):
+    """
+    This sink emits the records in batches with an EventSignal(list), e.g. for GUI log widgets.
+
+    The log call only appends the record to a bounded buffer. An emitter thread of the sink emits
+    the buffered records as one list of (level, text), at most `max_rate` times per second,
+    so a burst of records costs the slots a few calls instead of one call per record.
+    The logging thread never waits for the slots. If the buffer is full, the oldest records are dropped
+    and counted in `overflow_count`.
+
+    The sink is only active if the signal has slots.
+
+    - Args:
+        - signal: The bound EventSignal instance, e.g. `Log.signal_colorized_batch`
+        - max_rate(float): The maximum emits per second
+        - max_pending(int): The maximum records waiting in the buffer, -1 for no limit
+        - other arguments: See `JFLogSink`
+    """
+
+    def __init__(self, signal, flavour: str = LogRenderType.PLAIN, level: typing.Union[str, int] = LogLevel.NOTSET,
+                 max_rate: float = _Log_Default.SIGNAL_MAX_RATE, max_pending: int = _Log_Default.SIGNAL_MAX_PENDING,
+                 name: str = '') -> None:
+        self.__signal = signal
+        self.__interval: float = 0
+        self.__buffer: collections.deque = collections.deque()
+        self.__overflow_count: int = 0
+        # The buffer lock guards the buffer, the emit lock keeps the batches in order.
+        # The signal is emitted without the buffer lock, so a slot may log to this sink again
+        self.__buffer_lock = threading.Lock()
+        self.__emit_lock = threading.Lock()
+        self.__buffer_event = threading.Event()
+        self.__emitter_thread: typing.Optional[threading.Thread] = None
+        super().__init__(level=level, flavour=flavour, name=name)
+        self.set_rate(max_rate, max_pending)
+
+    @property
+    def isActive(self) -> bool:
+        return self.__signal.slot_count > 0 and super().isActive
+
+    @property
+    def max_rate(self) -> float:
+        return 1 / self.__interval
+
+    @property
+    def overflow_count(self) -> int:
+        return self.__overflow_count
+
+    def set_rate(self, max_rate: float = _Log_Default.SIGNAL_MAX_RATE,
+                 max_pending: int = _Log_Default.SIGNAL_MAX_PENDING) -> typing.Self:
+        """
+        Set the maximum emit rate and the size of the buffer
+
+        - Args:
+            - max_rate(float): The maximum emits per second
+            - max_pending(int): The maximum records waiting in the buffer, -1 for no limit
+        """
+        if not isinstance(max_rate, (int, float)) or max_rate <= 0:
+            error_text = ansi_color_text(f"max_rate must be a positive number, but {max_rate} was given.", 33)
+            raise ValueError(error_text)
+        if not isinstance(max_pending, int):
+            error_text = ansi_color_text(f"max_pending must be int, but {type(max_pending)} was given.", 33)
+            raise TypeError(error_text)
+        self.__interval = 1 / max_rate
+        with self.__buffer_lock:
+            if (self.__buffer.maxlen or -1) != max_pending:
+                self.__buffer = collections.deque(self.__buffer, maxlen=max_pending if max_pending > 0 else None)
+        return self
+
+    def __start_emitter(self) -> None:
+        self.__emitter_thread = threading.Thread(name=f'LogSignalEmitter-{self.name}', target=self.__run_emitter,
+                                                 daemon=True)
+        self.__emitter_thread.start()
+
+    def __run_emitter(self) -> None:
+        while True:
+            self.__buffer_event.wait()
+            if not super().isActive:
+                break
+            self.__buffer_event.clear()
+            self.__emit_pending()
+            # The records arriving meanwhile are collected for the next batch
+            time.sleep(self.__interval)
+
+    def __emit_pending(self) -> None:
+        with self.__emit_lock:
+            with self.__buffer_lock:
+                buffer = self.__buffer
+                batch = [buffer.popleft() for _ in range(len(buffer))]
+            if batch:
+                self.__signal.emit(batch)
+
+    def write(self, level: int, text: str) -> None:
+        if self.__signal.slot_count == 0:
+            # Nobody receives the records, they are not buffered
+            return
+        with self.__buffer_lock:
+            buffer = self.__buffer
+            if buffer.maxlen is not None and len(buffer) == buffer.maxlen:
+                self.__overflow_count += 1
+            buffer.append((level, text))
+        if not self.__buffer_event.is_set():
+            if self.__emitter_thread is None:
+                self.__start_emitter()
+            self.__buffer_event.set()
+
+    def flush_output(self) -> None:
+        """ Emit the buffered records on the calling thread, e.g. before the process exits """
+        self.__emit_pending()
+
+    def close_output(self) -> None:
+        # Wake up the emitter, it exits because the sink is closed
+        self.__buffer_event.set()
+
+    def _after_fork_in_child(self) -> None:
+        # The emitter thread does not exist in the child, the records belong to the parent
+        self.__buffer_lock = threading.Lock()
+        self.__emit_lock = threading.Lock()
+        self.__buffer_event = threading.Event()
+        self.__buffer.clear()
+        self.__emitter_thread = None
+        super()._after_fork_in_child()
+
+
+class _CallbackSink(JFLogSink):
+    """
+    This sink forwards the records to a method, e.g. the rotating file output of JFLogger.
+
+    The method is held by a weak reference, so the sink does not keep its owner alive.
+    """
+    _acceptChunked = True
+
+    def __init__(self, callback: typing.Callable, flavour: str = LogRenderType.PLAIN,
+                 level: typing.Union[str, int] = LogLevel.NOTSET, name: str = '') -> None:
+        try:
+            self.__callback = weakref.WeakMethod(callback)
+        except TypeError:
+            self.__callback = lambda: callback
+        super().__init__(level=level, flavour=flavour, name=name)
+
+    def write(self, level: int, text) -> None:
+        callback = self.__callback()
+        if callback is not None:
+            callback(text)
@@ -0,0 +1,242 @@
+import collections
+import socket
+import struct
+import threading
+import time
+import typing
+import zlib
+from DToolslib.Color_Text import *
+from ._LogEnum import LogLevel, LogRenderType, _Log_Default
+from ._Log_Sink import JFLogSink
+
+# Frame header: payload length, flags. Record header: level, text length. All in network byte order.
+_FRAME_HEADER = struct.Struct('!IB')
+_RECORD_HEADER = struct.Struct('!BI')
+_FLAG_COMPRESSED = 0x01
+
+
+class SocketSink(JFLogSink):
+    """
+    This sink ships the records to a log collector over TCP or a Unix domain socket.
+
+    The log call only appends the encoded record to a bounded spill queue. A sender thread collects the records
+    into batches, and sends each batch as one length-prefixed frame. If the connection is lost, the sender
+    reconnects with exponential backoff, the records are kept in the spill queue meanwhile.
+    If the spill queue is full, the oldest records are dropped and counted in `overflow_count`.
+
+    Frame format (network byte order):
+        - frame header: payload length (uint32), flags (uint8, bit 0: the payload is compressed with zlib)
+        - payload: records, each one is level (uint8), text length (uint32) and the UTF-8 text
+
+    `SocketSink.unpack_batch(flags, payload)` decodes a frame for the collector.
+
+    - Args:
+        - address: (host, port) for TCP, or the path of a Unix domain socket
+        - enableCompression(bool): Whether to compress each batch with zlib
+        - batch_size(int): The maximum records of a batch
+        - max_latency(float): The maximum seconds a record waits for more records of its batch
+        - max_spill(int): The maximum records waiting in the spill queue
+        - backoff(tuple): The initial and maximum seconds to wait before reconnecting
+        - connect_timeout(float): The timeout of connecting and sending in seconds
+        - other arguments: See `JFLogSink`
+
+    Example:
+
+        Log = JFLogger('service')
+        Log.add_sink(SocketSink(('127.0.0.1', 9020), enableCompression=True))
+    """
+
+    def __init__(self, address: typing.Union[tuple, str], level: typing.Union[str, int] = LogLevel.NOTSET,
+                 flavour: str = LogRenderType.PLAIN, enableCompression: bool = False,
+                 batch_size: int = _Log_Default.SOCKET_BATCH_SIZE, max_latency: float = _Log_Default.SOCKET_MAX_LATENCY,
+                 max_spill: int = _Log_Default.SOCKET_SPILL_SIZE,
+                 backoff: tuple = (_Log_Default.SOCKET_BACKOFF_MIN, _Log_Default.SOCKET_BACKOFF_MAX),
+                 connect_timeout: float = _Log_Default.SOCKET_CONNECT_TIMEOUT, name: str = '') -> None:
+        if isinstance(address, str):
+            if not hasattr(socket, 'AF_UNIX'):
+                error_text = ansi_color_text('<ERROR> Unix domain sockets are not supported on this platform.', 33)
+                raise ValueError(error_text)
+            self.__family = socket.AF_UNIX
+        elif isinstance(address, tuple) and len(address) == 2:
+            self.__family = socket.AF_INET
+        else:
+            error_text = ansi_color_text(f'<ERROR> Socket address "{address}" is neither (host, port) nor a path.', 33)
+            raise ValueError(error_text)
+        self.__address = address
+        self.__enableCompression: bool = enableCompression
+        self.__batch_size: int = max(1, batch_size)
+        self.__max_latency: float = max_latency
+        self.__backoff_min: float = backoff[0]
+        self.__backoff_max: float = backoff[1]
+        self.__connect_timeout: float = connect_timeout
+        self.__spill: collections.deque = collections.deque(maxlen=max_spill if max_spill > 0 else None)
+        self.__inflight: typing.Optional[list] = None
+        self.__socket: typing.Optional[socket.socket] = None
+        self.__isBackingOff: bool = False
+        self.__isStopping: bool = False
+        self.__overflow_count: int = 0
+        self.__sent_count: int = 0
+        self.__condition = threading.Condition()
+        super().__init__(level=level, flavour=flavour, name=name if name else f'SocketSink-{address}')
+        self.__start_sender()
+
+    @property
+    def address(self) -> typing.Union[tuple, str]:
+        return self.__address
+
+    @property
+    def isConnected(self) -> bool:
+        return self.__socket is not None
+
+    @property
+    def overflow_count(self) -> int:
+        return self.__overflow_count
+
+    @property
+    def sent_count(self) -> int:
+        return self.__sent_count
+
+    @staticmethod
+    def unpack_batch(flags: int, payload: bytes) -> list:
+        """
+        Decode the payload of a frame
+
+        - Args:
+            - flags(int): The flags of the frame header
+            - payload(bytes): The payload of the frame
+
+        - Returns:
+            - The records as a list of (level, text)
+        """
+        if flags & _FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        records = []
+        offset = 0
+        while offset < len(payload):
+            level, length = _RECORD_HEADER.unpack_from(payload, offset)
+            offset += _RECORD_HEADER.size
+            records.append((level, payload[offset:offset + length].decode('utf-8')))
+            offset += length
+        return records
+
+    def write(self, level: int, text: str) -> None:
+        data = text.encode('utf-8')
+        record = _RECORD_HEADER.pack(min(level, 255), len(data)) + data
+        with self.__condition:
+            if self.__spill.maxlen is not None and len(self.__spill) == self.__spill.maxlen:
+                self.__overflow_count += 1
+            self.__spill.append(record)
+            # Wake up the sender for the first record of a batch, and when the batch is full.
+            # While it backs off, the records only wait in the spill queue
+            if not self.__isBackingOff and (len(self.__spill) == 1 or len(self.__spill) >= self.__batch_size):
+                self.__condition.notify_all()
+
+    def flush_output(self) -> None:
+        """ Wait until the records are sent, it returns early if the collector is not reachable """
+        deadline = time.monotonic() + self.__connect_timeout
+        with self.__condition:
+            if not self.__isBackingOff:
+                self.__condition.notify_all()
+            while self.__spill or self.__inflight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.__isBackingOff or not self.__sender_thread.is_alive():
+                    break
+                self.__condition.wait(remaining)
+
+    def close_output(self) -> None:
+        with self.__condition:
+            self.__isStopping = True
+            self.__condition.notify_all()
+        if threading.current_thread() is not self.__sender_thread:
+            self.__sender_thread.join(self.__connect_timeout)
+        self.__disconnect()
+
+    def __start_sender(self) -> None:
+        self.__sender_thread = threading.Thread(name=f'LogSocketSender-{self.name}', target=self.__run_sender,
+                                                daemon=True)
+        self.__sender_thread.start()
+
+    def __connect(self) -> None:
+        if self.__family == socket.AF_INET:
+            sock = socket.create_connection(self.__address, timeout=self.__connect_timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.__connect_timeout)
+            try:
+                sock.connect(self.__address)
+            except OSError:
+                sock.close()
+                raise
+        self.__socket = sock
+
+    def __disconnect(self) -> None:
+        sock, self.__socket = self.__socket, None
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+
+    def __pack_frame(self, records: list) -> bytes:
+        payload = b''.join(records)
+        flags = 0
+        if self.__enableCompression:
+            payload = zlib.compress(payload)
+            flags |= _FLAG_COMPRESSED
+        return _FRAME_HEADER.pack(len(payload), flags) + payload
+
+    def __run_sender(self) -> None:
+        backoff = self.__backoff_min
+        while True:
+            with self.__condition:
+                if self.__inflight is None:
+                    if not self.__spill and not self.__isStopping:
+                        self.__condition.wait()
+                    if len(self.__spill) < self.__batch_size and not self.__isStopping:
+                        # Wait a short time for more records of the batch
+                        self.__condition.wait(self.__max_latency)
+                    if not self.__spill:
+                        if self.__isStopping:
+                            return
+                        continue
+                    count = min(self.__batch_size, len(self.__spill))
+                    self.__inflight = [self.__spill.popleft() for _ in range(count)]
+                records = self.__inflight
+            try:
+                if self.__socket is None:
+                    self.__connect()
+                self.__socket.sendall(self.__pack_frame(records))
+            except OSError:
+                self.__disconnect()
+                with self.__condition:
+                    self.__isBackingOff = True
+                    self.__condition.notify_all()
+                    if self.__isStopping:
+                        return
+                    # Other notifications must not shorten the backoff, only stopping does
+                    reconnect_deadline = time.monotonic() + backoff
+                    while not self.__isStopping:
+                        remaining = reconnect_deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self.__condition.wait(remaining)
+                    self.__isBackingOff = False
+                backoff = min(backoff * 2, self.__backoff_max)
+                continue
+            backoff = self.__backoff_min
+            with self.__condition:
+                self.__sent_count += len(records)
+                self.__inflight = None
+                self.__condition.notify_all()
+
+    def _after_fork_in_child(self) -> None:
+        """ The records and the connection belong to the parent, the child starts with its own ones """
+        self.__condition = threading.Condition()
+        self.__spill.clear()
+        self.__inflight = None
+        self.__disconnect()
+        self.__isBackingOff = False
+        super()._after_fork_in_child()
+        if not self.__isStopping:
+            self.__start_sender()
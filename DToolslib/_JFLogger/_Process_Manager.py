@@ -0,0 +1,121 @@
+import atexit
+import os
+import threading
+import time
+import typing
+import weakref
+from ._LogEnum import _Log_Default
+
+
+class _ProcessManager(object):
+    """
+    This class manages the process-wide lifecycle of loggers and logger groups.
+
+    Instead of one `atexit` hook per logger, a single hook shuts down all registered targets in parallel
+    with a global deadline, and returns as soon as all of them are done.
+
+    The registered targets must implement `_shutdown(deadline)`, where deadline is a `time.monotonic()` value.
+    Targets with a lower `_shutdown_phase` (default 1) are shut down first, e.g. front ends which
+    still hand records over to the loggers.
+
+    On `os.fork()`, the optional methods `_before_fork()`, `_after_fork_in_parent()` and `_after_fork_in_child()`
+    of the targets are called, so that locks, queues and files are in a consistent state in the child process.
+    The locks are taken in the order of the write path: a sink holds its lock while it writes into a logger,
+    so the targets with a higher `_shutdown_phase` take their locks first, and release them last.
+    """
+    __targets = weakref.WeakSet()
+    __lock = threading.Lock()
+    __isAtexitRegistered = False
+
+    @classmethod
+    def register(cls, target) -> None:
+        with cls.__lock:
+            cls.__targets.add(target)
+            if not cls.__isAtexitRegistered:
+                atexit.register(cls.shutdown)
+                cls.__isAtexitRegistered = True
+
+    @classmethod
+    def unregister(cls, target) -> None:
+        with cls.__lock:
+            cls.__targets.discard(target)
+
+    @classmethod
+    def targets(cls) -> list:
+        with cls.__lock:
+            return list(cls.__targets)
+
+    @staticmethod
+    def __shutdown_target(target, deadline: float) -> None:
+        try:
+            target._shutdown(deadline)
+        except Exception:
+            pass
+
+    @classmethod
+    def shutdown(cls, timeout: float = _Log_Default.SHUTDOWN_TIMEOUT) -> bool:
+        """
+        Flush and drain all registered targets in parallel.
+
+        - Args:
+            - timeout(float): The global deadline in seconds
+
+        - Returns:
+            - True if all targets are finished before the deadline
+        """
+        deadline = time.monotonic() + timeout
+        phases = {}
+        for target in cls.targets():
+            phases.setdefault(getattr(target, '_shutdown_phase', 1), []).append(target)
+        threads = []
+        for phase in sorted(phases):
+            phase_threads = []
+            for target in phases[phase]:
+                thread = threading.Thread(name=f'LogShutdownThread-{len(threads) + len(phase_threads)}', target=cls.__shutdown_target,
+                                          args=(target, deadline), daemon=True)
+                thread.start()
+                phase_threads.append(thread)
+            for thread in phase_threads:
+                thread.join(max(0.0, deadline - time.monotonic()))
+            threads += phase_threads
+        return not any(thread.is_alive() for thread in threads)
+
+    @classmethod
+    def __call_targets(cls, method_name: str, targets: typing.Optional[list] = None) -> None:
+        for target in cls.targets() if targets is None else targets:
+            method = getattr(target, method_name, None)
+            if method is None:
+                continue
+            try:
+                method()
+            except Exception:
+                pass
+
+    @classmethod
+    def __fork_order(cls) -> list:
+        """ The targets in the order of their locks on the write path, e.g. the sinks before the loggers """
+        return sorted(cls.__targets, key=lambda target: getattr(target, '_shutdown_phase', 1), reverse=True)
+
+    @classmethod
+    def _before_fork(cls) -> None:
+        cls.__lock.acquire()
+        cls.__call_targets('_before_fork', cls.__fork_order())
+
+    @classmethod
+    def _after_fork_in_parent(cls) -> None:
+        cls.__call_targets('_after_fork_in_parent', cls.__fork_order()[::-1])
+        cls.__lock.release()
+
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        # The lock is held by the forking thread of the parent, which does not exist in the child
+        cls.__lock = threading.Lock()
+        cls.__call_targets('_after_fork_in_child')
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(
+        before=_ProcessManager._before_fork,
+        after_in_parent=_ProcessManager._after_fork_in_parent,
+        after_in_child=_ProcessManager._after_fork_in_child,
+    )
@@ -1,6 +1,12 @@
-from ._JFLogger import JFLogger, Logger, JFClassLogger
+from ._JFLogger import JFLogger, Logger, JFClassLogger, JFLoggerAdapter, JFChildLogger
 from ._JFLogger_Group import JFLoggerGroup, LoggerGroup
-from ._LogEnum import LogLevel, LogHighlightType
+from ._JFLogger_Async import JFAsyncLogger
+from ._Log_Sink import JFLogSink, FileSink, ConsoleSink, SignalSink, BatchedSignalSink
+from ._Log_Socket_Sink import SocketSink
+from ._Log_Profiler import JFLogProfiler
+from ._Log_Redactor import JFLogRedactor
+from ._Log_Columnar import JFLogColumnarArchive
+from ._LogEnum import LogLevel, LogHighlightType, LogRenderType
 
 __all__ = [
     "JFLogger",
@@ -9,5 +15,18 @@ __all__ = [
     "LoggerGroup",
     "LogLevel",
     "LogHighlightType",
-    "JFClassLogger"
+    "LogRenderType",
+    "JFClassLogger",
+    "JFLoggerAdapter",
+    "JFChildLogger",
+    "JFAsyncLogger",
+    "JFLogSink",
+    "FileSink",
+    "ConsoleSink",
+    "SignalSink",
+    "BatchedSignalSink",
+    "SocketSink",
+    "JFLogProfiler",
+    "JFLogRedactor",
+    "JFLogColumnarArchive",
 ]
@@ -0,0 +1,4 @@
+import sys
+from ._Log_Search import main
+
+sys.exit(main())
@@ -3,7 +3,10 @@ from .Enum_Static import StaticEnum
 from ._Event_Signal import (EventSignal, EventSignalInstance, PrioritySignal, PrioritySignalInstance, AsyncSignal,
                             AsyncSignalInstance, EventSignalBoundInstance, PrioritySignalBoundInstance,
                             AsyncSignalBoundInstance)
-from ._JFLogger import JFLogger, JFLoggerGroup, Logger, LoggerGroup, LogLevel, LogHighlightType, JFClassLogger
+from ._JFLogger import (JFLogger, JFLoggerGroup, Logger, LoggerGroup, LogLevel, LogHighlightType, JFClassLogger,
+                        JFLoggerAdapter, JFChildLogger, JFAsyncLogger, JFLogSink, FileSink, ConsoleSink, SignalSink,
+                        BatchedSignalSink, SocketSink, JFLogProfiler, JFLogRedactor, JFLogColumnarArchive,
+                        LogRenderType)
 from .JFTimer import JFTimer
 
 __all__ = [
@@ -12,8 +15,21 @@ __all__ = [
     'Logger',
     'LoggerGroup',
     'JFClassLogger',
+    'JFLoggerAdapter',
+    'JFChildLogger',
+    'JFAsyncLogger',
+    'JFLogSink',
+    'FileSink',
+    'ConsoleSink',
+    'SignalSink',
+    'BatchedSignalSink',
+    'SocketSink',
+    'JFLogProfiler',
+    'JFLogRedactor',
+    'JFLogColumnarArchive',
     'LogLevel',
     'LogHighlightType',
+    'LogRenderType',
     'EventSignal',
     'EventSignalInstance',
     'EventSignalBoundInstance',
@@ -0,0 +1,913 @@
+import asyncio
+import gc
+import io
+import pytest
+import logging
+import threading
+import math
+import socket
+import sys
+import struct
+import os
+import time
+import tracemalloc
+from datetime import datetime
+from DToolslib import (JFLogger, JFClassLogger, JFLoggerAdapter, JFChildLogger, JFAsyncLogger, JFLogSink, FileSink, ConsoleSink,
+                       SocketSink, JFLogRedactor, JFLogColumnarArchive, LogLevel, LogRenderType)
+from DToolslib._JFLogger._Process_Manager import _ProcessManager
+
+
+def test_listen_logging_forwards_record_fields():
+    """测试 logging 桥接直接使用 LogRecord 的调用者信息"""
+    Log = JFLogger('test_listen_logging', enableConsoleOutput=False)
+    Log.set_message_format('%(moduleName)s|%(functionName)s|%(lineNum)s|%(threadName)s|%(processName)s|%(message)s')
+    received = []
+    Log.signal_format.connect(lambda level, text: received.append((level, text)))
+    Log.set_listen_logging('test_listen_logging', level=LogLevel.INFO)
+
+    def emit_from_logging():
+        logging.getLogger('test_listen_logging').warning('hello %s', 'bridge')
+
+    emit_from_logging()
+    Log.remove_listen_logging()
+    assert len(received) == 1
+    level, text = received[0]
+    assert level == LogLevel.WARNING
+    module_name, function_name, line_num, thread_name, process_name, message = text.strip().split('|')
+    assert module_name == 'test_JFLogger'
+    assert function_name == 'emit_from_logging'
+    assert line_num.isdigit()
+    assert thread_name == 'MainThread'
+    assert message == 'hello bridge'
+    # The same form as the native records, e.g. `python(MainProcess)`
+    Log.info('native')
+    assert process_name == received[-1][1].split('|')[4] and process_name.endswith('(MainProcess)')
+
+
+def test_class_logger_shared_adapters():
+    """测试 JFClassLogger 共享日志器模式, 每个实例仅创建轻量的适配器"""
+
+    class Worker:
+        Log = JFClassLogger('test_class_logger_shared', enableConsoleOutput=False, isSharedLogger=True)
+
+        def run(self):
+            self.Log.info('running')
+
+    workers = [Worker() for _ in range(3)]
+    adapters = [worker.Log for worker in workers]
+    assert all(isinstance(adapter, JFLoggerAdapter) for adapter in adapters)
+    assert len({id(adapter.logger) for adapter in adapters}) == 1
+    assert workers[0].Log is adapters[0]
+
+    adapters[0].set_message_format('%(instanceId)s|%(functionName)s|%(message)s')
+    received = []
+    adapters[0].signal_format.connect(lambda level, text: received.append(text.strip()))
+    for worker in workers:
+        worker.run()
+    assert received == [f'0x{id(worker):016x}|run|running' for worker in workers]
+
+
+def test_bind_context():
+    """测试 bind 返回携带不可变上下文的子视图, 且不修改原日志器"""
+    Log = JFLogger('test_bind_context', enableConsoleOutput=False)
+    Log.set_message_format('%(requestId)s|%(user)s|%(message)s')
+    received = []
+    Log.signal_format.connect(lambda level, text: received.append(text.strip()))
+    request_log = Log.bind(requestId='r1')
+    user_log = request_log.bind(user='alice')
+    user_log.info('a')
+    request_log.info('b')
+    Log.info('c')
+    assert received == ['r1|alice|a', 'r1||b', '||c']
+    assert dict(request_log.context) == {'requestId': 'r1'}
+
+
+def test_extra_fields_precedence():
+    """测试 extra 字段优先于 bind 上下文和构造参数, 并且提供调用者字段时跳过栈查找"""
+    Log = JFLogger('test_extra_fields', enableConsoleOutput=False, tag='init')
+    Log.set_message_format('%(tag)s|%(moduleName)s|%(functionName)s|%(message)s')
+    received = []
+    Log.signal_format.connect(lambda level, text: received.append(text.strip()))
+    Log.info('a')
+    Log.bind(tag='bound').info('b')
+    Log.bind(tag='bound').info('c', extra={'tag': 'extra'})
+    Log.warning('d', extra={'moduleName': 'worker', 'functionName': 'Worker.run'})
+    assert received == [
+        'init|test_JFLogger|test_extra_fields_precedence|a',
+        'bound|test_JFLogger|test_extra_fields_precedence|b',
+        'extra|test_JFLogger|test_extra_fields_precedence|c',
+        'init|worker|Worker.run|d',
+    ]
+
+
+def test_async_logger_hands_off_to_writer():
+    """测试 asyncio 前端: 记录由写入线程处理, 包含任务名和 contextvars 上下文"""
+    Log = JFLogger('test_async_logger', enableConsoleOutput=False)
+    Log.set_message_format('%(taskName)s|%(requestId)s|%(functionName)s|%(message)s')
+    ALog = JFAsyncLogger(Log)
+    received = []
+    Log.signal_format.connect(lambda level, text: received.append((threading.current_thread().name, text.strip())))
+
+    async def handle(request_id):
+        with ALog.contextualize(requestId=request_id):
+            ALog.info('handled')
+
+    async def main():
+        await asyncio.gather(asyncio.create_task(handle('r1'), name='task-1'),
+                             asyncio.create_task(handle('r2'), name='task-2'))
+        await ALog.aflush()
+
+    asyncio.run(main())
+    ALog.close()
+    assert sorted(text for _, text in received) == ['task-1|r1|handle|handled', 'task-2|r2|handle|handled']
+    assert all(thread_name.startswith('JFAsyncLoggerWriter') for thread_name, _ in received)
+
+
+def test_exception_dedup():
+    """测试重复异常仅首次输出完整 traceback, 之后输出简短引用和计数"""
+    Log = JFLogger('test_exception_dedup', enableConsoleOutput=False)
+    Log.set_message_format('%(message)s')
+    Log.set_enable_trackback_exception(True)
+    Log.set_enable_exception_dedup(True, repeat_every=3)
+    received = []
+    Log.signal_message.connect(lambda level, msg: received.append(msg))
+    for _ in range(4):
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            Log.exception()
+    assert 'Traceback (most recent call last)' in received[0]
+    assert received[1].startswith('ZeroDivisionError: division by zero [repeated exception #')
+    assert received[1].endswith('occurrence 2]')
+    assert 'occurrence 3]' in received[2]
+    assert 'Traceback (most recent call last)' in received[3]
+    assert 'occurrence 4]' in received[3]
+
+
+def test_exception_dedup_repeat_every():
+    """测试 repeat_every 为 1 时每次输出完整文本, 为 3 时在第 1, 4, 7 次输出, 负数报错"""
+    Log = JFLogger('test_exception_dedup_repeat', enableConsoleOutput=False)
+    Log.set_message_format('%(message)s')
+    received = []
+    Log.signal_message.connect(lambda level, msg: received.append(msg))
+    for repeat_every, count in ((1, 3), (3, 7)):
+        Log.set_enable_exception_dedup(True, repeat_every=repeat_every)
+        received.clear()
+        for _ in range(count):
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                Log.exception()
+        full = [idx + 1 for idx, msg in enumerate(received) if msg.startswith('[exception #')]
+        assert full == ([1, 2, 3] if repeat_every == 1 else [1, 4, 7])
+    with pytest.raises(ValueError):
+        Log.set_enable_exception_dedup(True, repeat_every=-1)
+
+
+def test_rollover_deadline_and_record_limit(tmp_path):
+    """测试预先计算的轮转截止时间, 以及按记录数轮转"""
+    from DToolslib._JFLogger._JFLogger import _next_rollover_deadline
+    now = datetime(2025, 1, 1, 10, 7, 30).timestamp()
+    assert _next_rollover_deadline(now, False) == math.inf
+    assert _next_rollover_deadline(now, True) == datetime(2025, 1, 2).timestamp()
+    assert _next_rollover_deadline(now, False, 3600) == datetime(2025, 1, 1, 11).timestamp()
+    assert _next_rollover_deadline(now, True, 15 * 60) == datetime(2025, 1, 1, 10, 15).timestamp()
+
+    Log = JFLogger('test_record_limit', str(tmp_path), enableConsoleOutput=False)
+    Log.set_file_record_limit(2)
+    for i in range(5):
+        Log.info(f'message {i}')
+    log_files = sorted(os.listdir(Log.log_dir), key=lambda name: int(name.rsplit('--', 1)[-1][:-4]))
+    assert len(log_files) == 3
+    contents = [open(os.path.join(Log.log_dir, name), encoding='utf-8').read() for name in log_files]
+    assert [content.count('message ') for content in contents] == [2, 2, 1]
+
+
+class _NoisySubsystem:
+    def run(self, Log):
+        Log.debug('subsystem debug')
+
+
+def test_level_overrides():
+    """测试按模块/类/函数的日志级别覆盖"""
+    Log = JFLogger('test_level_overrides', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(message)s')
+    received = []
+    Log.signal_message.connect(lambda level, msg: received.append(msg))
+    Log.set_level_for(f'{__name__}._NoisySubsystem', LogLevel.DEBUG)
+    _NoisySubsystem().run(Log)
+    Log.debug('module debug')
+    Log.set_level_for(__name__, LogLevel.WARNING)
+    Log.info('module info')
+    _NoisySubsystem().run(Log)
+    Log.remove_level_for(f'{__name__}._NoisySubsystem')
+    _NoisySubsystem().run(Log)
+    assert received == ['subsystem debug', 'subsystem debug']
+
+
+def test_shutdown_drains_without_sleep(tmp_path):
+    """测试进程级关闭管理器: 并行处理所有日志器并在完成后立即返回"""
+    loggers = [JFLogger(f'test_shutdown_{i}', str(tmp_path), enableConsoleOutput=False) for i in range(10)]
+    for Log in loggers:
+        Log.set_enable_runtime_zip(True)
+        Log.info('before exit')
+    start = time.monotonic()
+    assert _ProcessManager.shutdown(timeout=5)
+    assert time.monotonic() - start < 2
+    for Log in loggers:
+        assert os.path.exists(Log.zip_file_path)
+        assert not os.path.exists(Log.current_log_file_path)
+        Log.set_enable_runtime_zip(False)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='os.fork is not available')
+def test_fork_child_writes_own_file(tmp_path):
+    """测试 fork 后子进程重建锁和队列, 并写入自己的日志文件"""
+    Log = JFLogger('test_fork_safety', str(tmp_path), enableConsoleOutput=False)
+    Log.info('parent before fork')
+    pid = os.fork()
+    if pid == 0:
+        try:
+            Log.info('child')
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+    Log.info('parent after fork')
+    log_files = sorted(os.listdir(Log.log_dir))
+    assert len(log_files) == 2
+    child_file = [name for name in log_files if f'-{pid}]' in name]
+    assert len(child_file) == 1
+    content = open(os.path.join(Log.log_dir, child_file[0]), encoding='utf-8').read()
+    assert 'child' in content and 'parent' not in content
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='os.fork is not available')
+def test_fork_console_buffer_stays_in_parent(tmp_path):
+    """测试 fork 后子进程不会再次输出父进程缓冲的控制台记录"""
+    path = tmp_path / 'console.txt'
+    Log = JFLogger('test_fork_console', str(tmp_path), enableConsoleOutput=False, enableFileOutput=False)
+    Log.set_message_format('%(message)s')
+    with open(path, 'a', encoding='utf-8') as stream:
+        sink = ConsoleSink(stream, enableColor=False, buffer_size=1 << 20, max_latency=60)
+        Log.add_sink(sink)
+        Log.info('parent-only-record')
+        pid = os.fork()
+        if pid == 0:
+            try:
+                Log.info('child-record')
+                sink.flush()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        sink.flush()
+        Log.remove_sink(sink)
+    content = path.read_text(encoding='utf-8')
+    assert content.count('parent-only-record') == 1
+    assert content.count('child-record') == 1
+
+
+def test_fork_locks_in_write_path_order():
+    """测试 fork 前先获取输出端的锁, 再获取日志器的锁, 与写入路径的顺序一致"""
+    calls = []
+
+    class Target(object):
+        def __init__(self, name, phase):
+            self.name = name
+            self._shutdown_phase = phase
+
+        def _before_fork(self):
+            calls.append(('before', self.name))
+
+        def _after_fork_in_parent(self):
+            calls.append(('after', self.name))
+
+    targets = [Target('front', 0), Target('logger', 1), Target('sink', 2)]
+    for target in targets:
+        _ProcessManager.register(target)
+    try:
+        _ProcessManager._before_fork()
+        _ProcessManager._after_fork_in_parent()
+    finally:
+        for target in targets:
+            _ProcessManager.unregister(target)
+    assert calls == [('before', 'sink'), ('before', 'logger'), ('before', 'front'),
+                     ('after', 'front'), ('after', 'logger'), ('after', 'sink')]
+
+
+def test_lazy_messages_and_disabled_noop():
+    """测试惰性消息, isEnabledFor 以及禁用级别的方法被替换为空操作"""
+    Log = JFLogger('test_lazy_messages', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(message)s')
+    received = []
+    Log.signal_message.connect(lambda level, msg: received.append(msg))
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return 'expensive'
+
+    assert not Log.isEnabledFor(LogLevel.DEBUG)
+    assert Log.isEnabledFor('warning')
+    assert 'debug' in Log.__dict__ and 'info' not in Log.__dict__
+    Log.debug('value: %s', expensive, lazy=True)
+    Log.info('value: %s, %d', expensive, 3, lazy=True)
+    assert calls == [1]
+    assert received == ['value: expensive, 3']
+    Log.info('progress 50% done', 'x', lazy=True)
+    Log.info('type', int, lazy=True)
+    assert received[-2:] == ['progress 50% done x', "type <class 'int'>"]
+    Log.set_level(LogLevel.DEBUG)
+    assert 'debug' not in Log.__dict__
+    Log.debug('debug enabled')
+    assert received[-1] == 'debug enabled'
+
+
+def test_message_truncation_and_chunked_write(tmp_path):
+    """测试参数截断, 以及超长消息分块写入文件且内容不变"""
+    Log = JFLogger('test_message_truncation', str(tmp_path), enableConsoleOutput=False)
+    Log.set_message_format('%(levelName)s|%(message)s')
+    received = []
+    Log.signal_message.connect(lambda level, msg: received.append(msg))
+    Log.set_message_truncation(max_chars=20, max_items=3)
+    Log.info('a' * 25, list(range(1000)))
+    assert received[-1] == 'aaaaaaaaaaaaaaaaaaaa ...<5 chars truncated> [0, 1, 2, ...]'
+
+    Log.set_message_truncation()
+    Log.set_message_chunk_size(100)
+    formatted = []
+    Log.signal_format.connect(lambda level, text: formatted.append(text))
+    huge = ''.join(f'{i:05d}' for i in range(1000))
+    Log.info(huge)
+    assert formatted[-1] == f'INFO|{huge}\n'
+    content = open(Log.current_log_file_path, encoding='utf-8').read()
+    assert content.endswith(f'INFO|{huge}\n')
+
+
+def test_sinks_levels_flavours_and_isolation(tmp_path):
+    """测试输出端: 各自的级别和渲染类型, 独立工作线程, 以及异常隔离"""
+
+    class ListSink(JFLogSink):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.records = []
+
+        def write(self, level, text):
+            self.records.append((threading.current_thread().name, level, text))
+
+    class BrokenSink(JFLogSink):
+        def write(self, level, text):
+            raise RuntimeError('broken sink')
+
+    Log = JFLogger('test_sinks', enableConsoleOutput=False, enableFileOutput=False)
+    Log.set_message_format('%(levelName)s|%(message)s')
+    message_sink = ListSink(flavour=LogRenderType.MESSAGE, level=LogLevel.WARNING)
+    threaded_sink = ListSink(isThreaded=True, name='threaded')
+    broken_sink = BrokenSink()
+    file_sink = FileSink(str(tmp_path / 'sink.log'))
+    for sink in (broken_sink, message_sink, threaded_sink, file_sink):
+        Log.add_sink(sink)
+    Log.info('a')
+    Log.warning('b')
+    assert threaded_sink.flush(timeout=5)
+    assert message_sink.records == [('MainThread', LogLevel.WARNING, 'b')]
+    assert [record[1:] for record in threaded_sink.records] == [(LogLevel.INFO, 'INFO|a\n'), (LogLevel.WARNING, 'WARNING|b\n')]
+    assert all(record[0] == 'LogSinkWorker-threaded' for record in threaded_sink.records)
+    assert broken_sink.failed_count == 2
+    file_sink.close()
+    assert open(file_sink.file_path, encoding='utf-8').read() == 'INFO|a\nWARNING|b\n'
+    Log.remove_sink(threaded_sink)
+    threaded_sink.close()
+    Log.info('c')
+    assert len(threaded_sink.records) == 2
+
+
+def test_sink_writes_synchronously_after_shutdown():
+    """测试进程退出时输出端不丢弃之后的记录, 而是在调用线程上写入并刷新"""
+
+    class ListSink(JFLogSink):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.records = []
+            self.flush_count = 0
+
+        def write(self, level, text):
+            self.records.append((threading.current_thread().name, text))
+
+        def flush_output(self):
+            self.flush_count += 1
+
+    Log = JFLogger('test_sink_shutdown', enableConsoleOutput=False, enableFileOutput=False)
+    Log.set_message_format('%(message)s')
+    sink = ListSink(flavour=LogRenderType.MESSAGE, isThreaded=True, name='exiting')
+    Log.add_sink(sink)
+    Log.info('before exit')
+    sink._shutdown(time.monotonic() + 5)
+    assert sink.records == [('LogSinkWorker-exiting', 'before exit')]
+    assert sink.isActive and not sink.isThreaded
+    flush_count = sink.flush_count
+    Log.info('from atexit handler')
+    assert sink.records[-1] == (threading.current_thread().name, 'from atexit handler')
+    assert sink.flush_count == flush_count + 1
+    Log.remove_sink(sink)
+    sink.close()
+
+
+def test_console_sink_batches_plain_bytes(monkeypatch):
+    """测试控制台输出端: 非终端时不输出 ANSI, 合并写入字节缓冲区, 并遵守延迟上限"""
+
+    class CountingBytesIO(io.BytesIO):
+        write_count = 0
+
+        def write(self, data):
+            self.write_count += 1
+            return super().write(data)
+
+    raw = CountingBytesIO()
+    stream = io.TextIOWrapper(raw, encoding='utf-8')
+    sink = ConsoleSink(stream, max_latency=0.05)
+    assert not sink.enableColor and sink.flavour == LogRenderType.PLAIN
+    monkeypatch.setenv('NO_COLOR', '1')
+    monkeypatch.setattr(stream, 'isatty', lambda: True, raising=False)
+    assert not ConsoleSink(stream).enableColor
+
+    Log = JFLogger('test_console_sink', enableConsoleOutput=False)
+    Log.set_message_format('%(levelName)s|%(message)s')
+    Log.add_sink(sink)
+    for i in range(100):
+        Log.info(f'message {i}')
+    assert raw.write_count == 0
+    Log.error('failed')
+    assert raw.write_count == 1
+    assert raw.getvalue().decode('utf-8').count('\n') == 101 and '\x1b[' not in raw.getvalue().decode('utf-8')
+    Log.info('late')
+    deadline = time.monotonic() + 2
+    while raw.write_count == 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert raw.getvalue().decode('utf-8').endswith('INFO|late\n')
+    sink.close()
+
+
+def _run_collector(server_socket, received):
+    """ 本地替身收集器: 接收一个连接并解析长度前缀的批次 """
+    conn, _ = server_socket.accept()
+    with conn:
+        buffer = b''
+        while True:
+            data = conn.recv(65536)
+            if not data:
+                break
+            buffer += data
+            while len(buffer) >= 5:
+                length, flags = struct.unpack('!IB', buffer[:5])
+                if len(buffer) < 5 + length:
+                    break
+                received.append(SocketSink.unpack_batch(flags, buffer[5:5 + length]))
+                buffer = buffer[5 + length:]
+
+
+def test_socket_sink_batches_and_reconnects():
+    """测试套接字输出端: 未连接时暂存记录, 重连后按压缩批次发送"""
+    probe = socket.socket()
+    probe.bind(('127.0.0.1', 0))
+    address = probe.getsockname()
+    probe.close()
+
+    Log = JFLogger('test_socket_sink', enableConsoleOutput=False, enableFileOutput=False)
+    Log.set_message_format('%(message)s')
+    sink = SocketSink(address, flavour=LogRenderType.MESSAGE, enableCompression=True, backoff=(0.02, 0.05),
+                      max_spill=50)
+    Log.add_sink(sink)
+    for i in range(60):
+        Log.info(f'record {i}')
+    assert sink.overflow_count >= 9 and not sink.isConnected
+
+    server_socket = socket.socket()
+    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server_socket.bind(address)
+    server_socket.listen()
+    received = []
+    collector = threading.Thread(target=_run_collector, args=(server_socket, received), daemon=True)
+    collector.start()
+    deadline = time.monotonic() + 5
+    while sink.sent_count < 60 - sink.overflow_count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    Log.warning('after reconnect')
+    sink.close()
+    collector.join(5)
+    server_socket.close()
+    records = [record for batch in received for record in batch]
+    numbers = [int(text.split()[-1]) for _, text in records[:-1]]
+    assert numbers == sorted(numbers) and numbers[-1] == 59
+    assert records[-1] == (LogLevel.WARNING, 'after reconnect')
+    assert len(records) == 61 - sink.overflow_count and len(received) < len(records)
+
+
+def test_socket_sink_backoff_limits_connects(monkeypatch):
+    """测试套接字输出端在收集器不可达时按退避时间重连, 写入和刷新不会提前唤醒重连"""
+    probe = socket.socket()
+    probe.bind(('127.0.0.1', 0))
+    address = probe.getsockname()
+    probe.close()
+    attempts = []
+    create_connection = socket.create_connection
+
+    def counting_create_connection(*args, **kwargs):
+        attempts.append(time.monotonic())
+        return create_connection(*args, **kwargs)
+
+    monkeypatch.setattr(socket, 'create_connection', counting_create_connection)
+    sink = SocketSink(address, backoff=(1.0, 8.0), batch_size=10, max_latency=0.01)
+    start = time.monotonic()
+    for i in range(200):
+        sink.write(LogLevel.INFO, f'record {i}')
+        if i % 20 == 0:
+            sink.flush()
+        time.sleep(0.005)
+    elapsed = time.monotonic() - start
+    sink.close(1)
+    assert 1 <= len(attempts) <= 2 + int(elapsed)
+
+
+def test_registry_get_and_child_loggers(tmp_path):
+    """测试注册表按名称查找, 子日志器复用父日志器输出并继承级别, 以及释放后名称可复用"""
+    Log = JFLogger('test_registry', str(tmp_path), enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(logName)s|%(levelName)s|%(message)s')
+    received = []
+    Log.signal_format.connect(lambda level, text: received.append(text.strip()))
+    assert JFLogger.get('test_registry') is Log
+    assert JFLogger.get('test_registry_missing') is None
+    pool_log = JFLogger.get('test_registry.db.pool')
+    assert isinstance(pool_log, JFChildLogger)
+    assert pool_log is Log.get_child('db').get_child('pool')
+    assert pool_log.parent is JFLogger.get('test_registry.db')
+    pool_log.info('a')
+    pool_log.debug('hidden')
+    pool_log.parent.set_level(LogLevel.DEBUG)
+    pool_log.debug('b')
+    Log.debug('hidden')
+    assert received == ['test_registry.db.pool|INFO|a', 'test_registry.db.pool|DEBUG|b']
+    del pool_log
+    Log.get_child('cache').set_level(LogLevel.ERROR)
+    gc.collect()
+    assert Log.get_child('cache').log_level == LogLevel.ERROR
+    assert JFLogger.get('test_registry.db').log_level == LogLevel.DEBUG
+    assert os.listdir(os.path.dirname(Log.log_dir)) == ['test_registry']
+
+    with pytest.raises(ValueError):
+        JFLogger('test_registry')
+    Temp = JFLogger('test_registry_temp', enableConsoleOutput=False)
+    del Temp
+    gc.collect()
+    assert JFLogger.get('test_registry_temp') is None
+    assert JFLogger('test_registry_temp', enableConsoleOutput=False).name == 'test_registry_temp'
+
+
+def test_profiler_samples_stages():
+    """测试性能分析器: 按采样率记录各阶段耗时, 并按日志器汇总百分位数"""
+    Log = JFLogger('test_profiler', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    sampled = []
+    Log.set_profiler(True, sample_rate=0.5, callback=lambda log_name, timings: sampled.append((log_name, timings)))
+    Log.signal_message.connect(lambda level, msg: None)
+    for i in range(10):
+        Log.info('message', i)
+    Log._log(LogLevel.DEBUG, ('rejected',))
+    assert len(sampled) == 6
+    assert list(sampled[-1][1]) == ['level_gate']
+    log_name, timings = sampled[0]
+    assert log_name == 'test_profiler'
+    assert {'level_gate', 'message', 'caller_lookup', 'field_collection', 'rendering',
+            'sink:test_profiler.signal_message'} <= set(timings)
+    stats = Log.profiler.percentiles((50, 99))
+    assert stats['rendering']['count'] == 5
+    assert 0 <= stats['rendering']['p50'] <= stats['rendering']['p99']
+    Log.set_profiler(False)
+    assert Log.profiler is None
+
+
+def test_records_reuse_scratch_without_growth():
+    """测试记录渲染复用线程内的字段字典: 嵌套日志互不干扰, 稳定运行时内存块不增长"""
+    Log = JFLogger('test_scratch', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(levelName)s %(message)s')
+    messages = []
+    collect = lambda level, text: messages.append(text.split())
+    Log.signal_format.connect(collect)
+
+    class _Nested:
+        def __str__(self):
+            Log.warning('inner')
+            return 'outer'
+
+    Log.info(_Nested())
+    assert messages == [['WARNING', 'inner'], ['INFO', 'outer']]
+    Log.signal_format.disconnect(collect)
+    Log.signal_format.connect(lambda level, text: None)
+    Log.signal_colorized.connect(lambda level, text: None)
+    for i in range(200):
+        Log.info('value', i)
+    # Only the blocks allocated by the logger count, the threads of other tests allocate meanwhile
+    logger_files = [tracemalloc.Filter(True, f'*{os.sep}_JFLogger{os.sep}*')]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot().filter_traces(logger_files)
+        for i in range(500):
+            Log.info('value', i)
+        gc.collect()
+        after = tracemalloc.take_snapshot().filter_traces(logger_files)
+    finally:
+        tracemalloc.stop()
+    assert sum(stat.count_diff for stat in after.compare_to(before, 'filename')) < 50
+
+
+@pytest.mark.skipif(not os.environ.get('JFLOG_BENCHMARK'), reason='set JFLOG_BENCHMARK=1 to run the benchmark')
+def test_benchmark_info_allocations():
+    """基准测试: 统计每次 info() 调用的临时分配字节数和残留内存块数, 运行 JFLOG_BENCHMARK=1 pytest -s -k benchmark"""
+    Log = JFLogger('test_benchmark_alloc', enableConsoleOutput=False, enableFileOutput=False, log_level=LogLevel.INFO)
+    Log.signal_format.connect(lambda level, text: None)
+    for i in range(200):
+        Log.info('value', i)
+    calls = 2000
+    gc.collect()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        peak_bytes = 0
+        before = tracemalloc.take_snapshot()
+        for i in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            Log.info('value', i)
+            peak_bytes += tracemalloc.get_traced_memory()[1] - current
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    start = time.perf_counter()
+    for i in range(calls):
+        Log.info('value', i)
+    elapsed = time.perf_counter() - start
+    print(f'\ninfo(): {peak_bytes / calls:.0f} temporary bytes and {retained / calls:.3f} retained blocks per call, '
+          f'{elapsed / calls * 1e6:.1f} us per call without tracing')
+
+
+def test_stacklevel_direct_frame_lookup():
+    """测试 stacklevel: 直接按深度定位调用者, 日志器默认值与适配器/异常方法的深度"""
+    Log = JFLogger('test_stacklevel', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(functionName)s %(lineNum)s %(message)s')
+    records = []
+    Log.signal_message.connect(lambda level, msg: None)
+    Log.signal_format.connect(lambda level, text: records.append(text.split()))
+
+    def log_state(state):
+        Log.info(state, stacklevel=2)
+
+    def caller():
+        log_state('direct')
+        return sys._getframe().f_lineno - 1
+
+    line = caller()
+    assert records[-1] == ['caller', str(line), 'direct']
+    Log.bind(user='u').info('adapter', stacklevel=1)
+    assert records[-1] == ['test_stacklevel_direct_frame_lookup', str(sys._getframe().f_lineno - 1), 'adapter']
+    Log.set_stacklevel(1)
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        Log.get_child('sub').exception('failed')
+        line = sys._getframe().f_lineno - 1
+    assert records[-1][:2] == ['test_stacklevel_direct_frame_lookup', str(line)]
+    Log.info('too deep', stacklevel=10000)
+    assert records[-1][-2:] == ['too', 'deep']
+    with pytest.raises(ValueError):
+        Log.set_stacklevel(0)
+
+
+def test_log_once_and_every_by_call_site(monkeypatch):
+    """测试按调用位置限流: once 只输出一次, every(n) 每 n 次输出, every_seconds 按时间间隔输出"""
+    Log = JFLogger('test_limited', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(functionName)s %(message)s')
+    records = []
+    Log.signal_format.connect(lambda level, text: records.append(text.split()))
+    for i in range(5):
+        Log.info_once('once', i)
+        Log.warning_every(2, 'every', i)
+        Log.debug_every(1, 'disabled', i)
+    Log.info_once('other site')
+    assert records == [['test_log_once_and_every_by_call_site', 'once', '0'],
+                       ['test_log_once_and_every_by_call_site', 'every', '0'],
+                       ['test_log_once_and_every_by_call_site', 'every', '2'],
+                       ['test_log_once_and_every_by_call_site', 'every', '4'],
+                       ['test_log_once_and_every_by_call_site', 'other', 'site']]
+    records.clear()
+    now = [100.0]
+    monkeypatch.setattr(time, 'monotonic', lambda: now[0])
+    for step in (0, 0.5, 1.0, 1.2, 2.1):
+        now[0] = 100.0 + step
+        Log.error_every_seconds(1, 'tick', step)
+    assert [record[-1] for record in records] == ['0', '1.0', '2.1']
+    with pytest.raises(ValueError):
+        Log.info_every(0, 'invalid')
+
+
+def test_log_once_on_adapter_and_child_logger():
+    """测试适配器和子日志器的限流方法: 保留绑定的上下文, 子日志器名称和级别"""
+    Log = JFLogger('test_limited_views', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(requestId)s %(logName)s %(functionName)s %(message)s')
+    records = []
+    Log.signal_format.connect(lambda level, text: records.append(text.split()))
+    adapter = Log.bind(requestId='R1')
+    child = Log.get_child('db').set_level(LogLevel.ERROR)
+    for i in range(3):
+        adapter.info_once('once', i)
+        child.warning_every(1, 'hidden', i)
+        child.error_every(2, 'every', i)
+    assert records == [['R1', 'test_limited_views', 'test_log_once_on_adapter_and_child_logger', 'once', '0'],
+                       ['test_limited_views.db', 'test_log_once_on_adapter_and_child_logger', 'every', '0'],
+                       ['test_limited_views.db', 'test_log_once_on_adapter_and_child_logger', 'every', '2']]
+
+
+def test_redaction_once_before_rendering():
+    """测试脱敏: 键值与正则合并为一个表达式, 所有输出共享脱敏结果并统计命中次数"""
+    Log = JFLogger('test_redaction', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(message)s')
+    Log.set_redaction(keys=('password', 'token'), patterns={'card': JFLogRedactor.CARD_NUMBER})
+    formatted, messages = [], []
+    Log.signal_format.connect(lambda level, text: formatted.append(text))
+    Log.signal_message.connect(lambda level, msg: messages.append(msg))
+    Log.info('login', 'password=hunter2', {'Token': 'abc'}, 'card 4111 1111 1111 1111')
+    Log.info('nothing secret')
+    assert messages[0] == "login password=*** {'Token': '***'} card ***"
+    assert formatted[0] == messages[0] + '\n'
+    assert messages[1] == 'nothing secret'
+    assert Log.redactor.hit_counts == {'password': 1, 'token': 1, 'card': 1}
+    Log.redactor.reset_counts()
+    assert Log.redactor.hit_counts['card'] == 0
+    Log.set_redaction()
+    assert Log.redactor is None
+    with pytest.raises(ValueError):
+        JFLogRedactor(patterns={'broken': '(unclosed'})
+    redactor = JFLogRedactor(patterns={'pair': r'id-(?P<n>\d+)-(?P=n)', 'word': r'x(?P<n>[a-z]+)'})
+    assert redactor.redact('id-12-12 id-1-2 xab') == '*** id-1-2 ***'
+    assert redactor.hit_counts == {'pair': 1, 'word': 1}
+
+
+def _wait_for_files(folder, suffix, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        names = sorted(name for name in os.listdir(folder) if name.endswith(suffix))
+        if len(names) >= count:
+            return names
+        time.sleep(0.01)
+    return sorted(name for name in os.listdir(folder) if name.endswith(suffix))
+
+
+def test_columnar_archive_on_rotation(tmp_path):
+    """测试轮转后转换为列式归档: 按列读取, 字典编码的字符串列, 按级别和模块分组计数"""
+    Log = JFLogger('test_columnar', str(tmp_path), enableConsoleOutput=False)
+    Log.set_file_record_limit(3)
+    Log.set_enable_columnar_archive(True)
+    Log.info('first')
+    Log.warning('multi\nline\n[not a header]')
+    Log.info('third', 3)
+    Log.info('next file')
+    archives = _wait_for_files(Log.log_dir, '.jfcol', 1)
+    assert len(archives) == 1
+    archive = JFLogColumnarArchive(os.path.join(Log.log_dir, archives[0]))
+    assert archive.row_count == 3
+    assert set(archive.columns) == {'timestamp', 'level', 'logger', 'module', 'function', 'line', 'message'}
+    columns = archive.read(['level', 'message', 'function', 'line'])
+    assert columns['level'] == ['INFO', 'WARNING', 'INFO']
+    assert columns['message'] == ['first', 'multi\nline\n[not a header]', 'third 3']
+    assert columns['function'] == ['test_columnar_archive_on_rotation'] * 3
+    assert all(line > 0 for line in columns['line'])
+    codes, values = archive.read_codes('level')
+    assert list(codes) == [0, 1, 0] and values == ['INFO', 'WARNING']
+    assert abs(archive.read(['timestamp'])['timestamp'][0] - time.time()) < 60
+    counts = archive.count_by('level', 'module', interval=60)
+    assert sorted((key[1:], count) for key, count in counts.items()) == [(('INFO', 'test_JFLogger'), 2),
+                                                                          (('WARNING', 'test_JFLogger'), 1)]
+    for i in range(2):
+        open(os.path.join(Log.log_dir, f'stale-{i}.jfcol'), 'wb').close()
+    Log.set_file_count_limit(1)
+    assert len(_wait_for_files(Log.log_dir, '.jfcol', 1)) == 1
+    assert len(_wait_for_files(Log.log_dir, '.log', 1)) == 1
+
+
+def test_backlog_compression_in_process_pool(tmp_path):
+    """测试积压压缩: 等待的轮转文件由进程池分组并行转换为列式归档, 并各自压缩为新的压缩包"""
+    import zipfile
+    Log = JFLogger('test_backlog', str(tmp_path), enableConsoleOutput=False)
+    Log.set_file_record_limit(1)
+    for i in range(5):
+        Log.info(f'backlog message {i}')
+    assert len([name for name in os.listdir(Log.log_dir) if name.endswith('.log')]) == 5
+    Log.set_enable_runtime_zip(True)
+    Log.set_enable_columnar_archive(True)
+    Log.set_backlog_compression(threshold=3, max_workers=2, niceness=1)
+    Log.info('trigger')
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if len([name for name in os.listdir(Log.log_dir) if name.endswith('.log')]) == 1:
+            break
+        time.sleep(0.05)
+    # Each worker deflates its part into an archive of its own, the archive of the logger is not rewritten
+    assert not os.path.exists(Log.zip_file_path)
+    backlog_archives = sorted(name for name in os.listdir(Log.log_dir) if name.endswith('.zip'))
+    zip_name = os.path.basename(Log.zip_file_path)[:-len('.zip')]
+    assert backlog_archives == [f'{zip_name}-1.zip', f'{zip_name}-2.zip']
+    sources, contents = [], []
+    for name in backlog_archives:
+        with zipfile.ZipFile(os.path.join(Log.log_dir, name)) as zipf:
+            assert zipf.testzip() is None
+            sources += [f'{os.path.join(Log.log_dir, name)}::{member}' for member in zipf.namelist()]
+            contents += [zipf.read(member).decode('utf-8') for member in zipf.namelist()]
+    assert [next(line for line in text.splitlines() if 'backlog message' in line)[-1] for text in contents] == list('01234')
+    assert [file for file, _, _ in Log.search('backlog message', max_workers=1)] == sources
+    archives = [name for name in os.listdir(Log.log_dir) if name.endswith('.jfcol')]
+    assert len(archives) == 5
+    assert JFLogColumnarArchive(os.path.join(Log.log_dir, sorted(archives)[0])).read(['message'])['message'] == ['backlog message 0']
+    with pytest.raises(ValueError):
+        Log.set_backlog_compression(max_workers=-1)
+
+
+def test_batched_signals_rate_capped():
+    """测试批量信号: 记录合并为列表按最大频率发送, 缓冲区满时丢弃最旧记录并计数"""
+    Log = JFLogger('test_batched_signal', enableConsoleOutput=False, log_level=LogLevel.INFO)
+    Log.set_message_format('%(message)s')
+    Log.set_signal_batching(max_rate=20, max_pending=50)
+    batches = []
+    slot_entered = threading.Event()
+    release_slot = threading.Event()
+
+    def slow_slot(records):
+        batches.append(records)
+        slot_entered.set()
+        release_slot.wait(5)
+
+    Log.signal_message_batch.connect(slow_slot)
+    Log.info('first')
+    assert slot_entered.wait(5)
+    start = time.perf_counter()
+    for i in range(100):
+        Log.info('burst', i)
+    # The slot is blocked, but the logging thread does not wait for it
+    assert time.perf_counter() - start < 1
+    release_slot.set()
+    sink = next(sink for sink in Log.sinks if sink.name == 'test_batched_signal.signal_message_batch')
+    deadline = time.monotonic() + 5
+    while sum(len(batch) for batch in batches) < 51 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert batches[0] == [(LogLevel.INFO, 'first')]
+    assert len(batches) == 2
+    assert sink.overflow_count == 50
+    assert batches[1][0] == (LogLevel.INFO, 'burst 50') and batches[1][-1] == (LogLevel.INFO, 'burst 99')
+    # Changing the rate while records are written does not lose any of them
+    batches.clear()
+    Log.signal_message_batch.disconnect(slow_slot)
+    Log.signal_message_batch.connect(batches.append)
+    sink.set_rate(1000, 100000)
+    writers = [threading.Thread(target=lambda: [sink.write(LogLevel.INFO, 'race') for _ in range(2000)]) for _ in range(4)]
+    for writer in writers:
+        writer.start()
+    for idx in range(200):
+        sink.set_rate(1000, 100000 + idx % 2)
+    for writer in writers:
+        writer.join()
+    sink.flush()
+    assert sum(len(batch) for batch in batches) == 8000
+
+
+def test_search_log_files_and_archives(tmp_path, monkeypatch, capsys):
+    """测试搜索日志文件和压缩包成员: 按模式, 级别和时间过滤, 并通过命令行输出"""
+    from DToolslib._JFLogger import _Log_Search
+    Log = JFLogger('test_search', str(tmp_path), enableConsoleOutput=False)
+    Log.set_file_record_limit(4)
+    Log.set_enable_runtime_zip(True)
+    for i in range(10):
+        if i % 3 == 0:
+            Log.error(f'needle {i}', 'multi\n[line]')
+        else:
+            Log.info(f'needle {i}')
+    Log.info('haystack')
+    _wait_for_files(Log.log_dir, '--Compressed.zip', 1)
+    deadline = time.monotonic() + 5
+    while len([name for name in os.listdir(Log.log_dir) if name.endswith('.log')]) > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    results = list(Log.search(r'needle \d', levels=['ERROR', 'CRITICAL'], max_workers=2))
+    assert [record.rsplit('\n', 2)[-2] for _, _, record in results] == [f'needle {i} multi' for i in (0, 3, 6, 9)]
+    assert all(record.endswith('[line]') for _, _, record in results)
+    assert ['::' in file for file, _, _ in results] == [True, True, True, False]
+    # The header of the file takes 5 lines, each record takes 4 lines and one more for the second message line
+    assert results[0][1] == 6 and results[1][1] == 6 + 5 + 4 + 4
+    # Small chunks split the records of the archive members
+    monkeypatch.setattr(_Log_Search, '_CHUNK_SIZE', 64)
+    assert list(Log.search(r'needle \d', levels='ERROR', max_workers=1)) == results
+    assert [record.rsplit('\n', 1)[-1] for _, _, record in Log.search('HAYSTACK', ignoreCase=True, max_workers=1)] == ['haystack']
+    assert list(Log.search('needle', since=time.time() + 60, max_workers=1)) == []
+    assert len(list(Log.search('', until=datetime.now(), max_workers=1))) == 11
+    assert _Log_Search.main([Log.log_dir, 'needle 9', '--level', 'error,critical', '--format', Log.message_format,
+                             '--workers', '1']) == 0
+    output = capsys.readouterr().out
+    assert output.startswith(f'{results[-1][0]}:{results[-1][1]}: ') and 'needle 9 multi' in output
+    assert _Log_Search.main([Log.log_dir, 'absent', '--workers', '1']) == 1